@@ -0,0 +1,82 @@
+#%% ----------------------------------------------------------------------------
+# Micro-benchmark: axisymmetric correction and cell center points
+#
+# Compares the former per-column / per-cell loops of
+# ModPathWell.axisym_correction and ModPathWell._assign_cellboundaries
+# with the (vectorized) implementation in sutra2.ModPath_Well,
+# for a refined axisymmetric grid. Both implementations return identical arrays.
+#
+# Usage: python research/benchmark_axisym_grid.py
+# ------------------------------------------------------------------------------
+
+import timeit
+import types
+
+import numpy as np
+
+from sutra2.ModPath_Well import ModPathWell
+
+# Grid dimensions (refined axisymmetric grid)
+nlay, nrow, ncol = 400, 2, 5000
+# Number of repetitions per timing
+number = 20
+
+def axisym_correction_loop(self, grid, dtype = None, theta = 2 * np.pi):
+    ''' Former implementation of ModPathWell.axisym_correction (loop over columns). '''
+    if dtype is None:
+        dtype = grid.dtype
+    grid_axi = np.zeros((self.nlay,self.nrow,self.ncol), dtype = dtype)
+    if (self.nrow == 1) | (self.nrow == 2):
+        for iCol in range(self.ncol):
+            grid_axi[:,:,iCol] = theta * self.xmid[iCol] * grid[:,:,iCol]
+    return grid_axi
+
+def center_points_loop(bound_list, cell_sizes, ascending = True):
+    ''' Former calculation of center points in ModPathWell._assign_cellboundaries. '''
+    len_arr = len(cell_sizes)
+    center_points = np.empty((len_arr), dtype= 'float')
+    if ascending:
+        center_points[0] = bound_list[0] + cell_sizes[0] * 0.5
+        for idx in range(1, len_arr):
+            center_points[idx] = center_points[(idx - 1)] + ((cell_sizes[(idx)] + cell_sizes[(idx - 1)]) * 0.5)
+    else:
+        center_points[0] = bound_list[0] - cell_sizes[0] * 0.5
+        for idx in range(1, len_arr):
+            center_points[idx] = center_points[(idx - 1)] - ((cell_sizes[(idx)] + cell_sizes[(idx - 1)]) * 0.5)
+    return center_points
+
+# Schematisation with a single refined block (columns and layers)
+schematisation = {"geo_parameters": {"layer1": {"xmin": 0.1, "xmax": 2500., "ncols": ncol,
+                                                "top": 0., "bot": -100., "nlayers": nlay}}}
+
+# Minimal ModPathWell object with the grid attributes used by both methods
+well = types.SimpleNamespace(schematisation_dict = schematisation, nlay = nlay, nrow = nrow, ncol = ncol)
+assign_cellboundaries = lambda ascending: ModPathWell._assign_cellboundaries(well, schematisation,
+                                                    dict_keys = ["geo_parameters"],
+                                                    bound_min = "xmin" if ascending else "bot",
+                                                    bound_max = "xmax" if ascending else "top",
+                                                    n_refinement = "ncols" if ascending else "nlayers",
+                                                    ascending = ascending)
+_, well.delr, well.xmid, col_bounds = assign_cellboundaries(ascending = True)
+_, delv, zmid, lay_bounds = assign_cellboundaries(ascending = False)
+
+grid = np.random.default_rng(0).uniform(1., 50., (nlay,nrow,ncol))
+
+# Check: identical arrays
+assert np.array_equal(well.xmid, center_points_loop(col_bounds, well.delr, ascending = True))
+assert np.array_equal(zmid, center_points_loop(lay_bounds, delv, ascending = False))
+assert np.array_equal(ModPathWell.axisym_correction(well, grid = grid), axisym_correction_loop(well, grid = grid))
+
+timings = {
+    "axisym_correction (loop)": lambda: axisym_correction_loop(well, grid = grid),
+    "axisym_correction (vectorized)": lambda: ModPathWell.axisym_correction(well, grid = grid),
+    "center points (loop)": lambda: center_points_loop(col_bounds, well.delr, ascending = True),
+    "center points (cumsum)": lambda: np.cumsum(np.concatenate([col_bounds[:1] + well.delr[:1] * 0.5,
+                                                                (well.delr[1:] + well.delr[:-1]) * 0.5])),
+    "_assign_cellboundaries (columns)": lambda: assign_cellboundaries(ascending = True),
+}
+
+print(f"Grid (nlay,nrow,ncol) = {(nlay,nrow,ncol)}, best of 5 x {number} runs")
+for iName, iFunc in timings.items():
+    best = min(timeit.repeat(iFunc, number = number, repeat = 5)) / number
+    print(f"{iName:<36s} {best * 1000.:10.3f} ms")
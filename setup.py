@@ -33,6 +33,10 @@ setup(
     install_requires=[
         'pandas>=0.23',
         ],
+    extras_require={
+        # binary export of df_flowline/df_particle and the cache of model runs
+        'arrow': ['pyarrow>=1'],
+        },
     include_package_data=True,
     url='https://github.com/KWR-Water/sutra2',
     download_url = 'https://github.com/KWR-Water/sutra2/archive/refs/tags/v_01.tar.gz', 
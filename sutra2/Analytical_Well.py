@@ -28,9 +28,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import os
+import sys
 from pandas import read_csv
 from pandas import read_excel
 import math
+import inspect
+import copy
+from collections import OrderedDict
 from scipy.special import kn as besselk
 import datetime as dt
 from datetime import timedelta
@@ -39,6 +43,207 @@ import warnings
 
 path = os.getcwd()  # path of working directory
 
+# Least recently used cache of calculated (hydrological) quantities of the analytical
+# well functions, keyed on the schematisation snapshot, see _memoize_attributes.
+# The entries hold the travel times, heads, distances and fractions (arrays of
+# nr_flowlines values, about 8 kB per calculation for the default 105 flowlines),
+# not the dataframes: df_flowline and df_particle are created on each call.
+_analytical_cache = OrderedDict()
+# Total size of the arrays in the cache [bytes]
+_analytical_cache_nbytes = 0
+# Maximum size of the arrays in the cache [bytes]: least recently used calculations are removed
+analytical_cache_max_bytes = 2**25
+
+def _freeze(value):
+    ''' Return a hashable (immutable) version of 'value', e.g. to use in the keys of the analytical cache. '''
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted(((_freeze(iKey), _freeze(iValue)) for iKey, iValue in value.items()), key = repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(iValue) for iValue in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(iValue) for iValue in value)
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        # nan != nan: use a fixed value
+        return ('float', 'nan')
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+def _nbytes(value, seen = None):
+    ''' Return the (approximate) size of 'value' (arrays, numbers, and dicts, lists
+    or tuples of these) [bytes], counting objects occurring more than once only once. '''
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum([_nbytes(iValue, seen) for iValue in value.values()])
+    if isinstance(value, (list, tuple)):
+        return sum([_nbytes(iValue, seen) for iValue in value])
+    return sys.getsizeof(value)
+
+def _memoize_attributes(key, attributes, compute):
+    '''
+    Run the calculation 'compute' or, if 'key' is in the (least recently used) analytical
+    cache, restore the attributes set by the calculation and its return value from the cache.
+    Warnings issued by the calculation are stored as well and issued again when the
+    calculation is restored from the cache.
+
+    Parameters
+    ----------
+    key: tuple
+        Hashable key of the calculation, (name, schematisation snapshot, arguments).
+    attributes: list
+        (object, list of attribute names) for the attributes set by the calculation.
+    compute: function
+        The calculation (without arguments), returning arrays (e.g. a dict of arrays).
+
+    Returns
+    -------
+    The return value of 'compute'.
+    '''
+    global _analytical_cache_nbytes
+
+    if key in _analytical_cache:
+        _analytical_cache.move_to_end(key)
+        values, result, caught, _ = _analytical_cache[key]
+        values, result = copy.deepcopy((values, result))
+        for iMessage, iCategory, iFilename, iLineno in caught:
+            warnings.warn_explicit(iMessage, iCategory, iFilename, iLineno)
+        for (obj, _), obj_values in zip(attributes, values):
+            obj.__dict__.update(obj_values)
+        return result
+
+    with warnings.catch_warnings(record = True) as caught_warnings:
+        warnings.simplefilter("always")
+        result = compute()
+    caught = [(str(iWarning.message), iWarning.category, iWarning.filename, iWarning.lineno) \
+                for iWarning in caught_warnings]
+    for iMessage, iCategory, iFilename, iLineno in caught:
+        warnings.warn_explicit(iMessage, iCategory, iFilename, iLineno)
+
+    values = [{name: obj.__dict__[name] for name in names if name in obj.__dict__} for obj, names in attributes]
+    values, result_copy = copy.deepcopy((values, result))
+    nbytes = _nbytes((values, result_copy))
+    if nbytes <= analytical_cache_max_bytes:
+        _analytical_cache[key] = (values, result_copy, caught, nbytes)
+        _analytical_cache_nbytes += nbytes
+    while _analytical_cache_nbytes > analytical_cache_max_bytes:
+        _, (_, _, _, iNbytes) = _analytical_cache.popitem(last = False)
+        _analytical_cache_nbytes -= iNbytes
+
+    return result
+
+def clear_analytical_cache():
+    ''' Remove all calculations from the analytical cache. '''
+    global _analytical_cache_nbytes
+    _analytical_cache.clear()
+    _analytical_cache_nbytes = 0
+
+#%% ----------------------------------------------------------------------------
+# Analytical well functions, used by AnalyticalWell (one well) and AnalyticalWellBatch
+# (parameters as (nr_wells, 1) arrays, results as (nr_wells, nr_flowlines) arrays)
+# ------------------------------------------------------------------------------
+
+def _fraction_flux_array():
+    ''' Return the fraction of the flux of the pumping well for each (diffuse source) flowline, [-]. '''
+    # ah_todo change this to single array of 0.001 to 100
+    # right now we have this set up to directly compare with P. Stuyfzand's results
+    fraction_flux = np.array([0.00001, 0.0001, 0.001, 0.005])
+    fraction_flux = np.append(fraction_flux, np.arange(0.01, 1, 0.01))
+    return np.append(fraction_flux, [0.995, 0.9999])
+
+def _radial_distance_array(fraction_flux, radial_distance_recharge, spreading_distance, schematisation_type):
+    ''' Return the radial distance [m] of each flowline in 'fraction_flux', for the semiconfined
+    case extended with three distances up to 3 times the spreading distance. '''
+    radial_distance = radial_distance_recharge * np.sqrt(fraction_flux)
+
+    if schematisation_type == 'semiconfined':
+        last_distance = radial_distance[..., -1:]
+        model_radius = spreading_distance * 3
+        radial_distance = np.concatenate([radial_distance,
+                                          last_distance + (model_radius - last_distance) / 3,
+                                          last_distance + 2 * (model_radius - last_distance) / 3,
+                                          np.broadcast_to(model_radius, last_distance.shape)], axis = -1)
+    return radial_distance
+
+def _hydraulic_head_phreatic(distance, groundwater_level, well_discharge, KD, radial_distance_recharge):
+    ''' Hydraulic head [mASL] at 'distance' [m] from the well for the phreatic case. '''
+    return (groundwater_level + (well_discharge
+                / (2 * math.pi * KD))
+                * np.log(radial_distance_recharge / distance))
+
+def _hydraulic_head_semiconfined(distance, groundwater_level, well_discharge, KD, spreading_distance):
+    ''' Hydraulic head [mASL] at 'distance' [m] from the well for the semiconfined case. '''
+    return (well_discharge / (2 * math.pi * KD)
+            * besselk(0, distance / spreading_distance)
+            + groundwater_level)
+
+def _travel_time_unsaturated(travel_distance, thickness_full_capillary_fringe,
+                            moisture_content_vadose_zone, porosity_vadose_zone, recharge_rate):
+    ''' Travel time [days] in the unsaturated zone (Equation A.11 in TRANSATOMIC report),
+    'travel_distance' [m] is the travel distance above the full capillary fringe. '''
+    return (((travel_distance)
+            * moisture_content_vadose_zone
+            + thickness_full_capillary_fringe
+            * porosity_vadose_zone)
+        / recharge_rate)
+
+def _travel_time_shallow_aquifer_phreatic(travel_distance, porosity_shallow_aquifer, recharge_rate):
+    ''' Travel time [days] over 'travel_distance' [m] in the shallow aquifer for the phreatic case. '''
+    return ((travel_distance)
+            * porosity_shallow_aquifer / recharge_rate)
+
+def _travel_time_target_aquifer_phreatic(fraction_flux, porosity_target_aquifer, thickness_target_aquifer,
+                                        recharge_rate):
+    ''' Travel time [days] in the target aquifer of the flowlines in 'fraction_flux' for the phreatic case. '''
+    return (porosity_target_aquifer * thickness_target_aquifer
+            / recharge_rate
+            * np.log(1 / (1 - fraction_flux)))
+
+def _travel_time_aquitard_semiconfined(distance, travel_distance, porosity_shallow_aquifer, KD,
+                                      vertical_resistance_shallow_aquifer, well_discharge):
+    ''' Travel time [days] over 'travel_distance' [m] in the shallow aquifer (aquitard) at 'distance' [m]
+    from the well for the semiconfined case, Peters (1985) solution (Equation A.12 in TRANSATOMIC report). '''
+    return (porosity_shallow_aquifer
+            * (2 * math.pi * KD * vertical_resistance_shallow_aquifer
+            / (abs(well_discharge))
+            * (travel_distance
+            / besselk(0, distance
+            / np.sqrt(KD * vertical_resistance_shallow_aquifer)))
+        ))
+
+def _travel_time_target_aquifer_semiconfined(distance, spreading_distance, porosity_target_aquifer,
+                                            thickness_target_aquifer, well_discharge):
+    ''' Travel time [days] in the target aquifer at 'distance' [m] from the well for the semiconfined case,
+    Peters (1985) solution (Equation A.13/A.14 in TRANSATOMIC report), negative values set to 0. '''
+    travel_time_target_aquifer = (2 * math.pi * spreading_distance ** 2 / (abs(well_discharge))
+                        * porosity_target_aquifer * thickness_target_aquifer
+                        * (1.0872 * (distance / spreading_distance) ** 3
+                            - 1.7689 * (distance /
+                                        spreading_distance) ** 2
+                            + 1.5842 * (distance / spreading_distance) - 0.2544)
+                        )
+    travel_time_target_aquifer[travel_time_target_aquifer < 0] = 0
+    return travel_time_target_aquifer
+
+def _flux_fraction_semiconfined(distance, spreading_distance):
+    ''' Fraction of the pumping well flux [-] at 'distance' [m] from the well for the semiconfined case. '''
+    return (distance / spreading_distance
+            * besselk(1, distance / spreading_distance))
+
+
 
 # #@MartinK - this is how I found online to check that the exception/error messages
 # # are correct. Is this needed or it there a better/another way to check this?
@@ -184,6 +389,17 @@ class HydroChemicalSchematisation:
         minimum_travel_time_h20_target_aquifer: float d
 
     """
+
+    # Attributes calculated by '_calculate_travel_time_unsaturated_zone' (and '_create_radial_distance_array')
+    _calculated_attributes = ['spreading_distance', 'radial_distance_recharge', 'fraction_flux',
+                            'radial_distance', 'travel_time_unsaturated', 'thickness_vadose_zone_drawdown',
+                            'head', 'drawdown_at_well']
+    # Attributes created by 'make_dictionary'
+    _dictionary_attributes = ['simulation_parameters', 'endpoint_id', 'mesh_refinement', 'geo_parameters',
+                            'ibound_parameters', 'recharge_parameters', 'concentration_boundary_parameters',
+                            'well_parameters', 'point_parameters', 'substance_parameters', 'bas_parameters',
+                            'model_radius_computed']
+
     # initialize non-defaults to None to start.
     def __init__(self,
                 schematisation_type,  
@@ -908,32 +1124,28 @@ class HydroChemicalSchematisation:
         # self.substance_parameters = substance_parameters
         self.bas_parameters = bas_parameters
 
+    def snapshot(self):
+        ''' Return an immutable, hashable snapshot of the parameters of the schematisation:
+        a sorted tuple of (name, value) of all attributes, except the calculated attributes and
+        the dictionaries of 'make_dictionary'. Used as key of the analytical cache. '''
+        excluded = set(self._calculated_attributes + self._dictionary_attributes)
+        return tuple(sorted((name, _freeze(value)) for name, value in self.__dict__.items()
+                            if name not in excluded and not name.startswith('_')))
+
     # Here are functions to calculate the travel time through vadose zone, shared functions for
     # Analytical and Modflow models
     def _create_radial_distance_array(self):
 
         ''' Create array of radial distances from the well to a maximum value, radial distance recharge, which
         is the distance from the well needed to recharge the well to meet the pumping demand. '''
-        # ah_todo change this to single array of 0.001 to 100
-        # right now we have this set up to directly compare with P. Stuyfzand's results
         # in the 'final' version of the model can be a more fine mesh
         # but need to think about how we change the testing
-        fraction_flux = np.array([0.00001, 0.0001, 0.001, 0.005])
-        fraction_flux = np.append(fraction_flux, np.arange(0.01, 1, 0.01))
-        self.fraction_flux = np.append(fraction_flux, [0.995, 0.9999])
+        self.fraction_flux = _fraction_flux_array()
 
-        radial_distance = self.radial_distance_recharge * \
-            np.sqrt(self.fraction_flux)
-
-        if self.schematisation_type == 'semiconfined':
-
-            radial_distance = np.append(radial_distance,
-                                    [(radial_distance[-1] + ((self.spreading_distance * 3) - radial_distance[-1]) / 3),
-                                    (radial_distance[-1] + 2 *
-                                    ((self.spreading_distance * 3) - radial_distance[-1]) / 3),
-                                        (self.spreading_distance * 3)])
-
-        self.radial_distance = radial_distance
+        self.radial_distance = _radial_distance_array(fraction_flux = self.fraction_flux,
+                                                      radial_distance_recharge = self.radial_distance_recharge,
+                                                      spreading_distance = self.spreading_distance,
+                                                      schematisation_type = self.schematisation_type)
 
     def _calculate_hydraulic_head_phreatic(self, distance):
         ''' Calcualtes the hydraulic head distribution for the phreatic schematisation case
@@ -950,9 +1162,11 @@ class HydroChemicalSchematisation:
             Hydraulic head for each point in the given distance array, [mASL].
         '''
         ##@Alex: check if this function works properly if a negative well_discharge is given)
-        head = (self.groundwater_level + (self.well_discharge
-                    / (2 * math.pi * self.KD))
-                    * np.log(self.radial_distance_recharge / distance))
+        head = _hydraulic_head_phreatic(distance = distance,
+                                        groundwater_level = self.groundwater_level,
+                                        well_discharge = self.well_discharge,
+                                        KD = self.KD,
+                                        radial_distance_recharge = self.radial_distance_recharge)
         return head
 
 
@@ -994,24 +1208,24 @@ class HydroChemicalSchematisation:
             thickness_vadose_zone_drawdown = (self.groundwater_level
                                                 + self.thickness_vadose_zone_at_boundary) - head
 
-            travel_time_unsaturated = (((thickness_vadose_zone_drawdown
-                                    - self.thickness_full_capillary_fringe)
-                                    * self.moisture_content_vadose_zone
-                                    + self.thickness_full_capillary_fringe
-                                    * self.porosity_vadose_zone)
-                                / self.recharge_rate)
+            travel_time_unsaturated = _travel_time_unsaturated(travel_distance = thickness_vadose_zone_drawdown
+                                                                    - self.thickness_full_capillary_fringe,
+                                                                thickness_full_capillary_fringe = self.thickness_full_capillary_fringe,
+                                                                moisture_content_vadose_zone = self.moisture_content_vadose_zone,
+                                                                porosity_vadose_zone = self.porosity_vadose_zone,
+                                                                recharge_rate = self.recharge_rate)
 
         elif depth_point_contamination >= head:
             thickness_vadose_zone_drawdown = depth_point_contamination - head
             if thickness_vadose_zone_drawdown < 0:
                 travel_time_unsaturated =  np.array([0])
             else:
-                travel_time_unsaturated = (((thickness_vadose_zone_drawdown
-                                    - self.thickness_full_capillary_fringe)
-                                    * self.moisture_content_vadose_zone
-                                    + self.thickness_full_capillary_fringe
-                                    * self.porosity_vadose_zone)
-                                / self.recharge_rate)
+                travel_time_unsaturated = _travel_time_unsaturated(travel_distance = thickness_vadose_zone_drawdown
+                                                                        - self.thickness_full_capillary_fringe,
+                                                                    thickness_full_capillary_fringe = self.thickness_full_capillary_fringe,
+                                                                    moisture_content_vadose_zone = self.moisture_content_vadose_zone,
+                                                                    porosity_vadose_zone = self.porosity_vadose_zone,
+                                                                    recharge_rate = self.recharge_rate)
         else:
             travel_time_unsaturated = np.array([0])
             thickness_vadose_zone_drawdown = 0 #AH_todo possibly replace this with the travel distance, not thickness_vadose because this is a stand in for the travel distance?
@@ -1101,11 +1315,11 @@ class HydroChemicalSchematisation:
                 #if point contamination at depth, assign ground surface to depth
                 travel_distance =  depth_point_contamination - self.groundwater_level - self.thickness_full_capillary_fringe
 
-            travel_time_unsaturated =(((travel_distance)
-                                        * self.moisture_content_vadose_zone
-                                        + self.thickness_full_capillary_fringe
-                                        * self.porosity_vadose_zone)
-                                    / self.recharge_rate)
+            travel_time_unsaturated = _travel_time_unsaturated(travel_distance = travel_distance,
+                                                            thickness_full_capillary_fringe = self.thickness_full_capillary_fringe,
+                                                            moisture_content_vadose_zone = self.moisture_content_vadose_zone,
+                                                            porosity_vadose_zone = self.porosity_vadose_zone,
+                                                            recharge_rate = self.recharge_rate)
 
             if travel_distance < 0:
                 travel_time_unsaturated = 0
@@ -1184,6 +1398,14 @@ class AnalyticalWell():
         Column 'solid_density': float
     """
 
+    # Attributes (arrays) calculated by the hydrology of 'phreatic' and 'semiconfined',
+    # stored in the analytical cache (df_output, df_flowline and df_particle are created on each call)
+    _calculated_attributes = ['radial_distance', 'spreading_distance', 'travel_time_unsaturated', 'head',
+                            'travel_time_shallow_aquifer', 'travel_time_target_aquifer', 'total_travel_time',
+                            'flux_fraction', 'cumulative_fraction_abstracted_water']
+    # Attributes calculated by the point source functions
+    _point_source_attributes = ['travel_time_shallow_aquifer', 'travel_time_target_aquifer', 'head']
+
     def __init__(self, schematisation: HydroChemicalSchematisation): #change schematisation_instance to schematisation
         '''
         Initialize the AnalyticalWell object by making the dictionaries and adding the schematisation (and therefore attributes
@@ -1225,8 +1447,9 @@ class AnalyticalWell():
         #MK: this is a complex if statement. please elaborate on what is happening in a comment
         if depth_point_contamination is None:
             travel_distance_shallow_aquifer = self.schematisation.thickness_shallow_aquifer - (self.schematisation.groundwater_level - head)
-            travel_time_shallow_aquifer = ((travel_distance_shallow_aquifer)
-                            * self.schematisation.porosity_shallow_aquifer / self.schematisation.recharge_rate)
+            travel_time_shallow_aquifer = _travel_time_shallow_aquifer_phreatic(travel_distance = travel_distance_shallow_aquifer,
+                                                                                porosity_shallow_aquifer = self.schematisation.porosity_shallow_aquifer,
+                                                                                recharge_rate = self.schematisation.recharge_rate)
             
             #@MartinvdS -> under the default conditions, the travel time in the shallow aquifer is negative
             # should we alter the default values or do we do below?
@@ -1239,12 +1462,14 @@ class AnalyticalWell():
                 if travel_distance_shallow_aquifer < 0:
                     travel_time_shallow_aquifer = np.array([0])
                 else:
-                    travel_time_shallow_aquifer = np.array([(travel_distance_shallow_aquifer
-                            * self.schematisation.porosity_shallow_aquifer / self.schematisation.recharge_rate)])
+                    travel_time_shallow_aquifer = np.array([_travel_time_shallow_aquifer_phreatic(travel_distance = travel_distance_shallow_aquifer,
+                                                                                porosity_shallow_aquifer = self.schematisation.porosity_shallow_aquifer,
+                                                                                recharge_rate = self.schematisation.recharge_rate)])
             else:
                 travel_distance_shallow_aquifer = self.schematisation.thickness_shallow_aquifer - (self.schematisation.groundwater_level - head)
-                travel_time_shallow_aquifer = ((travel_distance_shallow_aquifer)
-                            * self.schematisation.porosity_shallow_aquifer / self.schematisation.recharge_rate)
+                travel_time_shallow_aquifer = _travel_time_shallow_aquifer_phreatic(travel_distance = travel_distance_shallow_aquifer,
+                                                                                porosity_shallow_aquifer = self.schematisation.porosity_shallow_aquifer,
+                                                                                recharge_rate = self.schematisation.recharge_rate)
 
         return travel_time_shallow_aquifer
 
@@ -1286,9 +1511,10 @@ class AnalyticalWell():
 
         elif distance is None:
             ''' diffuse calculation or regular TTD'''
-            travel_time_target_aquifer = (self.schematisation.porosity_target_aquifer * self.schematisation.thickness_target_aquifer
-                                / self.schematisation.recharge_rate
-                                * np.log(1 / (1 -fraction_flux)))
+            travel_time_target_aquifer = _travel_time_target_aquifer_phreatic(fraction_flux = fraction_flux,
+                                                porosity_target_aquifer = self.schematisation.porosity_target_aquifer,
+                                                thickness_target_aquifer = self.schematisation.thickness_target_aquifer,
+                                                recharge_rate = self.schematisation.recharge_rate)
         else:
             raise ValueError('Eiter fractin flux or distance should be None')
 
@@ -1328,13 +1554,12 @@ class AnalyticalWell():
         else:
             travel_distance_shallow_aquifer  = depth_point_contamination - self.schematisation.bottom_shallow_aquifer
 
-        self.travel_time_shallow_aquifer = (self.schematisation.porosity_shallow_aquifer
-                                            * (2 * math.pi * self.schematisation.KD * self.schematisation.vertical_resistance_shallow_aquifer
-                                            / (abs(self.schematisation.well_discharge))
-                                            * (travel_distance_shallow_aquifer
-                                            / besselk(0, distance
-                                            / math.sqrt(self.schematisation.KD * self.schematisation.vertical_resistance_shallow_aquifer)))
-                            ))
+        self.travel_time_shallow_aquifer = _travel_time_aquitard_semiconfined(distance = distance,
+                                            travel_distance = travel_distance_shallow_aquifer,
+                                            porosity_shallow_aquifer = self.schematisation.porosity_shallow_aquifer,
+                                            KD = self.schematisation.KD,
+                                            vertical_resistance_shallow_aquifer = self.schematisation.vertical_resistance_shallow_aquifer,
+                                            well_discharge = self.schematisation.well_discharge)
         if travel_distance_shallow_aquifer < 0:
             self.travel_time_shallow_aquifer =  np.array([0])
 
@@ -1364,14 +1589,11 @@ class AnalyticalWell():
         porosity_target_aquifer=self.schematisation.porosity_target_aquifer #0.32 #
         thickness_target_aquifer=self.schematisation.thickness_target_aquifer #95 #
 
-        self.travel_time_target_aquifer = (2 * math.pi * self.spreading_distance ** 2 / (abs(self.schematisation.well_discharge))
-                            * porosity_target_aquifer * thickness_target_aquifer
-                            * (1.0872 * (distance / self.spreading_distance) ** 3
-                                - 1.7689 * (distance /
-                                            self.spreading_distance) ** 2
-                                + 1.5842 * (distance / self.spreading_distance) - 0.2544)
-                            )
-        self.travel_time_target_aquifer[self.travel_time_target_aquifer < 0] = 0
+        self.travel_time_target_aquifer = _travel_time_target_aquifer_semiconfined(distance = distance,
+                                            spreading_distance = self.spreading_distance,
+                                            porosity_target_aquifer = porosity_target_aquifer,
+                                            thickness_target_aquifer = thickness_target_aquifer,
+                                            well_discharge = self.schematisation.well_discharge)
 
         return self.travel_time_target_aquifer
 
@@ -1395,9 +1617,11 @@ class AnalyticalWell():
 
         '''
 
-        self.head = (self.schematisation.well_discharge / (2 * math.pi * self.schematisation.KD)
-                * besselk(0, distance / self.schematisation.spreading_distance)
-                + self.schematisation.groundwater_level)
+        self.head = _hydraulic_head_semiconfined(distance = distance,
+                                                groundwater_level = self.schematisation.groundwater_level,
+                                                well_discharge = self.schematisation.well_discharge,
+                                                KD = self.schematisation.KD,
+                                                spreading_distance = self.schematisation.spreading_distance)
 
         return self.head
 
@@ -1422,8 +1646,8 @@ class AnalyticalWell():
             Fraction of the pumping well flux at point in the 'radial_distance' array, [-].
         '''
 
-        flux_fraction = (radial_distance / spreading_distance
-                        * besselk(1, radial_distance / spreading_distance))
+        flux_fraction = _flux_fraction_semiconfined(distance = radial_distance,
+                                                    spreading_distance = spreading_distance)
 
         return flux_fraction
 
@@ -1515,6 +1739,124 @@ class AnalyticalWell():
 
         return df_output
 
+    def _fill_df_particle(self,
+                        nr_flowlines,
+                        distance,
+                        travel_distance_vadose,
+                        travel_distance_shallow,
+                        travel_distance_target,
+                        travel_time_unsaturated,
+                        travel_time_shallow_aquifer,
+                        travel_time_target_aquifer,
+                        total_travel_time):
+        '''Fill the df_particle for all flowlines at once. Each flowline consists
+        of four records, one per zone: 'surface', 'vadose_zone', 'shallow_aquifer'
+        and 'target_aquifer'. The table is built column by column from numpy arrays
+        of shape (nr_flowlines, 4), which are flattened row-wise (flowline by flowline).
+
+        Parameters
+        ----------
+        nr_flowlines: int
+            Number of flowlines (= length of df_output).
+        distance: array
+            Array of distance(s) [m] from the well.
+            For diffuse sources 'distance' is the 'radial_distance' array.
+            For point sources 'distance' is 'distance_point_contamination_from_well'.
+        travel_distance_vadose: array
+            Travel distance in the vadose zone for each point in the distance array, [m].
+        travel_distance_shallow: array
+            Travel distance in the shallow aquifer for each point in the distance array, [m].
+        travel_distance_target: array
+            Travel distance in the target aquifer for each point in the distance array, [m].
+        travel_time_unsaturated: array
+            Travel time in the unsaturated zone for each point in the given distance array returned as
+            attrubute of the function, [days].
+        travel_time_shallow_aquifer: array
+            Travel time in the shallow aquifer for each point in the given distance array, [days].
+        travel_time_target_aquifer: array
+            Travel time in the target aquifer for each point in the given distance array, [days].
+        total_travel_time: array
+            Sum of the unsaturated, shallow and target aquifer travel times for each
+            point in the given distance array, [days].
+
+        Returns
+        -------
+        df_particle: pandas.DataFrame
+            Indexed by 'flowline_id', see '_export_to_df' for the columns.
+        '''
+
+        def per_flowline(values):
+            # first 'nr_flowlines' values as float array
+            return np.asarray(values, dtype = 'float').ravel()[:nr_flowlines]
+
+        def per_zone(vadose_zone, shallow_aquifer, target_aquifer, dtype = 'float'):
+            # value of each of the four zones ('surface' equals 'vadose_zone'), repeated per flowline
+            return np.tile(np.array([vadose_zone, vadose_zone, shallow_aquifer, target_aquifer],
+                                    dtype = dtype), nr_flowlines)
+
+        distance = per_flowline(distance)
+        travel_time_unsaturated = per_flowline(travel_time_unsaturated)
+        travel_time_shallow_aquifer = per_flowline(travel_time_shallow_aquifer)
+        travel_time_target_aquifer = per_flowline(travel_time_target_aquifer)
+        zeros = np.zeros(nr_flowlines, dtype = 'float')
+
+        # (nr_flowlines, 4) arrays, flattened to one record per flowline and zone
+        travel_time = np.column_stack([zeros,
+                                       travel_time_unsaturated,
+                                       travel_time_shallow_aquifer,
+                                       travel_time_target_aquifer]).ravel()
+        cumulative_travel_time = np.column_stack([zeros,
+                                       travel_time_unsaturated,
+                                       travel_time_unsaturated + travel_time_shallow_aquifer,
+                                       per_flowline(total_travel_time)]).ravel()
+        xcoord = np.column_stack([distance, distance, distance,
+                                  np.full(nr_flowlines, self.schematisation.diameter_borehole/2)]).ravel() # target aquifer: at the well
+        travel_distance = np.column_stack([zeros,
+                                           per_flowline(travel_distance_vadose),
+                                           per_flowline(travel_distance_shallow),
+                                           per_flowline(travel_distance_target)]).ravel()
+
+        # redox conditions as string, missing values ('None') as empty string
+        redox = pd.Series([self.schematisation.redox_vadose_zone,
+                           self.schematisation.redox_vadose_zone,
+                           self.schematisation.redox_shallow_aquifer,
+                           self.schematisation.redox_target_aquifer], dtype = 'object').fillna('').astype(str).values
+
+        flowline_id = np.repeat(np.arange(1, nr_flowlines + 1), 4)
+
+        df_particle = pd.DataFrame({'flowline_id': flowline_id,
+                    'zone': np.tile(np.array(["surface", "vadose_zone", "shallow_aquifer", "target_aquifer"],
+                                             dtype = 'object'), nr_flowlines),
+                    'travel_time': travel_time,
+                    'total_travel_time': cumulative_travel_time,
+                    'xcoord': xcoord, #= radial_distcance,
+                    'ycoord': np.full(nr_flowlines * 4, self.schematisation.model_width, dtype = 'float'), #= the width of the cell .. default = 1 m
+                    'zcoord': np.tile(np.array([self.schematisation.ground_surface,
+                                                self.schematisation.bottom_vadose_zone_at_boundary, # @MartinvdS should this be the thickness_vadose_zone_drawdown??
+                                                self.schematisation.bottom_shallow_aquifer,
+                                                self.schematisation.bottom_target_aquifer], dtype = 'float'), nr_flowlines),
+                    'redox': np.tile(redox, nr_flowlines),
+                    'temp_water': np.full(nr_flowlines * 4, self.schematisation.temp_water, dtype = 'float'),
+                    'travel_distance': travel_distance,
+                    'porosity': per_zone(self.schematisation.porosity_vadose_zone,
+                                         self.schematisation.porosity_shallow_aquifer,
+                                         self.schematisation.porosity_target_aquifer),
+                    'dissolved_organic_carbon': per_zone(self.schematisation.dissolved_organic_carbon_vadose_zone,
+                                         self.schematisation.dissolved_organic_carbon_shallow_aquifer,
+                                         self.schematisation.dissolved_organic_carbon_target_aquifer),
+                    'pH': per_zone(self.schematisation.pH_vadose_zone,
+                                   self.schematisation.pH_shallow_aquifer,
+                                   self.schematisation.pH_target_aquifer),
+                    'fraction_organic_carbon': per_zone(self.schematisation.fraction_organic_carbon_vadose_zone,
+                                         self.schematisation.fraction_organic_carbon_shallow_aquifer,
+                                         self.schematisation.fraction_organic_carbon_target_aquifer),
+                    'solid_density': per_zone(self.schematisation.solid_density_vadose_zone,
+                                         self.schematisation.solid_density_shallow_aquifer,
+                                         self.schematisation.solid_density_target_aquifer),
+                    },
+                    index = flowline_id)
+
+        return df_particle
 
     def _export_to_df(self,
         df_output,
@@ -1616,149 +1958,15 @@ class AnalyticalWell():
             travel_distance_target =  self.schematisation.radial_distance #np.repeat(self.schematisation.thickness_target_aquifer,length_repeat_numpy)
 
         # Make df_particle
-        def fill_df_particle (df,
-                            distance,
-                            travel_distance_vadose,
-                            travel_distance_shallow,
-                            travel_distance_target,
-                            travel_time_unsaturated,
-                            travel_time_shallow_aquifer,
-                            travel_time_target_aquifer,
-                            total_travel_time):
-            '''Fill the df_particle by flowline_id
-
-            Parameters
-            ----------
-            df: pandas.dataframe
-                Holder for df_particle, filled by the flowline_id
-            distance: array
-                Array of distance(s) [m] from the well.
-                For diffuse sources 'distance' is the 'radial_distance' array.
-                For point sources 'distance' is 'distance_point_contamination_from_well'.
-            travel_time_unsaturated: array
-                Travel time in the unsaturated zone for each point in the given distance array returned as
-                attrubute of the function, [days].
-            travel_time_shallow_aquifer: array
-                Travel time in the shallow aquifer for each point in the given distance array, [days].
-            travel_time_target_aquifer: array
-                Travel time in the target aquifer for each point in the given distance array, [days].
-            total_travel_time: array
-                Sum of the unsaturated, shallow and target aquifer travel times for each
-                point in the given distance array, [days].
-
-            Returns
-            -------
-            df: pandas.dataframe
-                Holder for df_particle, filled by the flowline_id
-            '''
-
-            df.loc[0] = [flowline_id,
-                        "surface",
-                        0,
-                        0,
-                        distance,
-                        self.schematisation.model_width,
-                        self.schematisation.ground_surface,
-                        self.schematisation.redox_vadose_zone, # None
-                        self.schematisation.temp_water,
-                        0.,
-                        self.schematisation.porosity_vadose_zone,
-                        self.schematisation.dissolved_organic_carbon_vadose_zone,
-                        self.schematisation.pH_vadose_zone,
-                        self.schematisation.fraction_organic_carbon_vadose_zone,
-                        self.schematisation.solid_density_vadose_zone,
-                        ]
-
-            df.loc[1] = [flowline_id,
-                         "vadose_zone",
-                         travel_time_unsaturated,
-                         travel_time_unsaturated,
-                         distance,
-                         self.schematisation.model_width,
-                         self.schematisation.bottom_vadose_zone_at_boundary, # @MartinvdS should this be the thickness_vadose_zone_drawdown??
-                         self.schematisation.redox_vadose_zone,
-                         self.schematisation.temp_water,
-                         travel_distance_vadose,
-                        #  self.schematisation.thickness_vadose_zone_at_boundary,
-                         self.schematisation.porosity_vadose_zone,
-                         self.schematisation.dissolved_organic_carbon_vadose_zone,
-                         self.schematisation.pH_vadose_zone,
-                         self.schematisation.fraction_organic_carbon_vadose_zone,
-                         self.schematisation.solid_density_vadose_zone,
-                         ]
-
-            df.loc[2] = [flowline_id,
-                        "shallow_aquifer",
-                         travel_time_shallow_aquifer,
-                         travel_time_unsaturated + travel_time_shallow_aquifer,
-                         distance,
-                         self.schematisation.model_width,
-                         self.schematisation.bottom_shallow_aquifer,
-                         self.schematisation.redox_shallow_aquifer,
-                         self.schematisation.temp_water,
-                         travel_distance_shallow,
-                        #  self.schematisation.thickness_shallow_aquifer, # @MartinvdS does this need to account for the vadose zone drawdown?
-                         self.schematisation.porosity_shallow_aquifer,
-                         self.schematisation.dissolved_organic_carbon_shallow_aquifer,
-                         self.schematisation.pH_shallow_aquifer,
-                         self.schematisation.fraction_organic_carbon_shallow_aquifer,
-                         self.schematisation.solid_density_shallow_aquifer,
-                         ]
-
-            df.loc[3] = [flowline_id,
-                        "target_aquifer",
-                         travel_time_target_aquifer,
-                         total_travel_time,
-                         self.schematisation.diameter_borehole/2, #at the well
-                         self.schematisation.model_width,
-                         self.schematisation.bottom_target_aquifer,
-                         self.schematisation.redox_target_aquifer,
-                         self.schematisation.temp_water,
-                         travel_distance_target,
-                        #  self.schematisation.thickness_target_aquifer,
-                         self.schematisation.porosity_target_aquifer,
-                         self.schematisation.dissolved_organic_carbon_target_aquifer,
-                         self.schematisation.pH_target_aquifer,
-                         self.schematisation.fraction_organic_carbon_target_aquifer,
-                         self.schematisation.solid_density_target_aquifer,
-                         ]
-
-            return df
-
-        df_particle = pd.DataFrame(columns=['flowline_id',
-                                                'zone',
-                                                'travel_time',
-                                                'total_travel_time',
-                                                 'xcoord', #= radial_distcance,
-                                                 'ycoord', #= the width of the cell .. default = 1 m
-                                                 'zcoord',
-                                                 'redox',
-                                                 'temp_water',
-                                                 'travel_distance',
-                                                 'porosity',
-                                                 'dissolved_organic_carbon',
-                                                 'pH',
-                                                 'fraction_organic_carbon',
-                                                 'solid_density'])
-
-        df = df_particle.copy()
-
-        for i in range(len(df_output)):
-            flowline_id = i+1
-            df = fill_df_particle (df= df,
-                                distance = distance[i],
-                                travel_distance_vadose=travel_distance_vadose[i],
-                                travel_distance_shallow=travel_distance_shallow[i],
-                                travel_distance_target=travel_distance_target[i],
-                                travel_time_unsaturated = travel_time_unsaturated[i],
-                                travel_time_shallow_aquifer=travel_time_shallow_aquifer[i],
-                                travel_time_target_aquifer = travel_time_target_aquifer[i],
-                                total_travel_time= total_travel_time[i])
-
-            df_particle = df_particle.append(df, ignore_index=True)
-            df_particle.loc[:,'redox'] = df_particle.loc[:,'redox'].fillna('').astype(str)
-            df_particle.loc[:,'flowline_id'] = df_particle.loc[:,'flowline_id'].astype(int)
-            
+        df_particle = self._fill_df_particle(nr_flowlines = len(df_output),
+                            distance = distance,
+                            travel_distance_vadose = travel_distance_vadose,
+                            travel_distance_shallow = travel_distance_shallow,
+                            travel_distance_target = travel_distance_target,
+                            travel_time_unsaturated = travel_time_unsaturated,
+                            travel_time_shallow_aquifer = travel_time_shallow_aquifer,
+                            travel_time_target_aquifer = travel_time_target_aquifer,
+                            total_travel_time = total_travel_time)
 
         # Make df_flowline
         df_flowline = pd.DataFrame(columns=['flowline_id',
@@ -1814,13 +2022,44 @@ class AnalyticalWell():
             # df_flowline['vani_clayseal'] = self.schematisation.vani_clayseal
             # df_flowline['dz_well'] = self.schematisation.dz_well
 
-        # change df_particle index to 'flowline_id'
-        df_particle.index = df_particle.loc[:,"flowline_id"].values
         # change df_flowline index to 'flowline_id'
         df_flowline.index = df_flowline.loc[:,"flowline_id"].values
         
         return df_flowline, df_particle
 
+    def _hydrology(self):
+        ''' Return the calculated travel times, heads and fractions (attributes of
+        'phreatic' or 'semiconfined') as dict, see _create_dataframes. '''
+        return {iName: getattr(self, iName) for iName in ['radial_distance', 'travel_time_unsaturated',
+                                                          'travel_time_shallow_aquifer', 'travel_time_target_aquifer',
+                                                          'total_travel_time', 'head',
+                                                          'cumulative_fraction_abstracted_water']}
+
+    def _create_dataframes(self, hydrology):
+        ''' Return df_output, df_flowline and df_particle of the calculated travel
+        times, heads and fractions 'hydrology' (dict of arrays). The dataframes are
+        not stored in the analytical cache, they are created on each call. '''
+
+        df_output = self._create_output_dataframe(total_travel_time=hydrology['total_travel_time'],
+                    travel_time_unsaturated = hydrology['travel_time_unsaturated'],
+                    travel_time_shallow_aquifer=hydrology['travel_time_shallow_aquifer'],
+                    travel_time_target_aquifer=hydrology['travel_time_target_aquifer'],
+                    distance=hydrology['radial_distance'], # For diffuse source, distance = radial_distance
+                                                           # for point source distance = distance_point_contamination_from_well
+                    head=hydrology['head'],
+                    cumulative_fraction_abstracted_water = hydrology['cumulative_fraction_abstracted_water'],
+                    )
+
+        df_flowline, df_particle = self._export_to_df(df_output=df_output,
+                    distance=hydrology['radial_distance'],
+                    total_travel_time=hydrology['total_travel_time'],
+                    travel_time_unsaturated = hydrology['travel_time_unsaturated'],
+                    travel_time_shallow_aquifer=hydrology['travel_time_shallow_aquifer'],
+                    travel_time_target_aquifer=hydrology['travel_time_target_aquifer'],
+                    discharge_point_contamination = self.schematisation.discharge_point_contamination)
+
+        return df_output, df_flowline, df_particle
+
     def phreatic(self,
                 distance=None,
                 depth_point_contamination=None,
@@ -1893,6 +2132,34 @@ class AnalyticalWell():
             Column 'fraction_organic_carbon': float
             Column 'solid_density': float
         '''
+        hydrology = _memoize_attributes(key = ('phreatic', self.schematisation.snapshot(),
+                                                _freeze(distance), _freeze(depth_point_contamination),
+                                                _freeze(cumulative_fraction_abstracted_water)),
+                                        attributes = [(self, self._calculated_attributes),
+                                                    (self.schematisation, self.schematisation._calculated_attributes)],
+                                        compute = lambda: self._calculate_hydrology_phreatic(distance = distance,
+                                                                                             depth_point_contamination = depth_point_contamination,
+                                                                                             cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water))
+        self.df_output, self.df_flowline, self.df_particle = self._create_dataframes(hydrology)
+
+    def _calculate_phreatic(self,
+                distance=None,
+                depth_point_contamination=None,
+                cumulative_fraction_abstracted_water=None,
+                ):
+        ''' Calculation of 'phreatic' (without the analytical cache). '''
+        hydrology = self._calculate_hydrology_phreatic(distance = distance,
+                                                       depth_point_contamination = depth_point_contamination,
+                                                       cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water)
+        self.df_output, self.df_flowline, self.df_particle = self._create_dataframes(hydrology)
+
+    def _calculate_hydrology_phreatic(self,
+                distance=None,
+                depth_point_contamination=None,
+                cumulative_fraction_abstracted_water=None,
+                ):
+        ''' Calculate the travel times, heads and fractions of 'phreatic' (arrays,
+        also set as attributes) and return them as dict, see _create_dataframes. '''
         # @MartinK -> the above are all "returned" as attributed of the funciton.. so include or not?
         # travel time unsaturated now calculated in the HydrochemicalSchematisation class
         # because Modflow schematisation also needs the unsaturated zone travel times
@@ -1925,28 +2192,7 @@ class AnalyticalWell():
         else:
             self.cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water
 
-        self.df_output = self._create_output_dataframe(total_travel_time=self.total_travel_time,
-                    travel_time_unsaturated = self.travel_time_unsaturated,
-                    travel_time_shallow_aquifer=self.travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=self.travel_time_target_aquifer,
-                    distance=self.radial_distance,  # MK: is this radial_distance? Sometimes you use radial_distance and sometimes distance.
-                                                    # AH_todo, @MartinK 
-                                                    # No maybe this parameter should be changed ,
-                                                    # For diffuse source, distance = radial_distance
-                                                    # for point source distance = distance_point_contamination_from_well 
-                                                    # this is explained in the function documentation
-                    head=self.head,
-                    cumulative_fraction_abstracted_water = self.cumulative_fraction_abstracted_water,
-                    )
-
-
-        self.df_flowline, self.df_particle = self._export_to_df(df_output=self.df_output,
-                    distance=self.radial_distance,
-                    total_travel_time=self.total_travel_time,
-                    travel_time_unsaturated = self.travel_time_unsaturated,
-                    travel_time_shallow_aquifer=self.travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=self.travel_time_target_aquifer,
-                    discharge_point_contamination = self.schematisation.discharge_point_contamination)
+        return self._hydrology()
 
     def _add_phreatic_point_sources(self,
                 distance=None,
@@ -1995,6 +2241,34 @@ class AnalyticalWell():
             Column 'removal_function': string
 
         '''
+        hydrology = _memoize_attributes(key = ('_add_phreatic_point_sources', self.schematisation.snapshot(),
+                                               _freeze(distance), _freeze(depth_point_contamination),
+                                               _freeze(cumulative_fraction_abstracted_water)),
+                                        attributes = [(self, self._point_source_attributes),
+                                                    (self.schematisation, self.schematisation._calculated_attributes)],
+                                        compute = lambda: self._calculate_hydrology_add_phreatic_point_sources(distance = distance,
+                                                                                                               depth_point_contamination = depth_point_contamination,
+                                                                                                               cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water))
+        return self._create_dataframes(hydrology)[1:]
+
+    def _calculate_add_phreatic_point_sources(self,
+                distance=None,
+                depth_point_contamination=None,
+                cumulative_fraction_abstracted_water=None,
+                ):
+        ''' Calculation of '_add_phreatic_point_sources' (without the analytical cache). '''
+        hydrology = self._calculate_hydrology_add_phreatic_point_sources(distance = distance,
+                                                                         depth_point_contamination = depth_point_contamination,
+                                                                         cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water)
+        return self._create_dataframes(hydrology)[1:]
+
+    def _calculate_hydrology_add_phreatic_point_sources(self,
+                distance=None,
+                depth_point_contamination=None,
+                cumulative_fraction_abstracted_water=None,
+                ):
+        ''' Calculate the travel times, heads and fractions of the (phreatic) point
+        sources and return them as dict, see _create_dataframes. '''
         # travel time unsaturated now calculated in the HydrochemicalSchematisation class
         # because Modflow schematisation also needs the unsaturated zone travel times
 
@@ -2024,24 +2298,13 @@ class AnalyticalWell():
         else:
             cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water
 
-        df_output = self._create_output_dataframe(total_travel_time=total_travel_time,
-                    travel_time_unsaturated = travel_time_unsaturated,
-                    travel_time_shallow_aquifer=travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=travel_time_target_aquifer,
-                    distance=radial_distance,
-                    head=head,
-                    cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water,
-                    )
-
-        df_flowline, df_particle=self._export_to_df(df_output=df_output,
-                    distance=radial_distance,
-                    total_travel_time=total_travel_time,
-                    travel_time_unsaturated = travel_time_unsaturated,
-                    travel_time_shallow_aquifer=travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=travel_time_target_aquifer,
-                    discharge_point_contamination = self.schematisation.discharge_point_contamination)
-
-        return df_flowline, df_particle
+        return {'radial_distance': radial_distance,
+                'travel_time_unsaturated': travel_time_unsaturated,
+                'travel_time_shallow_aquifer': travel_time_shallow_aquifer,
+                'travel_time_target_aquifer': travel_time_target_aquifer,
+                'total_travel_time': total_travel_time,
+                'head': head,
+                'cumulative_fraction_abstracted_water': cumulative_fraction_abstracted_water}
 
     def semiconfined(self,
                     distance=None,
@@ -2103,6 +2366,29 @@ class AnalyticalWell():
             Column 'solid_density': float
 
         '''
+        hydrology = _memoize_attributes(key = ('semiconfined', self.schematisation.snapshot(),
+                                               _freeze(distance), _freeze(depth_point_contamination)),
+                                        attributes = [(self, self._calculated_attributes),
+                                                    (self.schematisation, self.schematisation._calculated_attributes)],
+                                        compute = lambda: self._calculate_hydrology_semiconfined(distance = distance,
+                                                                                                 depth_point_contamination = depth_point_contamination))
+        self.df_output, self.df_flowline, self.df_particle = self._create_dataframes(hydrology)
+
+    def _calculate_semiconfined(self,
+                distance=None,
+                depth_point_contamination=None,
+                ):
+        ''' Calculation of 'semiconfined' (without the analytical cache). '''
+        hydrology = self._calculate_hydrology_semiconfined(distance = distance,
+                                                           depth_point_contamination = depth_point_contamination)
+        self.df_output, self.df_flowline, self.df_particle = self._create_dataframes(hydrology)
+
+    def _calculate_hydrology_semiconfined(self,
+                distance=None,
+                depth_point_contamination=None,
+                ):
+        ''' Calculate the travel times, heads and fractions of 'semiconfined' (arrays,
+        also set as attributes) and return them as dict, see _create_dataframes. '''
         #AH @MartinK -> the above are all "returned" as attributed of the funciton.. so include or not?
         
         if distance is None:
@@ -2140,23 +2426,7 @@ class AnalyticalWell():
         # AH, may want to change this, to eg. 6 labda or something else, adjust this number
         self.cumulative_fraction_abstracted_water = 1.1369 * (1 - self.flux_fraction)
 
-
-        self.df_output = self._create_output_dataframe(total_travel_time=self.total_travel_time,
-                    travel_time_unsaturated = self.travel_time_unsaturated,
-                    travel_time_shallow_aquifer=self.travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=self.travel_time_target_aquifer,
-                    distance=self.radial_distance,
-                    head=self.head,
-                    cumulative_fraction_abstracted_water = self.cumulative_fraction_abstracted_water,
-                    )
-
-        self.df_flowline, self.df_particle=self._export_to_df(df_output=self.df_output,
-                    distance=self.radial_distance,
-                    total_travel_time=self.total_travel_time,
-                    travel_time_unsaturated = self.travel_time_unsaturated,
-                    travel_time_shallow_aquifer=self.travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=self.travel_time_target_aquifer,
-                    discharge_point_contamination = self.schematisation.discharge_point_contamination)
+        return self._hydrology()
 
     #AH_todo make this a hidden __add_semiconfined_point_sources function
     def _add_semiconfined_point_sources(self,
@@ -2203,6 +2473,29 @@ class AnalyticalWell():
             Column 'removal_function': string
 
         '''
+        hydrology = _memoize_attributes(key = ('_add_semiconfined_point_sources', self.schematisation.snapshot(),
+                                               _freeze(distance), _freeze(depth_point_contamination)),
+                                        attributes = [(self, self._point_source_attributes),
+                                                    (self.schematisation, self.schematisation._calculated_attributes)],
+                                        compute = lambda: self._calculate_hydrology_add_semiconfined_point_sources(distance = distance,
+                                                                                                                   depth_point_contamination = depth_point_contamination))
+        return self._create_dataframes(hydrology)[1:]
+
+    def _calculate_add_semiconfined_point_sources(self,
+                distance=None,
+                depth_point_contamination=None,
+                ):
+        ''' Calculation of '_add_semiconfined_point_sources' (without the analytical cache). '''
+        hydrology = self._calculate_hydrology_add_semiconfined_point_sources(distance = distance,
+                                                                             depth_point_contamination = depth_point_contamination)
+        return self._create_dataframes(hydrology)[1:]
+
+    def _calculate_hydrology_add_semiconfined_point_sources(self,
+                distance=None,
+                depth_point_contamination=None,
+                ):
+        ''' Calculate the travel times, heads and fractions of the (semiconfined) point
+        sources and return them as dict, see _create_dataframes. '''
 
         if distance is None:
             self.schematisation._calculate_travel_time_unsaturated_zone()
@@ -2236,25 +2529,13 @@ class AnalyticalWell():
         # AH, may want to change this, to eg. 6 labda or something else, adjust this number
         cumulative_fraction_abstracted_water = 1.1369 * (1 - flux_fraction)
 
-
-        df_output = self._create_output_dataframe(total_travel_time=total_travel_time,
-                    travel_time_unsaturated = travel_time_unsaturated,
-                    travel_time_shallow_aquifer=travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=travel_time_target_aquifer,
-                    distance=radial_distance,
-                    head=head,
-                    cumulative_fraction_abstracted_water = cumulative_fraction_abstracted_water,
-                    )
-
-        df_flowline, df_particle=self._export_to_df(df_output=df_output,
-                    distance=radial_distance,
-                    total_travel_time=total_travel_time,
-                    travel_time_unsaturated = travel_time_unsaturated,
-                    travel_time_shallow_aquifer=travel_time_shallow_aquifer,
-                    travel_time_target_aquifer=travel_time_target_aquifer,
-                    discharge_point_contamination = self.schematisation.discharge_point_contamination)
-
-        return df_flowline, df_particle
+        return {'radial_distance': radial_distance,
+                'travel_time_unsaturated': travel_time_unsaturated,
+                'travel_time_shallow_aquifer': travel_time_shallow_aquifer,
+                'travel_time_target_aquifer': travel_time_target_aquifer,
+                'total_travel_time': total_travel_time,
+                'head': head,
+                'cumulative_fraction_abstracted_water': cumulative_fraction_abstracted_water}
 
 
     def plot_travel_time_versus_radial_distance(self,
@@ -2354,4 +2635,369 @@ class AnalyticalWell():
 
         return fig
 
+
+class AnalyticalWellBatch():
+    """ Compute the travel time distribution of many wells at once using the analytical
+    well functions of the AnalyticalWell class. The wells are given as a table, one row
+    per well, with the parameters of the HydroChemicalSchematisation as columns. Missing
+    columns are given the default value of the HydroChemicalSchematisation.
+
+    All wells use the same fraction_flux array (see '_create_radial_distance_array'), so
+    that the travel times are computed as (nr_wells, nr_flowlines) arrays without looping
+    over the wells. Only diffuse sources are computed: point sources (point_input_concentration)
+    are not supported, use AnalyticalWell (and Transport) for wells with a point source.
+
+    Attributes
+    ----------
+    wells: pandas.DataFrame
+        Parameters per well (indexed by 'well_id'), including the calculated
+        'KD', 'vertical_resistance_shallow_aquifer', 'groundwater_level', 'bottom_*',
+        'spreading_distance' and 'radial_distance_recharge'.
+    fraction_flux: array
+        Fraction of the flux of the pumping well for each flowline, [-].
+    radial_distance, head, travel_time_unsaturated, travel_time_shallow_aquifer,
+    travel_time_target_aquifer, total_travel_time, cumulative_fraction_abstracted_water,
+    flowline_discharge: array
+        Same as the attributes of AnalyticalWell, with shape (nr_wells, nr_flowlines).
+    df_flowline: pandas.DataFrame
+        df_flowline of all wells, indexed by ('well_id', flowline_id).
+    df_particle: pandas.DataFrame
+        df_particle of all wells, indexed by ('well_id', flowline_id).
+        df_particle.loc[well_id] has the layout of AnalyticalWell.df_particle.
+    """
+
+    # Parameters of the HydroChemicalSchematisation used in the batch calculation
+    parameters = ['well_name', 'removal_function', 'particle_release_day',
+                'ground_surface', 'thickness_vadose_zone_at_boundary', 'thickness_shallow_aquifer',
+                'thickness_target_aquifer', 'thickness_full_capillary_fringe',
+                'porosity_vadose_zone', 'porosity_shallow_aquifer', 'porosity_target_aquifer',
+                'moisture_content_vadose_zone',
+                'solid_density_vadose_zone', 'solid_density_shallow_aquifer', 'solid_density_target_aquifer',
+                'fraction_organic_carbon_vadose_zone', 'fraction_organic_carbon_shallow_aquifer',
+                'fraction_organic_carbon_target_aquifer',
+                'redox_vadose_zone', 'redox_shallow_aquifer', 'redox_target_aquifer',
+                'dissolved_organic_carbon_vadose_zone', 'dissolved_organic_carbon_shallow_aquifer',
+                'dissolved_organic_carbon_target_aquifer',
+                'pH_vadose_zone', 'pH_shallow_aquifer', 'pH_target_aquifer', 'temp_water',
+                'recharge_rate', 'well_discharge', 'diameter_borehole',
+                'hor_permeability_shallow_aquifer', 'hor_permeability_target_aquifer',
+                'vertical_anisotropy_shallow_aquifer', 'model_width',
+                ]
+
+    def __init__(self, wells, schematisation_type = 'phreatic', **kwargs):
+        '''
+        Initialize the AnalyticalWellBatch object from the table of well parameters.
+
+        Parameters
+        ----------
+        wells: pandas.DataFrame or numpy structured array
+            Parameters per well, with column names equal to the parameters of the
+            HydroChemicalSchematisation (e.g. 'well_discharge', 'recharge_rate',
+            'thickness_target_aquifer'). The well id is taken from the column 'well_id'
+            if present, otherwise from the index (DataFrame) or the row number (array).
+        schematisation_type: string
+            'phreatic' or 'semiconfined', used for all wells.
+        kwargs:
+            Default values for parameters not given as a column in 'wells'.
+        '''
+
+        if schematisation_type not in ['phreatic', 'semiconfined']:
+            raise ValueError(f"Invalid schematisation_type. Expected one of: {['phreatic', 'semiconfined']}")
+        self.schematisation_type = schematisation_type
+
+        if isinstance(wells, np.ndarray):
+            if wells.dtype.names is None:
+                raise TypeError('Error, wells should be a pandas.DataFrame or a numpy structured array.')
+            wells = pd.DataFrame.from_records(wells)
+        elif isinstance(wells, pd.DataFrame):
+            wells = wells.copy()
+        else:
+            raise TypeError('Error, wells should be a pandas.DataFrame or a numpy structured array.')
+
+        if 'well_id' in wells.columns:
+            wells = wells.set_index('well_id')
+        wells.index.name = 'well_id'
+        if not wells.index.is_unique:
+            raise ValueError('Error, the well ids should be unique.')
+
+        # default values from the HydroChemicalSchematisation
+        defaults = {name: parameter.default for name, parameter in
+                    inspect.signature(HydroChemicalSchematisation.__init__).parameters.items()
+                    if parameter.default is not inspect.Parameter.empty}
+        for key in kwargs.keys():
+            if key not in defaults:
+                raise KeyError(f'Invalid parameter {key}, not a parameter of the HydroChemicalSchematisation.')
+        defaults.update(kwargs)
+
+        # Point sources are not computed in the batch calculation
+        point_source = bool(kwargs.get('point_input_concentration'))
+        if 'point_input_concentration' in wells.columns:
+            point_source |= wells['point_input_concentration'].fillna(0).astype(bool).any()
+        if point_source:
+            raise ValueError('Error, point sources (point_input_concentration) are not supported in the batch calculation, use AnalyticalWell for wells with a point source.')
+
+        unused = [col for col in wells.columns if col not in self.parameters]
+        if unused:
+            warnings.warn(f'Columns not used in the batch calculation: {unused}')
+
+        for parameter in self.parameters:
+            if parameter not in wells.columns:
+                wells[parameter] = defaults[parameter]
+
+        # check that thicknesses for shallow and target aquifer > 0
+        for parameter in ['thickness_shallow_aquifer', 'thickness_target_aquifer']:
+            if (wells[parameter] <= 0).any():
+                raise ValueError(f'Error, {parameter} should be > 0. Wells: {list(wells.index[wells[parameter] <= 0])}')
+
+        #  Check redox zone options, if not one listed, raise error
+        for parameter in ['redox_vadose_zone', 'redox_shallow_aquifer', 'redox_target_aquifer']:
+            if not wells[parameter].isin(['suboxic', 'anoxic', 'deeply_anoxic']).all():
+                raise ValueError(f"Invalid {parameter}. Expected one of: {['suboxic', 'anoxic', 'deeply_anoxic']}")
+
+        # Calculated (same as HydroChemicalSchematisation)
+        wells['bottom_vadose_zone_at_boundary'] = wells.ground_surface - wells.thickness_vadose_zone_at_boundary.abs()
+        wells['bottom_shallow_aquifer'] = wells.bottom_vadose_zone_at_boundary - wells.thickness_shallow_aquifer.abs()
+        wells['bottom_target_aquifer'] = wells.bottom_shallow_aquifer - wells.thickness_target_aquifer.abs()
+        for parameter in ['thickness_vadose_zone_at_boundary', 'thickness_shallow_aquifer',
+                        'thickness_target_aquifer', 'thickness_full_capillary_fringe']:
+            wells[parameter] = wells[parameter].abs()
+        wells['vertical_resistance_shallow_aquifer'] = (wells.thickness_shallow_aquifer /
+                    (wells.hor_permeability_shallow_aquifer / wells.vertical_anisotropy_shallow_aquifer))
+        wells['KD'] = wells.hor_permeability_target_aquifer * wells.thickness_target_aquifer
+        wells['groundwater_level'] = wells.ground_surface - wells.thickness_vadose_zone_at_boundary
+        wells['spreading_distance'] = np.sqrt(wells.vertical_resistance_shallow_aquifer * wells.KD)
+        wells['radial_distance_recharge'] = np.sqrt(abs(wells.well_discharge / (math.pi * wells.recharge_rate)))
+
+        self.wells = wells
+        self.well_id = wells.index.values
+
+    def _get(self, parameter):
+        ''' Return the values of 'parameter' for all wells as float array of shape (nr_wells, 1). '''
+        return self.wells[parameter].values.astype('float')[:, np.newaxis]
+
+    def _create_radial_distance_array(self):
+        ''' Create the (nr_wells, nr_flowlines) array of radial distances, see
+        HydroChemicalSchematisation._create_radial_distance_array. '''
+
+        self.fraction_flux = _fraction_flux_array()
+        self.radial_distance = _radial_distance_array(fraction_flux = self.fraction_flux,
+                                                      radial_distance_recharge = self._get('radial_distance_recharge'),
+                                                      spreading_distance = self._get('spreading_distance'),
+                                                      schematisation_type = self.schematisation_type)
+
+    def phreatic(self):
+        '''
+        Calculates the travel time distribution for the phreatic schematisation
+        for each of the aquifer zones and creates the df_flowline and df_particle dataframes
+        for all wells, see AnalyticalWell.phreatic().
+        '''
+
+        if self.schematisation_type != 'phreatic':
+            raise ValueError(f'Error, schematisation_type is {self.schematisation_type}, not phreatic.')
+
+        self._create_radial_distance_array()
+
+        groundwater_level = self._get('groundwater_level')
+        thickness_full_capillary_fringe = self._get('thickness_full_capillary_fringe')
+        recharge_rate = self._get('recharge_rate')
+
+        # hydraulic head
+        self.head = _hydraulic_head_phreatic(distance = self.radial_distance,
+                                             groundwater_level = groundwater_level,
+                                             well_discharge = self._get('well_discharge'),
+                                             KD = self._get('KD'),
+                                             radial_distance_recharge = self._get('radial_distance_recharge'))
+
+        # unsaturated zone
+        thickness_vadose_zone_drawdown = (groundwater_level
+                                        + self._get('thickness_vadose_zone_at_boundary')) - self.head
+        self.travel_time_unsaturated = _travel_time_unsaturated(travel_distance = thickness_vadose_zone_drawdown
+                                                                    - thickness_full_capillary_fringe,
+                                                                thickness_full_capillary_fringe = thickness_full_capillary_fringe,
+                                                                moisture_content_vadose_zone = self._get('moisture_content_vadose_zone'),
+                                                                porosity_vadose_zone = self._get('porosity_vadose_zone'),
+                                                                recharge_rate = recharge_rate)
+
+        self.drawdown_at_well = self._get('ground_surface') - thickness_vadose_zone_drawdown
+        below_target = self.drawdown_at_well[:, 0] < self.wells.bottom_target_aquifer.values
+        if below_target.any():
+            raise ValueError(f'The drawdown at the well is lower than the bottom of the target aquifer. Please select a different schematisation. Wells: {list(self.well_id[below_target])}')
+        below_shallow = self.drawdown_at_well[:, 0] < self.wells.bottom_shallow_aquifer.values
+        if below_shallow.any():
+            warnings.warn(f'The drawdown at the well is lower than the bottom of the shallow aquifer. Wells: {list(self.well_id[below_shallow])}')
+
+        # shallow aquifer
+        self.travel_time_shallow_aquifer = _travel_time_shallow_aquifer_phreatic(
+                            travel_distance = self._get('thickness_shallow_aquifer') - (groundwater_level - self.head),
+                            porosity_shallow_aquifer = self._get('porosity_shallow_aquifer'),
+                            recharge_rate = recharge_rate)
+        self.travel_time_shallow_aquifer[self.travel_time_shallow_aquifer < 0] = 0
+
+        # target aquifer
+        self.travel_time_target_aquifer = _travel_time_target_aquifer_phreatic(fraction_flux = self.fraction_flux,
+                                porosity_target_aquifer = self._get('porosity_target_aquifer'),
+                                thickness_target_aquifer = self._get('thickness_target_aquifer'),
+                                recharge_rate = recharge_rate)
+
+        self.total_travel_time = (self.travel_time_unsaturated + self.travel_time_shallow_aquifer
+                            + self.travel_time_target_aquifer)
+
+        self.cumulative_fraction_abstracted_water = np.broadcast_to(self.fraction_flux, self.radial_distance.shape)
+
+        travel_distance_vadose = self.drawdown_at_well
+        travel_distance_shallow = (self._get('thickness_vadose_zone_at_boundary') +
+                                self._get('thickness_shallow_aquifer') - self.drawdown_at_well)
+
+        self._export_to_df(travel_distance_vadose = travel_distance_vadose,
+                        travel_distance_shallow = travel_distance_shallow)
+
+    def semiconfined(self):
+        '''
+        Calculates the travel time distribution for the semiconfined schematisation
+        for each of the aquifer zones and creates the df_flowline and df_particle dataframes
+        for all wells, see AnalyticalWell.semiconfined().
+        '''
+
+        if self.schematisation_type != 'semiconfined':
+            raise ValueError(f'Error, schematisation_type is {self.schematisation_type}, not semiconfined.')
+
+        self._create_radial_distance_array()
+
+        KD = self._get('KD')
+        vertical_resistance_shallow_aquifer = self._get('vertical_resistance_shallow_aquifer')
+        spreading_distance = self._get('spreading_distance')
+        well_discharge = self._get('well_discharge')
+        thickness_full_capillary_fringe = self._get('thickness_full_capillary_fringe')
+
+        # unsaturated zone, one value per well
+        travel_distance = self._get('ground_surface') - self._get('groundwater_level') - thickness_full_capillary_fringe
+        travel_time_unsaturated = _travel_time_unsaturated(travel_distance = travel_distance,
+                                                        thickness_full_capillary_fringe = thickness_full_capillary_fringe,
+                                                        moisture_content_vadose_zone = self._get('moisture_content_vadose_zone'),
+                                                        porosity_vadose_zone = self._get('porosity_vadose_zone'),
+                                                        recharge_rate = self._get('recharge_rate'))
+        travel_time_unsaturated[travel_distance < 0] = 0
+        self.travel_time_unsaturated = np.broadcast_to(travel_time_unsaturated, self.radial_distance.shape)
+
+        # shallow aquifer (aquitard)
+        self.travel_time_shallow_aquifer = _travel_time_aquitard_semiconfined(distance = self.radial_distance,
+                                            travel_distance = self._get('thickness_shallow_aquifer'),
+                                            porosity_shallow_aquifer = self._get('porosity_shallow_aquifer'),
+                                            KD = KD,
+                                            vertical_resistance_shallow_aquifer = vertical_resistance_shallow_aquifer,
+                                            well_discharge = well_discharge)
+
+        # target aquifer
+        self.travel_time_target_aquifer = _travel_time_target_aquifer_semiconfined(distance = self.radial_distance,
+                                            spreading_distance = spreading_distance,
+                                            porosity_target_aquifer = self._get('porosity_target_aquifer'),
+                                            thickness_target_aquifer = self._get('thickness_target_aquifer'),
+                                            well_discharge = well_discharge)
+
+        self.total_travel_time = self.travel_time_unsaturated + self.travel_time_shallow_aquifer + self.travel_time_target_aquifer
+
+        self.head = _hydraulic_head_semiconfined(distance = self.radial_distance,
+                                                 groundwater_level = self._get('groundwater_level'),
+                                                 well_discharge = well_discharge,
+                                                 KD = KD,
+                                                 spreading_distance = spreading_distance)
+
+        self.flux_fraction = _flux_fraction_semiconfined(distance = self.radial_distance,
+                                                         spreading_distance = spreading_distance)
+
+        # Equation A.16 in TRANSATOMIC report, see AnalyticalWell.semiconfined()
+        self.cumulative_fraction_abstracted_water = 1.1369 * (1 - self.flux_fraction)
+
+        travel_distance_vadose = self._get('thickness_vadose_zone_at_boundary')
+        travel_distance_shallow = self._get('thickness_shallow_aquifer')
+
+        self._export_to_df(travel_distance_vadose = travel_distance_vadose,
+                        travel_distance_shallow = travel_distance_shallow)
+
+    def _export_to_df(self, travel_distance_vadose, travel_distance_shallow):
+        """ Makes 'df_flowline' and 'df_particle' for all wells, with the same columns as
+        AnalyticalWell._export_to_df and indexed by ('well_id', flowline_id).
+
+        Parameters
+        ----------
+        travel_distance_vadose, travel_distance_shallow: array
+            Travel distance in the vadose zone and shallow aquifer, shape (nr_wells, nr_flowlines)
+            or (nr_wells, 1), [m].
+        """
+
+        nr_wells, nr_flowlines = self.radial_distance.shape
+        shape = (nr_wells, nr_flowlines, 4)
+
+        def per_zone(parameter):
+            # (nr_wells, 4) values of the zones ('surface' equals 'vadose_zone'), repeated per flowline
+            values = self.wells[[f'{parameter}_vadose_zone', f'{parameter}_vadose_zone',
+                                 f'{parameter}_shallow_aquifer', f'{parameter}_target_aquifer']].values
+            return np.broadcast_to(values[:, np.newaxis, :], shape).ravel()
+
+        def per_well(parameter):
+            return np.broadcast_to(self.wells[parameter].values[:, np.newaxis, np.newaxis], shape).ravel()
+
+        def stack_zones(surface, vadose_zone, shallow_aquifer, target_aquifer):
+            # (nr_wells, nr_flowlines) arrays per zone to one record per well, flowline and zone
+            return np.stack([np.broadcast_to(zone, (nr_wells, nr_flowlines)) for zone in
+                            [surface, vadose_zone, shallow_aquifer, target_aquifer]], axis = -1).ravel()
+
+        zeros = np.zeros((nr_wells, nr_flowlines))
+        flowline_id = np.broadcast_to(np.arange(1, nr_flowlines + 1)[np.newaxis, :, np.newaxis], shape).ravel()
+        well_id = np.broadcast_to(self.well_id[:, np.newaxis, np.newaxis], shape).ravel()
+
+        df_particle = pd.DataFrame({'flowline_id': flowline_id,
+                    'zone': np.broadcast_to(np.array(["surface", "vadose_zone", "shallow_aquifer", "target_aquifer"],
+                                                     dtype = 'object'), shape).ravel(),
+                    'travel_time': stack_zones(zeros,
+                                               self.travel_time_unsaturated,
+                                               self.travel_time_shallow_aquifer,
+                                               self.travel_time_target_aquifer),
+                    'total_travel_time': stack_zones(zeros,
+                                               self.travel_time_unsaturated,
+                                               self.travel_time_unsaturated + self.travel_time_shallow_aquifer,
+                                               self.total_travel_time),
+                    'xcoord': stack_zones(self.radial_distance, self.radial_distance, self.radial_distance,
+                                          self._get('diameter_borehole') / 2), # target aquifer: at the well
+                    'ycoord': per_well('model_width').astype('float'),
+                    'zcoord': stack_zones(self._get('ground_surface'),
+                                          self._get('bottom_vadose_zone_at_boundary'),
+                                          self._get('bottom_shallow_aquifer'),
+                                          self._get('bottom_target_aquifer')),
+                    'redox': per_zone('redox'),
+                    'temp_water': per_well('temp_water').astype('float'),
+                    'travel_distance': stack_zones(zeros,
+                                               travel_distance_vadose,
+                                               travel_distance_shallow,
+                                               self.radial_distance),
+                    'porosity': per_zone('porosity').astype('float'),
+                    'dissolved_organic_carbon': per_zone('dissolved_organic_carbon').astype('float'),
+                    'pH': per_zone('pH').astype('float'),
+                    'fraction_organic_carbon': per_zone('fraction_organic_carbon').astype('float'),
+                    'solid_density': per_zone('solid_density').astype('float'),
+                    },
+                    index = pd.MultiIndex.from_arrays([well_id, flowline_id], names = ['well_id', None]))
+
+        # flowline discharge of diffuse sources, see AnalyticalWell._create_output_dataframe
+        well_discharge = abs(self._get('well_discharge'))
+        self.flowline_discharge = np.diff(self.cumulative_fraction_abstracted_water, axis = 1,
+                                        prepend = 0.) * well_discharge
+
+        flowline_id = np.tile(np.arange(1, nr_flowlines + 1), nr_wells)
+        well_id = np.repeat(self.well_id, nr_flowlines)
+        df_flowline = pd.DataFrame({'flowline_id': flowline_id,
+                    'flowline_type': 'diffuse_source',
+                    'flowline_discharge': self.flowline_discharge.ravel(),
+                    'particle_release_day': np.repeat(self.wells.particle_release_day.values, nr_flowlines),
+                    'endpoint_id': np.repeat(self.wells.well_name.values, nr_flowlines),
+                    'well_discharge': np.repeat(well_discharge[:, 0], nr_flowlines),
+                    'removal_function': np.repeat(self.wells.removal_function.values, nr_flowlines),
+                    },
+                    index = pd.MultiIndex.from_arrays([well_id, flowline_id], names = ['well_id', None]))
+
+        self.df_flowline, self.df_particle = df_flowline, df_particle
+
+        return df_flowline, df_particle
+
+
 # %%
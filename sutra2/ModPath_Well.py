@@ -35,18 +35,30 @@ import pandas as pd
 import os
 import sys
 import copy
+import mmap
 import warnings
+import io
+import time
+import shutil
+import signal
+import tempfile
+import itertools
+import contextlib
+import multiprocessing
+import multiprocessing.connection
+import json
+import hashlib
 
 # from pandas import read_excel
 from pandas import read_csv
 from pandas import read_excel
 import datetime
-# import pyarrow.parquet as pq
 import math
 import re # regular expressions
 from scipy.special import kn as besselk
 
-from sutra2.Analytical_Well import AnalyticalWell
+from sutra2.Analytical_Well import AnalyticalWell, HydroChemicalSchematisation
+from sutra2.Particle_Store import ParticleStore
 
 # try:
 #     from sutra2.Analytical_Well import * 
@@ -78,6 +90,16 @@ except Exception as e:
 # flopy version
 print(flopy.__version__)
 
+# pyarrow is optional (pip install sutra2[arrow]): required to export (import) df_flowline and
+# df_particle in parquet or arrow format and for the cache of model runs. Without pyarrow the
+# results of a model run are saved as csv files.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+
 
 #%%
 '''
@@ -149,6 +171,593 @@ rmax -> diameter_filterscreen
 '''
 
 
+class ModPathOutputFile:
+
+    """ Lazy, memory-mapped access to MODPATH 7 pathline ('.mppth') or
+    endpoint ('.mpend') output.
+
+    On opening, the file is memory-mapped and scanned once (in chunks) to
+    index the byte offset and number of records of each particle. Records
+    are only parsed when they are requested, so particles can be sliced or
+    streamed without loading the whole file. The record dtypes, zero-based
+    indices ('particleid', 'node', 'k', ...) and the sort order of the returned
+    pathline data are equal to those of flopy.utils.PathlineFile and
+    flopy.utils.EndpointFile.
+
+    Parameters
+    ----------
+    fname: str
+        Filepath of the MODPATH 7 pathline or endpoint file.
+    chunksize: int
+        Number of bytes scanned at once while indexing the file.
+
+    Attributes
+    ----------
+    output_type: str
+        'pathline' or 'endpoint'
+    particle_ids: np.array
+        Zero-based particle ids (sequence numbers) in the file, sorted.
+    offsets: np.array
+        Byte offset of the first record of each particle (in order of 'particle_ids').
+    counts: np.array
+        Number of records of each particle (in order of 'particle_ids').
+    """
+
+    # Fields of a pathline record
+    _pathline_fields = [("node", np.int32), ("x", np.float32), ("y", np.float32),
+                        ("z", np.float32), ("time", np.float32), ("xloc", np.float32),
+                        ("yloc", np.float32), ("zloc", np.float32), ("k", np.int32),
+                        ("stressperiod", np.int32), ("timestep", np.int32)]
+
+    # Pathline data dtype (flopy.utils.PathlineFile)
+    pathline_dtype = np.dtype([("particleid", np.int32), ("particlegroup", np.int32),
+                               ("sequencenumber", np.int32), ("particleidloc", np.int32),
+                               ("time", np.float32), ("x", np.float32), ("y", np.float32),
+                               ("z", np.float32), ("k", np.int32), ("node", np.int32),
+                               ("xloc", np.float32), ("yloc", np.float32), ("zloc", np.float32),
+                               ("stressperiod", np.int32), ("timestep", np.int32)])
+
+    # Endpoint data dtype (flopy.utils.EndpointFile)
+    endpoint_dtype = np.dtype([("particleid", np.int32), ("particlegroup", np.int32),
+                               ("particleidloc", np.int32), ("status", np.int32),
+                               ("time0", np.float32), ("time", np.float32), ("node0", np.int32),
+                               ("k0", np.int32), ("xloc0", np.float32), ("yloc0", np.float32),
+                               ("zloc0", np.float32), ("x0", np.float32), ("y0", np.float32),
+                               ("z0", np.float32), ("zone0", np.int32), ("initialcellface", np.int32),
+                               ("node", np.int32), ("k", np.int32), ("xloc", np.float32),
+                               ("yloc", np.float32), ("zloc", np.float32), ("x", np.float32),
+                               ("y", np.float32), ("z", np.float32), ("zone", np.int32),
+                               ("cellface", np.int32)])
+
+    # One-based indices in the file, converted to zero-based
+    _kijnames = ["k0", "node0", "k", "node", "particleid", "particlegroup",
+                 "particleidloc", "sequencenumber", "zone0", "zone"]
+
+    def __init__(self, fname, chunksize = 2**24):
+
+        self.fname = fname
+        self.chunksize = chunksize
+
+        self._file = open(self.fname, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file (cannot be memory-mapped)
+            self._file.close()
+            raise ValueError(f"{self.fname} is not a valid MODPATH 7 pathline or endpoint file")
+
+        # Check file type (MODPATH 7 only)
+        first_line = self._mm[:self._mm.find(b"\n")].decode().upper().split()
+        if first_line[:2] == ["MODPATH_PATHLINE_FILE", "7"]:
+            self.output_type = "pathline"
+        elif first_line[:2] == ["MODPATH_ENDPOINT_FILE", "7"]:
+            self.output_type = "endpoint"
+        else:
+            self.close()
+            raise ValueError(f"{self.fname} is not a valid MODPATH 7 pathline or endpoint file")
+
+        # Start of the data (line after 'END HEADER')
+        header_end = self._mm.find(b"END HEADER")
+        if header_end < 0:
+            header_end = self._mm.find(b"end header")
+        if header_end < 0:
+            self.close()
+            raise ValueError(f"{self.fname} has no 'END HEADER' line")
+        self._data_start = self._mm.find(b"\n", header_end) + 1
+
+        self._build_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.particle_ids)
+
+    def close(self):
+        ''' Close the memory map and the file. '''
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def _release(self):
+        ''' Release the pages of the memory map that were read (if supported),
+            so the memory use does not grow with the file size. '''
+        if hasattr(mmap, "MADV_DONTNEED"):
+            self._mm.madvise(mmap.MADV_DONTNEED)
+
+    def _line_bounds(self):
+        ''' Yield the start and end (newline) byte positions of the data lines, per chunk. '''
+        size = len(self._mm)
+        line_start = self._data_start
+        for chunk_start in range(self._data_start, size, self.chunksize):
+            count = min(self.chunksize, size - chunk_start)
+            line_ends = np.flatnonzero(np.frombuffer(self._mm, dtype = np.uint8, count = count,
+                                                     offset = chunk_start) == 10) + chunk_start
+            if chunk_start + count == size and (len(line_ends) == 0 or line_ends[-1] != size - 1):
+                # Last line without newline
+                line_ends = np.append(line_ends, size)
+            if len(line_ends) == 0:
+                continue
+            line_starts = np.append(line_start, line_ends[:-1] + 1)
+            line_start = line_ends[-1] + 1
+            yield line_starts, line_ends
+            self._release()
+
+    def _build_index(self):
+        ''' Index the byte offsets and number of records per particle. '''
+
+        ids, groups, locids, offsets, ends, counts = [], [], [], [], [], []
+        # Number of pathline records still to skip before the next particle header
+        remaining = 0
+        for line_starts, line_ends in self._line_bounds():
+            if self.output_type == "endpoint":
+                # One record per particle: sequencenumber, particlegroup, particleidloc, ...
+                for start, end in zip(line_starts, line_ends):
+                    record = self._mm[start:end].split(maxsplit = 3)
+                    if len(record) > 0:
+                        ids.append(int(record[0]))
+                        groups.append(int(record[1]))
+                        locids.append(int(record[2]))
+                        offsets.append(start)
+                        ends.append(end)
+                        counts.append(1)
+                continue
+
+            iLine, nr_lines = 0, len(line_starts)
+            while iLine < nr_lines:
+                if remaining > 0:
+                    skip = min(remaining, nr_lines - iLine)
+                    iLine += skip
+                    remaining -= skip
+                    if remaining == 0:
+                        # End of the records of the particle
+                        ends.append(line_ends[iLine - 1])
+                    continue
+                # Particle header: sequencenumber, group, particleid, pathlinecount
+                header = self._mm[line_starts[iLine]:line_ends[iLine]].split()
+                if len(header) > 0:
+                    ids.append(int(header[0]))
+                    groups.append(int(header[1]))
+                    locids.append(int(header[2]))
+                    offsets.append(line_ends[iLine] + 1)
+                    counts.append(int(header[3]))
+                    remaining = counts[-1]
+                    if remaining == 0:
+                        ends.append(offsets[-1])
+                iLine += 1
+
+        if len(ends) < len(offsets):
+            raise ValueError(f"{self.fname}: incomplete pathline data for particle {ids[-1]}")
+
+        # Zero-based particle ids
+        ids = np.array(ids, dtype = np.int32) - 1
+        order = np.argsort(ids, kind = "stable")
+        self.particle_ids = ids[order]
+        self.offsets = np.array(offsets, dtype = np.int64)[order]
+        self.counts = np.array(counts, dtype = np.int64)[order]
+        self._ends = np.array(ends, dtype = np.int64)[order]
+        self._groups = np.array(groups, dtype = np.int32)[order]
+        self._locids = np.array(locids, dtype = np.int32)[order]
+
+    def _parse(self, positions):
+        ''' Parse the records of the particles at 'positions' (in 'particle_ids') to a recarray. '''
+
+        positions = np.atleast_1d(positions)
+        if self.output_type == "pathline":
+            dtype = self.pathline_dtype
+            nr_values = len(self._pathline_fields)
+        else:
+            dtype = self.endpoint_dtype
+            nr_values = len(dtype)
+
+        data = np.zeros(int(self.counts[positions].sum()), dtype = dtype)
+        if len(data) == 0:
+            return data.view(np.recarray)
+
+        values = b" ".join([self._mm[self.offsets[iPos]:self._ends[iPos]] for iPos in positions])
+        values = np.array(values.split(), dtype = 'float').reshape(-1, nr_values)
+
+        if self.output_type == "pathline":
+            for iField, (name, field_dtype) in enumerate(self._pathline_fields):
+                data[name] = values[:,iField].astype(field_dtype)
+            # sequencenumber is unique for all pathlines (used as particleid)
+            data["particleid"] = np.repeat(self.particle_ids[positions] + 1, self.counts[positions])
+            data["sequencenumber"] = data["particleid"]
+            data["particlegroup"] = np.repeat(self._groups[positions], self.counts[positions])
+            data["particleidloc"] = np.repeat(self._locids[positions], self.counts[positions])
+        else:
+            for iField, name in enumerate(dtype.names):
+                data[name] = values[:,iField].astype(dtype[name])
+
+        # Convert indices to zero-based
+        for name in self._kijnames:
+            if name in data.dtype.names:
+                data[name] -= 1
+
+        return data.view(np.recarray)
+
+    def _positions(self, partids):
+        ''' Positions of the (zero-based) particle ids 'partids' in 'particle_ids'. '''
+        partids = np.atleast_1d(np.asarray(partids, dtype = 'int'))
+        positions = np.searchsorted(self.particle_ids, partids)
+        positions = np.minimum(positions, len(self.particle_ids) - 1)
+        missing = partids[(len(self.particle_ids) == 0) | (self.particle_ids[positions] != partids)]
+        if len(missing) > 0:
+            raise KeyError(f"particle id(s) {list(missing)} not in {self.fname}")
+        return positions
+
+    def get_data(self, partid):
+        ''' Return the records of particle(s) 'partid' (zero-based id or list of ids).
+            Pathline records are sorted by particleid and time.'''
+        data = self._parse(self._positions(partid))
+        if self.output_type == "pathline":
+            data.sort(order = ["particleid", "time"])
+        return data
+
+    def iter_data(self, batchsize = 1000):
+        ''' Iterate over the records of all particles, 'batchsize' particles at a time. '''
+        for iStart in range(0, len(self.particle_ids), batchsize):
+            yield self.get_data(self.particle_ids[iStart:iStart + batchsize])
+            self._release()
+
+    def get_alldata(self):
+        ''' Return the records of all particles. '''
+        return self.get_data(self.particle_ids)
+
+    def get_destination_data(self, dest_cells, batchsize = 1000):
+        ''' Return the records of all particles with a record in (zero-based)
+            node(s) 'dest_cells', sorted by particleid and time. The particles 
+            are read in batches of 'batchsize' particles.'''
+        dest_cells = np.atleast_1d(np.asarray(dest_cells, dtype = 'int'))
+        if self.output_type == "pathline":
+            selection = [np.zeros(0, dtype = self.pathline_dtype)]
+        else:
+            selection = [np.zeros(0, dtype = self.endpoint_dtype)]
+        for iStart in range(0, len(self.particle_ids), batchsize):
+            data = self._parse(np.arange(iStart, min(iStart + batchsize, len(self.particle_ids))))
+            partids = np.unique(data["particleid"][np.isin(data["node"], dest_cells)])
+            selection.append(data[np.isin(data["particleid"], partids)])
+            self._release()
+        data = np.concatenate(selection)
+        if self.output_type == "pathline":
+            data.sort(order = ["particleid", "time"])
+        return data.view(np.recarray)
+
+
+
+def _canonical_json(obj):
+    ''' Return values (numpy types, tuples, etc.) of the schematisation and run options
+    in a json-serializable form, used by ModPathRunCache to create the cache key. '''
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key = repr)
+    return repr(obj)
+
+
+class ModPathRunCache:
+    """ Content-addressed cache (on disk) of ModPathWell model runs.
+
+    The cache key is a hash of the schematisation_dict, the MODFLOW and MODPATH
+    executables (contents) and the run options. Each entry stores the model files
+    (inputs and outputs: heads, budgets, pathlines, endpoints, etc.) and the
+    post-processed df_flowline and df_particle, so that a repeated run is restored
+    without running the solvers (the model input files are still written by
+    ModPathWell.run_model). The cache size is bounded: the least recently used
+    entries are removed once 'max_size' is exceeded.
+
+    The results are stored without pickle: dataframes as arrow (IPC) files, arrays
+    as npy files and other values in 'results.json', so reading an entry does not
+    execute code. The cache requires pyarrow (pip install sutra2[arrow]).
+
+    Attributes
+    ----------
+    cache_dir: str
+        Directory of the cache entries (one subdirectory per key).
+    max_size: int
+        Maximum size of the cache [bytes].
+    hits: int
+        Number of model runs restored from the cache.
+    misses: int
+        Number of model runs not found in the cache.
+    """
+
+    # Version of the cache entries (increase if the stored data changes)
+    cache_version = 1
+    # Cached file hashes of executables: path --> ((mtime, size), hash)
+    _exe_hashes = {}
+
+    def __init__(self, cache_dir: str, max_size: int = 2**30):
+
+        if pa is None:
+            raise ImportError("Error, pyarrow is required for the cache of model runs (pip install sutra2[arrow]).")
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok = True)
+
+    def _exe_version(self, exe):
+        ''' Return the hash of the executable 'exe' (or its name, if the file is not found). '''
+        fpath = exe if os.path.isfile(exe) else shutil.which(exe)
+        if fpath is None:
+            return os.path.basename(exe)
+        stat = os.stat(fpath)
+        exe_id = (stat.st_mtime_ns, stat.st_size)
+        if self._exe_hashes.get(fpath, (None,))[0] != exe_id:
+            sha = hashlib.sha256()
+            with open(fpath, "rb") as exe_file:
+                for chunk in iter(lambda: exe_file.read(2**20), b""):
+                    sha.update(chunk)
+            self._exe_hashes[fpath] = (exe_id, sha.hexdigest())
+        return self._exe_hashes[fpath][1]
+
+    def key(self, schematisation_dict: dict, mf_exe: str, mp_exe: str, run_options: dict):
+        '''
+        Return the cache key (hex string) of a model run.
+
+        Parameters
+        ----------
+        schematisation_dict: dict
+            Schematisation of the model (ModPathWell.schematisation_dict).
+        mf_exe, mp_exe: str
+            MODFLOW and MODPATH executables.
+        run_options: dict
+            Options of the model run (e.g. arguments of ModPathWell.run_model).
+        '''
+        content = {"cache_version": self.cache_version,
+                   "schematisation": schematisation_dict,
+                   "mf_exe": self._exe_version(mf_exe),
+                   "mp_exe": self._exe_version(mp_exe),
+                   "run_options": run_options}
+        content_json = json.dumps(content, sort_keys = True, default = _canonical_json)
+        return hashlib.sha256(content_json.encode("utf-8")).hexdigest()
+
+    def _entry_size(self, entry_dir):
+        ''' Return the size of cache entry 'entry_dir' [bytes]. '''
+        size = 0
+        for iFile in os.scandir(entry_dir):
+            size += iFile.stat().st_size
+        return size
+
+    def get(self, key: str, workspace: str, modelname: str):
+        '''
+        Restore the model files of cache entry 'key' to the workspace (as files
+        of model 'modelname') and return the stored results (dict), or None if
+        'key' is not in the cache.
+        '''
+        entry_dir = os.path.join(self.cache_dir, key)
+        try:
+            results = self._read_results(entry_dir)
+            os.makedirs(workspace, exist_ok = True)
+            for iSuffix in results["file_suffixes"]:
+                shutil.copyfile(os.path.join(entry_dir, "model" + iSuffix),
+                                os.path.join(workspace, modelname + iSuffix))
+            # Least recently used: update modification time of the entry
+            os.utime(entry_dir)
+        except (OSError, ValueError, EOFError):
+            # Entry not found, incomplete or removed (evicted) by a concurrent run
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return results
+
+    def _write_results(self, entry_dir, results):
+        ''' Store the results (dict) in cache entry 'entry_dir': dataframes as arrow files,
+        arrays as npy files and other (json-serializable) values in 'results.json'. '''
+        content = {"values": {}, "arrays": [], "frames": {}}
+        for iName, iValue in results.items():
+            if isinstance(iValue, pd.DataFrame):
+                feather.write_feather(pa.Table.from_pandas(iValue), os.path.join(entry_dir, "results_" + iName + ".arrow"))
+                # Object columns (e.g. numbers and strings) are restored as object columns
+                content["frames"][iName] = [iCol for iCol, iDtype in iValue.dtypes.items() if iDtype == object]
+            elif isinstance(iValue, np.ndarray):
+                np.save(os.path.join(entry_dir, "results_" + iName + ".npy"), np.asarray(iValue), allow_pickle = False)
+                content["arrays"].append(iName)
+            else:
+                content["values"][iName] = iValue
+        with open(os.path.join(entry_dir, "results.json"), "w") as results_file:
+            json.dump(content, results_file, default = _canonical_json)
+
+    def _read_results(self, entry_dir):
+        ''' Return the results (dict) stored in cache entry 'entry_dir' by _write_results. '''
+        with open(os.path.join(entry_dir, "results.json"), "r") as results_file:
+            content = json.load(results_file)
+        results = dict(content["values"])
+        for iName in content["arrays"]:
+            results[iName] = np.load(os.path.join(entry_dir, "results_" + iName + ".npy"), allow_pickle = False)
+        for iName, object_columns in content["frames"].items():
+            df = feather.read_table(os.path.join(entry_dir, "results_" + iName + ".arrow")).to_pandas()
+            results[iName] = df.astype({iCol: object for iCol in object_columns})
+        return results
+
+    def put(self, key: str, workspace: str, modelname: str, results: dict):
+        '''
+        Store the model files of model 'modelname' in the workspace and the
+        results (dict with e.g. 'df_flowline' and 'df_particle') under 'key',
+        and remove the least recently used entries if the cache exceeds 'max_size'.
+        '''
+        entry_dir = os.path.join(self.cache_dir, key)
+        if os.path.isdir(entry_dir):
+            os.utime(entry_dir)
+            return
+
+        # Write a temporary entry first: concurrent runs (e.g. ModPathWellSweep) only see complete entries
+        tmp_dir = tempfile.mkdtemp(prefix = "tmp_", dir = self.cache_dir)
+        file_suffixes = []
+        for iFile in os.scandir(workspace):
+            if iFile.is_file() and iFile.name.startswith(modelname):
+                iSuffix = iFile.name[len(modelname):]
+                shutil.copyfile(iFile.path, os.path.join(tmp_dir, "model" + iSuffix))
+                file_suffixes.append(iSuffix)
+        try:
+            self._write_results(tmp_dir, {**results, "file_suffixes": file_suffixes})
+        except (TypeError, ValueError, NotImplementedError) as e:
+            # Results which can not be stored (e.g. object columns of mixed types): run is not cached
+            warnings.warn(f"Model run is not stored in the cache: {e!r}")
+            shutil.rmtree(tmp_dir, ignore_errors = True)
+            return
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Entry already stored by another run
+            shutil.rmtree(tmp_dir, ignore_errors = True)
+
+        self.evict()
+
+    def evict(self, max_size: int or None = None):
+        ''' Remove the least recently used entries until the cache size is at most 'max_size' [bytes]. '''
+        if max_size is None:
+            max_size = self.max_size
+        entries = []
+        for iEntry in os.scandir(self.cache_dir):
+            if iEntry.is_dir() and not iEntry.name.startswith("tmp_"):
+                entries.append((iEntry.stat().st_mtime_ns, self._entry_size(iEntry.path), iEntry.path))
+        cache_size = sum([iEntry[1] for iEntry in entries])
+        for _, entry_size, entry_dir in sorted(entries):
+            if cache_size <= max_size:
+                break
+            shutil.rmtree(entry_dir, ignore_errors = True)
+            cache_size -= entry_size
+
+    def clear(self):
+        ''' Remove all entries of the cache. '''
+        self.evict(max_size = 0)
+
+
+# File extension per (binary) export format of df_flowline and df_particle
+results_file_extensions = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _check_results_format(file_format: str):
+    ''' Check the export format of df_flowline and df_particle and whether pyarrow is installed. '''
+    if file_format not in results_file_extensions:
+        raise ValueError(f"Error, file_format should be one of {list(results_file_extensions)}, not '{file_format}'.")
+    if pa is None:
+        raise ImportError(f"Error, pyarrow is required to export or import results in {file_format} format (pip install sutra2[arrow]).")
+
+
+def write_results(df_flowline: pd.DataFrame, df_particle: pd.DataFrame,
+                    dstroot: str, name: str, file_format: str = "parquet",
+                    compression: str or None = "zstd", metadata: dict or None = None):
+    '''
+    Write df_flowline and df_particle in a binary columnar format to the files
+    '<name>_df_flowline.<file_format>' and '<name>_df_particle.<file_format>' in
+    directory 'dstroot'. The index and dtypes (e.g. integers, strings, categories)
+    of the dataframes are kept, and the (run) metadata is stored in both files.
+    Read the files with read_results.
+
+    Parameters
+    ----------
+    df_flowline, df_particle: pandas.DataFrame
+        Flowline and particle dataframes (e.g. of ModPathWell or AnalyticalWell).
+    dstroot: str
+        Directory of the files.
+    name: str
+        Start of the file names, e.g. the schematisation_type.
+    file_format: str
+        'parquet' or 'arrow' (arrow IPC file, also known as feather).
+    compression: str or None
+        Compression codec, e.g. 'zstd' (default), 'lz4' or for 'parquet' also
+        'snappy', 'gzip' or 'brotli'. None: no compression.
+    metadata: dict or None
+        Metadata of the run (json-serializable, numpy values are converted).
+
+    Returns
+    -------
+    fnames: dict
+        File name per dataframe ('df_flowline', 'df_particle').
+    '''
+    _check_results_format(file_format)
+    metadata_json = json.dumps({} if metadata is None else metadata, default = _canonical_json).encode()
+
+    os.makedirs(dstroot, exist_ok = True)
+    fnames = {}
+    for iName, iDf in {"df_flowline": df_flowline, "df_particle": df_particle}.items():
+        table = pa.Table.from_pandas(iDf)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"sutra2": metadata_json})
+        fnames[iName] = os.path.join(dstroot, name + "_" + iName + results_file_extensions[file_format])
+        if file_format == "parquet":
+            pq.write_table(table, fnames[iName], compression = "none" if compression is None else compression)
+        else:
+            feather.write_feather(table, fnames[iName], compression = "uncompressed" if compression is None else compression)
+    return fnames
+
+
+def read_results(dstroot: str, name: str, file_format: str = "parquet",
+                    columns: list or None = None):
+    '''
+    Read df_flowline, df_particle and the run metadata written by write_results
+    (or saved by ModPathWell.run_model) from directory 'dstroot'. Columns of dtype
+    object with numbers (e.g. 'flowline_discharge') are read as numeric columns.
+
+    Parameters
+    ----------
+    dstroot: str
+        Directory of the files.
+    name: str
+        Start of the file names, e.g. the schematisation_type.
+    file_format: str
+        'parquet' or 'arrow'.
+    columns: list or None
+        Columns of df_particle to read (default: all columns).
+
+    Returns
+    -------
+    df_flowline, df_particle: pandas.DataFrame
+    metadata: dict
+        Metadata of the run.
+    '''
+    _check_results_format(file_format)
+
+    results, metadata = {}, {}
+    for iName in ["df_flowline", "df_particle"]:
+        fname = os.path.join(dstroot, name + "_" + iName + results_file_extensions[file_format])
+        iColumns = columns if iName == "df_particle" else None
+        if file_format == "parquet":
+            table = pq.read_table(fname, columns = iColumns, use_pandas_metadata = True)
+        else:
+            if iColumns is not None:
+                # Read the index column(s) as well
+                with pa.memory_map(fname) as source:
+                    pandas_metadata = json.loads(pa.ipc.open_file(source).schema.metadata[b"pandas"])
+                iColumns = [iCol for iCol in pandas_metadata["index_columns"] if isinstance(iCol, str)] + list(iColumns)
+            table = feather.read_table(fname, columns = iColumns)
+            if iColumns is not None:
+                # Order of 'columns'
+                table = table.select(iColumns)
+        if b"sutra2" in (table.schema.metadata or {}):
+            metadata = json.loads(table.schema.metadata[b"sutra2"])
+        results[iName] = table.to_pandas()
+    return results["df_flowline"], results["df_particle"], metadata
+
+
 class ModPathWell:
 
     """ Compute travel time distribution using MODFLOW and MODPATH.""" 
@@ -158,7 +767,11 @@ class ModPathWell:
                        bound_left: str = "xmin", bound_right: str = "xmax",
                        bound_top: str = "top", bound_bot: str = "bot",
                        bound_north: str = "ymin", bound_south: str = "ymax",
-                       trackingdirection = "forward"): 
+                       trackingdirection = "forward",
+                       cache: ModPathRunCache or str or None = None,
+                       export_format: str or None = "parquet",
+                       export_compression: str or None = "zstd",
+                       export_csv: bool = False): 
         ''''unpack/parse' all the variables from the hydrogeochemical schematizization """
        
         #@Steven: Parameters df_particle & df_flowline mogen weg. Beschrijf wel overige invoer
@@ -204,6 +817,18 @@ class ModPathWell:
         self.bound_south = bound_south
         # Direction of calculating flow along pathlines (in modpath)
         self.trackingdirection = trackingdirection
+        # Cache of model runs (ModPathRunCache or cache directory), None: no caching
+        if isinstance(cache, str):
+            cache = ModPathRunCache(cache_dir = cache)
+        self.cache = cache
+        # Export df_flowline and df_particle to dstroot: binary format ('parquet', 'arrow' or None: no export,
+        # see write_results), its compression and (optionally) as csv files. Without pyarrow the
+        # binary export falls back to csv files.
+        if (export_format is not None) and (export_format not in results_file_extensions):
+            raise ValueError(f"Error, export_format should be one of {list(results_file_extensions)} or None, not '{export_format}'.")
+        self.export_format = export_format
+        self.export_compression = export_compression
+        self.export_csv = export_csv
 
 
         # Create output directories
@@ -425,16 +1050,14 @@ class ModPathWell:
         # Length of array
         len_arr = len(cell_sizes)
 
-        # Assign center points (xmid | ymid | zmid)
-        center_points = np.empty((len_arr), dtype= 'float')
+        # Assign center points (xmid | ymid | zmid): cumulative sum of the distances
+        # between neighbouring center points, (cell_sizes[idx] + cell_sizes[idx-1]) * 0.5
+        center_steps = (cell_sizes[1:] + cell_sizes[:-1]) * 0.5
         if ascending: # xmid and ymid arrays are increasing with increasing index number
-            center_points[0] = bound_list[0] + cell_sizes[0] * 0.5
-            for idx in range(1, len_arr):
-                center_points[idx] = center_points[(idx - 1)] + ((cell_sizes[(idx)] + cell_sizes[(idx - 1)]) * 0.5)  
+            center_points = np.cumsum(np.concatenate([bound_list[:1] + cell_sizes[:1] * 0.5, center_steps]))
         else: # zmid arrays are decreasing with increasing index number
-            center_points[0] = bound_list[0] - cell_sizes[0] * 0.5
-            for idx in range(1, len_arr):
-                center_points[idx] = center_points[(idx - 1)] - ((cell_sizes[(idx)] + cell_sizes[(idx - 1)]) * 0.5)  
+            center_points = np.cumsum(np.concatenate([bound_list[:1] - cell_sizes[:1] * 0.5, -center_steps]))
+        center_points = center_points.astype('float')
 
         return len_arr, cell_sizes, center_points, bound_list
 
@@ -548,10 +1171,43 @@ class ModPathWell:
             self.bound_bot: str = "bot"
             self.bound_north: str = "ymin"  # not required for axisymmetric or 2D model
             self.bound_south: str = "ymax"  # not required for axisymmetric or 2D model  
+
+            The index slab of each region is rasterized once and cached on the instance
+            (keyed on the region boundaries and the model grid), so that
+            repeated calls for the same region (e.g. per parameter grid) are lookups.
+
             # Return boundary indices of row and columns plus parameter value
             return layidx_min,layidx_max,rowidx_min,rowidx_max,colidx_min,colidx_max                
         '''
-        
+
+        region = schematisation[dict_key][dict_subkey]
+        # Region boundaries (None if absent) and model grid determine the index slab
+        bound_keys = [self.bound_left, self.bound_right, self.bound_top,
+                      self.bound_bot, self.bound_north, self.bound_south]
+        grid_key = tuple(np.asarray(getattr(self, iAttr), dtype = 'float').tobytes() \
+                            for iAttr in ["xmid","ymid","zmid","top","bot"])
+        slab_key = (self.model_type, grid_key,
+                    tuple((iKey in region, region.get(iKey)) for iKey in bound_keys))
+        try:
+            hash(slab_key)
+        except TypeError:
+            # Unhashable boundary values: rasterize without cache
+            return self._rasterize_region(schematisation, dict_key = dict_key, dict_subkey = dict_subkey)
+
+        if not hasattr(self, "_region_slabs"):
+            self._region_slabs = {}
+        if slab_key not in self._region_slabs:
+            self._region_slabs[slab_key] = self._rasterize_region(schematisation, dict_key = dict_key,
+                                                                  dict_subkey = dict_subkey)
+
+        return self._region_slabs[slab_key]
+
+    def _rasterize_region(self, schematisation: dict, dict_key: str = "None",
+                          dict_subkey: str = "None"):
+        ''' Return the index slab (layidx_min,layidx_max,rowidx_min,rowidx_max,
+        colidx_min,colidx_max) of region schematisation[dict_key][dict_subkey],
+        see cell_bounds. '''
+
         # Loop through schematisation keys (dict_keys)
         iDict = dict_key
         # Use subkeys of schematisation dictionary
@@ -608,17 +1264,25 @@ class ModPathWell:
 
     def assign_material(self,schematisation: dict,
                         dict_keys: dict or None = None):
-        ''' Assign grid material using subkeys in schematisation_dict.'''
+        ''' Assign grid material using subkeys in schematisation_dict.
+
+        The material grid is stored as integer codes ('self.material_codes')
+        with lookup table 'self.material_table' (code --> subkey name; code 0
+        refers to cells without material: None). The (read-only) attribute
+        'self.material' returns the grid of subkey names.'''
 
         if schematisation is None:
             schematisation = getattr(self,"schematisation_dict")
 
-        # dtype of material grid
-        dtype = 'object'  # to assign a string without length limitation
         if dict_keys is None:
             dict_keys = [iDict for iDict in self.schematisation_dict.keys()]
 
-        self.material = np.empty((self.nlay,self.nrow,self.ncol), dtype = dtype)
+        # Lookup table (code --> material name)
+        material_table = [None]
+        # dtype of material grid (smallest integer type holding all subkeys)
+        dtype = np.min_scalar_type(sum([len(schematisation[iDict]) for iDict in dict_keys]))
+
+        self.material_codes = np.zeros((self.nlay,self.nrow,self.ncol), dtype = dtype)
         # Loop through schematisation keys (dict_keys)
         for iDict in dict_keys:
             # Loop through subkeys of schematisation dictionary
@@ -637,20 +1301,76 @@ class ModPathWell:
                 except Exception as e:
                     # print(e,"Continue.")
                     continue
-                # Fill grid with parameter value 'parm_val'
+                # Fill grid with (code of) material 'iDict_sub' if no material is assigned yet
                 if not None in [layidx_min,layidx_max,colidx_min,colidx_max]:
+                    if iDict_sub not in material_table:
+                        material_table.append(iDict_sub)
 
-                    self.material[layidx_min: layidx_max,\
-                        rowidx_min: rowidx_max,\
-                        colidx_min: colidx_max][self.material[layidx_min: layidx_max,\
+                    material_slab = self.material_codes[layidx_min: layidx_max,\
                         rowidx_min: rowidx_max,\
-                        colidx_min: colidx_max] == None] = iDict_sub
+                        colidx_min: colidx_max]
+                    material_slab[material_slab == 0] = material_table.index(iDict_sub)
                     
         if self.model_type in ["axisymmetric","2D"]:
                 # In 2D model or axisymmetric models an 
                 # inactive row is added to be able to run Modpath successfully.
-                self.material[:,1,:] = self.material[:,0,:]
+                self.material_codes[:,1,:] = self.material_codes[:,0,:]
+
+        self.material_table = np.array(material_table, dtype = 'object')
+
+    def _encode_grid(self, grid):
+        ''' Return the integer codes and lookup table (code --> value) of the
+        (object) grid 'grid'. Code 0 refers to cells without value (None). '''
+
+        codes, uniques = pd.factorize(np.asarray(grid, dtype = 'object').ravel())
+        table = np.array([None] + list(uniques), dtype = 'object')
+        codes = (codes + 1).astype(np.min_scalar_type(len(table))).reshape(np.shape(grid))
+
+        return codes, table
+
+    def _add_category(self, parameter, name):
+        ''' Return the code of 'name' in the lookup table of the integer-coded
+        grid 'parameter' ('material' or 'redox'), adding 'name' to the table if absent. '''
 
+        table = getattr(self, parameter + "_table")
+        if name not in list(table):
+            table = np.append(table, np.array([name], dtype = 'object'))
+            self._update_property(property = parameter + "_table", value = table)
+            # Make sure the dtype of the codes can hold the new code
+            self._update_property(property = parameter + "_codes",
+                                  value = getattr(self, parameter + "_codes").astype(np.min_scalar_type(len(table))))
+
+        return list(table).index(name)
+
+    def get_category_grid(self, parameter = "material"):
+        ''' Return the integer-coded grid 'parameter' ('material' or 'redox')
+        as (object) array of names, decoded from 'self.<parameter>_codes'
+        using lookup table 'self.<parameter>_table'. '''
+
+        return getattr(self, parameter + "_table")[getattr(self, parameter + "_codes")]
+
+    def get_category_codes(self, names, parameter = "material"):
+        ''' Return the codes in lookup table 'self.<parameter>_table' of the
+        names 'names' [list]. Names which do not occur in the table are skipped. '''
+
+        return [iCode for iCode, iName in enumerate(getattr(self, parameter + "_table")) if iName in names]
+
+    @property
+    def material(self):
+        ''' Material grid as (object) array of subkey names (read-only),
+        decoded from 'self.material_codes'. The grid is decoded on each access
+        (a new array of the size of the grid): use 'self.material_codes' (and
+        get_category_codes) in loops. '''
+
+        return self.get_category_grid("material")
+
+    @property
+    def redox(self):
+        ''' Redox grid as (object) array of redox names (read-only),
+        decoded from 'self.redox_codes'. The grid is decoded on each access
+        (a new array of the size of the grid): use 'self.redox_codes' in loops. '''
+
+        return self.get_category_grid("redox")
 
     def axisym_correction(self, grid: np.array,
                           dtype: str or None = None, theta = 2 * np.pi):
@@ -665,8 +1385,8 @@ class ModPathWell:
         # Create empty numpy grid    
         grid_axi = np.zeros((self.nlay,self.nrow,self.ncol), dtype = dtype)
         if (self.nrow == 1) | (self.nrow == 2):
-            for iCol in range(self.ncol):
-                grid_axi[:,:,iCol] = theta * self.xmid[iCol] * grid[:,:,iCol]
+            # Multiply each column by theta * xmid
+            grid_axi[:,:,:] = (theta * np.asarray(self.xmid))[np.newaxis,np.newaxis,:] * grid
 
         return grid_axi
 
@@ -712,19 +1432,19 @@ class ModPathWell:
             dict_keys = [iDict for iDict in self.schematisation_dict.keys()]
        
         
+        # Any region with parameter 'parameter'
+        parameter_found = False
         # Loop through schematisation keys (dict_keys)
         for iDict in dict_keys:
             # Loop through subkeys of schematisation dictionary
             for iDict_sub in schematisation[iDict]:   
                 
                 if parameter in schematisation[iDict][iDict_sub]:
+                    parameter_found = True
 
-
-
-                    # try:
                     # Obtain parameter value
                     parm_val = schematisation[iDict][iDict_sub][parameter]
-                    # Obtain cell boundary limits
+                    # Obtain cell boundary limits (cached index slab)
                     layidx_min,layidx_max,\
                         rowidx_min,rowidx_max,\
                         colidx_min,colidx_max = self.cell_bounds(schematisation,
@@ -736,10 +1456,11 @@ class ModPathWell:
                         grid[layidx_min: layidx_max,\
                             rowidx_min: rowidx_max,\
                             colidx_min: colidx_max] = parm_val
-                    if self.model_type in ["axisymmetric","2D"]:
-                        # In 2D model or axisymmetric models an 
-                        # inactive row is added to be able to run Modpath successfully.
-                        grid[:,1,:] = grid[:,0,:]
+
+        if parameter_found and self.model_type in ["axisymmetric","2D"]:
+            # In 2D model or axisymmetric models an 
+            # inactive row is added to be able to run Modpath successfully.
+            grid[:,1,:] = grid[:,0,:]
   
         # Return the filled grid                
         return grid
@@ -903,7 +1624,13 @@ class ModPathWell:
                                 parameter = iParm,
                                 grid = unitgrid,
                                 dtype = dict_keys[1])
-            self._update_property(property = iParm, value = grid)
+            if dict_keys[1] in ["object"]:
+                # Store as integer codes with lookup table (e.g. 'redox_codes', 'redox_table')
+                codes, table = self._encode_grid(grid)
+                self._update_property(property = iParm + "_codes", value = codes)
+                self._update_property(property = iParm + "_table", value = table)
+            else:
+                self._update_property(property = iParm, value = grid)
 
             
 
@@ -912,15 +1639,14 @@ class ModPathWell:
         self.assign_material(schematisation = self.schematisation_dict,
                             dict_keys = ["geo_parameters","ibound_parameters","well_parameters"])
 
+        # Cells with a material which does not occur in "geo_parameters"
+        non_geo_cells = ~np.isin(self.material_codes,
+                                 self.get_category_codes(list(self.schematisation_dict["geo_parameters"].keys())))
+        self.hk[non_geo_cells] = 999.
+        self.vani[non_geo_cells] = 999.
+        self.redox_codes[non_geo_cells] = self._add_category("redox", "anoxic")
+
         # Create (uncorrected) array for kv ("vka"), using "kh" and "vani" (vertical anisotropy)
-        for iLay in range(self.nlay):
-            for iRow in range(self.nrow):
-                for iCol in range(self.ncol):
-                    # Check if material occurs in "geo_parameters"
-                    if self.material[iLay,iRow,iCol] not in self.schematisation_dict["geo_parameters"].keys():
-                        self.hk[iLay,iRow,iCol] = 999.
-                        self.vani[iLay,iRow,iCol] = 999.
-                        self.redox[iLay,iRow,iCol] = "anoxic"
 
         # Vertical conductivity [m/d]
         self.vka = self.hk / self.vani
@@ -1642,6 +2368,53 @@ class ModPathWell:
 
         return self.travel_time_unsaturated, self.travel_distance_unsaturated
 
+    def _cell_top_bot(self):
+        ''' Return the top and bottom elevation of all grid cells,
+        both as an array of shape (nlay,nrow,ncol). '''
+
+        grid_shape = (self.nlay,self.nrow,self.ncol)
+        bot = np.asarray(self.bot, dtype = 'float')
+        if bot.ndim == 1:
+            bot = bot[:,np.newaxis,np.newaxis]
+        cell_bot = np.broadcast_to(bot, grid_shape)
+        # The top of a cell equals the bottom of the overlying cell (model top for the first layer)
+        cell_top = np.concatenate([np.broadcast_to(np.asarray(self.top, dtype = 'float'), (1,) + grid_shape[1:]),
+                                   cell_bot[:-1]], axis = 0)
+
+        return cell_top, cell_bot
+
+    def get_water_table(self):
+        ''' Return the groundwater level (nrow,ncol), based on the head
+        in the uppermost active (ibound != 0) and wetted cell per column:
+
+        - confined layer (laytyp == 0): top of the cell
+        - unconfined layer: the head, limited to the top of the cell
+          (top of the cell if the head lies below the cell bottom)
+        - no active and wetted cell: model top
+        '''
+
+        head = np.asarray(self.head_mf)
+        cell_top, cell_bot = self._cell_top_bot()
+
+        # Uppermost active and wetted cell
+        is_wet = (np.asarray(self.ibound) != 0) & ~(abs(head) > 0.9 * abs(self.head_dry))
+        has_wet = is_wet.any(axis = 0)
+        lay_wet = is_wet.argmax(axis = 0)[np.newaxis]
+
+        head_wet = np.take_along_axis(head, lay_wet, axis = 0)[0]
+        top_wet = np.take_along_axis(cell_top, lay_wet, axis = 0)[0]
+        bot_wet = np.take_along_axis(cell_bot, lay_wet, axis = 0)[0]
+        is_confined = np.asarray(self.laytyp)[lay_wet[0]] == 0
+
+        # gw level equals top of the cell (confined, or head below cell bottom),
+        # or else the head limited to the top of the cell
+        gw_level = np.where(is_confined | (head_wet < bot_wet), top_wet,
+                            np.where(head_wet > top_wet, top_wet, head_wet))
+        # Columns without active and wetted cells: model top
+        gw_level = np.where(has_wet, gw_level, np.zeros((self.nrow,self.ncol), dtype = 'float') + self.top)
+
+        return gw_level
+
     def _create_diffuse_particles(self, recharge_parameters = None,
                                                    nparticles_cell: int = 1,
                                                    localy=0.5, localx=0.5,
@@ -1830,47 +2603,8 @@ class ModPathWell:
             if gw_level_release:
                 if gw_level is None:
                     try:
-
-                        # groundwater level array (initially assume starting points at model top)
-                        self.gw_level = np.zeros((self.nrow,self.ncol), dtype = 'float') + self.top
-                        for iRow in range(self.nrow):
-                            for iCol in range(self.ncol):
-                                for iLay in range(self.nlay):
-                                    # Check for active cells
-                                    if self.ibound[iLay,iRow,iCol] == 0:
-                                        continue
-
-                                    # Check for uppermost active and wetted cell
-                                    elif abs(self.head_mf[iLay,iRow,iCol]) > 0.9 * abs(self.head_dry):
-                                        continue
-                                    else:
-                                        # Check if layer is confined
-                                        if self.laytyp[iLay] == 0:
-                                            # Gw level equals top of this cell
-                                            if iLay == 0:
-                                                self.gw_level[iRow,iCol] = self.top
-                                            else:
-                                                self.gw_level[iRow,iCol] = self.bot[iLay-1]
-                                        else:
-                                            # Check for gw_level value above bottom of active cell (for non-dry unconfined cells)
-                                            if self.head_mf[iLay,iRow,iCol] < self.bot[iLay]:
-                                                # gwlevel equals top of active (confined) cell
-                                                if iLay == 0:
-                                                    self.gw_level[iRow,iCol] = self.top
-                                                else:
-                                                    self.gw_level[iRow,iCol] = self.bot[iLay-1]
-                                            elif (iLay == 0) & (self.head_mf[iLay,iRow,iCol] > self.top):
-                                                # Set gwlevel to model top (top of confining layer)
-                                                self.gw_level[iRow,iCol] = self.top
-                                            elif (iLay > 0) & (self.head_mf[iLay,iRow,iCol] > self.bot[iLay-1]):
-                                                # Set max gw level to top of confining layer)
-                                                self.gw_level[iRow,iCol] = self.bot[iLay-1]
-                                            else:
-                                                # gw level equals head in active cell
-                                                    self.gw_level[iRow,iCol] = self.head_mf[iLay,iRow,iCol]
-
-                                        # go to next row, col combination
-                                        break
+                        # groundwater level array (uppermost active and wetted cell)
+                        self.gw_level = self.get_water_table()
                     except:
                         self.gw_level = np.zeros((self.nrow,self.ncol), dtype = 'float') + self.top
                 else:
@@ -1880,61 +2614,47 @@ class ModPathWell:
                 # self.gw_level[self.gw_level > self.bot[0]] = self.bot[0]
                 # self.gw_level[self.gw_level > self.top] = self.top
 
+                # Release cells (row, col) of the particle group
+                release_rows, release_cols = [iIdx.ravel() for iIdx in np.meshgrid(np.arange(rowidx_min,rowidx_max+1),
+                                                                                     np.arange(colidx_min,colidx_max+1),
+                                                                                     indexing = 'ij')]
+                gw_level_cells = np.asarray(self.gw_level)[release_rows,release_cols]
                 # layers in which particles are being released
-                layers = []
-                for iRow in range(rowidx_min,rowidx_max+1):
-                    for iCol in range(colidx_min,colidx_max+1):
-                        xyz_point = (self.xmid[iCol],self.ymid[iRow],self.gw_level[iRow,iCol])
-                        layers.append(self.xyz_to_layrowcol(xyz_point = xyz_point, decimals = 5)[0])
+                layers, _, _ = self.xyz_to_node_indices(xyz = np.column_stack([self.xmid[release_cols],
+                                                                               self.ymid[release_rows],
+                                                                               gw_level_cells]),
+                                                        decimals = 5)
                 # localz = (gw_level-bot)/(top-bot)
-                localz_release = []
-                idx_count = -1
-                for iRow in range(rowidx_min,rowidx_max+1):
-                    for iCol in range(colidx_min,colidx_max+1):
-                        idx_count += 1
-                        if layers[idx_count] == 0:
-                            localz_release.append((self.gw_level[iRow,iCol] - self.bot[0]) / \
-                                            (self.top - self.bot[0]))
-                        else:
-                            localz_release.append((self.gw_level[iRow,iCol] - self.bot[layers[idx_count]]) / \
-                                            (self.bot[layers[idx_count]-1] - self.bot[layers[idx_count]]))
-
-            idx_count = -1
-            for iRow in range(rowidx_min,rowidx_max+1):
-                for iCol in range(colidx_min,colidx_max+1):
-                    
-                    # Keep track of index
-                    idx_count += 1   
-                    
-                    # Particle row
-                    p_row = iRow
-                    # Particle layer
-                    p_lay = layers[idx_count]
-                    # Particle column
-                    p_col = iCol
-                    # check for active cell
-                    if self.ibound[p_lay,p_row,p_col] == 0:
-                        continue
-                    
-                    # locations for reading output in modpath model
-                    self.pg_nodes[iPG].append((p_lay,p_row,p_col))
-                    # for iPart_cell in range(nparticles_cell):
-                    
-                    # Add particle locations (lay,row,col)
-                    self.part_locs[iPG].append((p_lay,p_row,p_col))                    
-                    # Relative location of the particles in the cells
-                    self.localx[iPG].append(localx) #(iPart_cell + 0.5)/(float(nparticles_cell)))
-                    self.localy[iPG].append(localy)
-                    self.localz[iPG].append(localz_release[idx_count])
-                    # particle count
-                    self.pcount += 1 
-                    self.pids[iPG].append(self.pcount)
-
-                    # flowline_type: diffuse_source (or point_source)
-                    self.flowline_type[self.pcount] = 'diffuse_source'  
-
-                    # Particle starting concentration   
-                    self.inputconc_particle[self.pcount] = recharge_parameters.get(iPG).get("input_concentration")     
+                cell_top, cell_bot = self._cell_top_bot()
+                top_release = cell_top[layers,release_rows,release_cols]
+                bot_release = cell_bot[layers,release_rows,release_cols]
+                localz_release = (gw_level_cells - bot_release) / (top_release - bot_release)
+
+            # check for active cells
+            is_active = np.asarray(self.ibound)[layers,release_rows,release_cols] != 0
+            nr_particles = int(is_active.sum())
+            part_locs = list(zip(layers[is_active].tolist(), release_rows[is_active].tolist(),
+                                 release_cols[is_active].tolist()))
+
+            # locations for reading output in modpath model
+            self.pg_nodes[iPG] += part_locs
+            # Add particle locations (lay,row,col)
+            self.part_locs[iPG] += part_locs
+            # Relative location of the particles in the cells
+            self.localx[iPG] += [localx] * nr_particles
+            self.localy[iPG] += [localy] * nr_particles
+            self.localz[iPG] += localz_release[is_active].tolist()
+            # particle ids (continue particle count)
+            pids = list(range(self.pcount + 1, self.pcount + 1 + nr_particles))
+            self.pcount += nr_particles
+            self.pids[iPG] += pids
+
+            for pid in pids:
+                # flowline_type: diffuse_source (or point_source)
+                self.flowline_type[pid] = 'diffuse_source'  
+
+                # Particle starting concentration   
+                self.inputconc_particle[pid] = recharge_parameters.get(iPG).get("input_concentration")     
 
             # Particle distribution package - particle allocation
             #modpath.mp7particledata.Part...
@@ -2322,44 +3042,127 @@ class ModPathWell:
             nodes.append(iLay * self.nrow * self.ncol + iRow * self.ncol + iCol)
         return nodes
 
+    def _grid_edges(self, decimals = 3):
+        ''' Return the (rounded) lower and upper cell boundaries per axis,
+        as used by 'xyz_to_node_indices'. The boundaries are cached per number
+        of decimals and recomputed once the discretisation (xmid, ymid, zmid,
+        delr, delc, delv) changes.
+
+        Returns
+        -------
+        grid_edges: dict
+            {"x": (xmin_arr, xmax_arr), "y": (ymin_arr, ymax_arr), "z": (zmin_arr, zmax_arr)}
+        '''
+        grid_arrays = [np.asarray(getattr(self, iAttr), dtype = 'float') for iAttr in \
+                        ["xmid","delr","ymid","delc","zmid","delv"]]
+
+        cache = getattr(self, "_grid_edges_cache", None)
+        if cache is None or len(cache["grid_arrays"]) != len(grid_arrays) or \
+                not all(np.array_equal(iArr, jArr) for iArr, jArr in zip(cache["grid_arrays"], grid_arrays)):
+            cache = {"grid_arrays": [iArr.copy() for iArr in grid_arrays], "edges": {}}
+            self._grid_edges_cache = cache
+
+        if decimals not in cache["edges"]:
+            xmid, delr, ymid, delc, zmid, delv = grid_arrays
+            # min and max arrays in X-direction
+            xmin_arr = np.round(np.append(xmid[0] - 0.5 * delr[0], xmid[:-1] + 0.5 * delr[:-1]), decimals)
+            xmax_arr = np.round(xmid + 0.5 * delr, decimals)
+            # min and max arrays in Y-direction
+            ymin_arr = np.round(ymid - 0.5 * delc, decimals)
+            ymax_arr = np.round(np.append(ymid[0] + 0.5 * delc[0], ymid[:-1] - 0.5 * delc[:-1]), decimals)
+            # min and max arrays in Z-direction
+            zmin_arr = np.round(zmid - 0.5 * delv, decimals)
+            zmax_arr = np.round(np.append(zmid[0] + 0.5 * delv[0], zmid[:-1] - 0.5 * delv[:-1]), decimals)
+
+            cache["edges"][decimals] = {"x": (xmin_arr, xmax_arr),
+                                        "y": (ymin_arr, ymax_arr),
+                                        "z": (zmin_arr, zmax_arr)}
+
+        return cache["edges"][decimals]
+
+    @staticmethod
+    def _locate_in_bounds(values, min_arr, max_arr, chunksize = 2**16):
+        ''' Return the index of the first cell for which min_arr < value <= max_arr.
+        Values outside of all (half-open) cells fall back to the first cell for
+        which min_arr <= value <= max_arr. Values outside of the grid get index -1.
+
+        Contiguous cell boundaries (ascending or descending) are searched
+        with np.searchsorted; any other layout is compared cell by cell.
+        '''
+        values = np.asarray(values, dtype = 'float')
+        ncells = len(min_arr)
+        index = np.full(len(values), -1, dtype = 'int')
+
+        ascending = (ncells > 0) and np.all(max_arr > min_arr) and np.array_equal(min_arr[1:], max_arr[:-1])
+        descending = (ncells > 0) and np.all(max_arr > min_arr) and np.array_equal(max_arr[1:], min_arr[:-1])
+
+        if ascending:
+            # First cell with max_arr >= value; valid if min_arr < value
+            idx = np.searchsorted(max_arr, values, side = 'left')
+            valid = idx < ncells
+            valid[valid] = min_arr[idx[valid]] < values[valid]
+            index[valid] = idx[valid]
+        elif descending:
+            # First cell with min_arr < value; valid if value <= max_arr
+            idx = np.searchsorted(-min_arr, -values, side = 'right')
+            valid = idx < ncells
+            valid[valid] = values[valid] <= max_arr[idx[valid]]
+            index[valid] = idx[valid]
+
+        # Cell by cell comparison: half-open cells first (if not searched yet), closed cells second
+        for lower_inclusive in ([True] if (ascending or descending) else [False, True]):
+            missing = np.flatnonzero(index == -1)
+            for iStart in range(0, len(missing), chunksize):
+                iMissing = missing[iStart:iStart + chunksize]
+                iValues = values[iMissing, None]
+                if lower_inclusive:
+                    in_cell = (iValues >= min_arr) & (iValues <= max_arr)
+                else:
+                    in_cell = (iValues > min_arr) & (iValues <= max_arr)
+                found = in_cell.any(axis = 1)
+                index[iMissing[found]] = in_cell[found].argmax(axis = 1)
+
+        return index
+
+    def xyz_to_node_indices(self, xyz, decimals = 3):
+        ''' Obtain the lay, row, col indices of an array of xyz-coordinates
+        in one call, using the (cached) cell boundaries of the model grid.
+
+        A coordinate belongs to the first cell for which min < coordinate <= max
+        (per axis), or else to the first cell for which min <= coordinate <= max.
+        Coordinates and cell boundaries are rounded to 'decimals'.
+
+        Parameters
+        ----------
+        xyz: np.array
+            Coordinates [x, y, z] of shape (N,3)
+        decimals: int
+            Number of decimals used to round coordinates and cell boundaries
+
+        Returns
+        -------
+        node_lay, node_row, node_col: np.array
+            Layer, row and column index per coordinate (int arrays of length N)
+        '''
+        xyz = np.round(np.asarray(xyz, dtype = 'float').reshape(-1,3), decimals)
+        grid_edges = self._grid_edges(decimals = decimals)
+
+        node_idx = []
+        for iAxis, iDim in zip([2,1,0],["z","y","x"]):
+            idx = self._locate_in_bounds(xyz[:,iAxis], *grid_edges[iDim])
+            if (idx == -1).any():
+                raise IndexError(f"{iDim}-coordinate(s) {xyz[idx == -1, iAxis][:5].tolist()} outside of the model grid.")
+            node_idx.append(idx)
+
+        return tuple(node_idx)
+
     def xyz_to_layrowcol(self,xyz_point, decimals = 3):
         ''' obtain lay, row, col index of an xyz_point list [x,y,z]. '''
 
-        # Round XYZ to 4 digits
-        xyz_point = [np.round(iVal,decimals) for iVal in xyz_point]
-        xyz_point
-        # min and max arrays in X-direction
-        xmin_arr = np.round(np.array([self.xmid[0] - 0.5 * self.delr[0]] + list(self.xmid[:-1] + 0.5 * self.delr[:-1])), decimals)
-        xmax_arr = np.round(self.xmid + 0.5 * self.delr, decimals)
-        # min and max arrays in Y-direction
-        ymin_arr = np.round(self.ymid - 0.5 * self.delc, decimals)
-        ymax_arr = np.round(np.array([self.ymid[0] + 0.5 * self.delc[0]] + list(self.ymid[:-1] - 0.5 * self.delc[:-1])), decimals)
-        # min and max arrays in Z-direction
-        zmin_arr = np.round(self.zmid - 0.5 * self.delv, decimals)
-        zmax_arr = np.round(np.array([self.zmid[0] + 0.5 * self.delv[0]] + list(self.zmid[:-1] - 0.5 * self.delv[:-1])), decimals)
-
-        # node layer, row, column
-        try:
-            node_lay = np.argwhere((xyz_point[2] > zmin_arr) & \
-                        (xyz_point[2] <= zmax_arr))[0][0]
-        except IndexError:
-            node_lay = np.argwhere((xyz_point[2] >= zmin_arr) & \
-                (xyz_point[2] <= zmax_arr))[0][0]
-        try:
-            node_row = np.argwhere((xyz_point[1] > ymin_arr) & \
-                        (xyz_point[1] <= ymax_arr))[0][0]
-        except IndexError:
-            node_row = np.argwhere((xyz_point[1] >= ymin_arr) & \
-                        (xyz_point[1] <= ymax_arr))[0][0]
-        try:
-            node_col = np.argwhere((xyz_point[0] > xmin_arr) & \
-                        (xyz_point[0] <= xmax_arr))[0][0]
-        except IndexError:
-            node_col = np.argwhere((xyz_point[0] >= xmin_arr) & \
-                        (xyz_point[0] <= xmax_arr))[0][0]
+        node_lay, node_row, node_col = self.xyz_to_node_indices(xyz = [xyz_point], decimals = decimals)
                         
         # Node index (lay,row,col)
-        node_idx = (node_lay,node_row,node_col)
+        node_idx = (node_lay[0],node_row[0],node_col[0])
 
         return node_idx
 
@@ -2383,15 +3186,20 @@ class ModPathWell:
 
         # Create dict for Layer, row, column indices per particle
         node_indices = {}
-        for iPart in particle_nodes:
-            # Number of nodes
-            nr_nodes = xyz_nodes[iPart].shape[0]
-    #                                    print(iPart)
-            node_indices[iPart] = []
-            for iNode in range(nr_nodes):
-                # list lay, row, col of nodes and store them in 'node_indices' dict
-                node_idx = self.xyz_to_layrowcol(xyz_point = xyz_nodes[iPart][iNode].tolist(), decimals = 3)
-                node_indices[iPart].append(node_idx)
+        if len(particle_nodes) == 0:
+            return node_indices
+        # Number of nodes per particle
+        nr_nodes = [np.asarray(xyz_nodes[iPart]).reshape(-1,3).shape[0] for iPart in particle_nodes]
+        # lay, row, col of all nodes in one call
+        node_lay, node_row, node_col = self.xyz_to_node_indices(
+                                        xyz = np.concatenate([np.asarray(xyz_nodes[iPart], dtype = 'float').reshape(-1,3) \
+                                                              for iPart in particle_nodes]),
+                                        decimals = 3)
+        node_bounds = np.cumsum(nr_nodes)[:-1]
+        for iPart, iLay, iRow, iCol in zip(particle_nodes, np.split(node_lay, node_bounds),
+                                           np.split(node_row, node_bounds), np.split(node_col, node_bounds)):
+            # list lay, row, col of nodes and store them in 'node_indices' dict
+            node_indices[iPart] = list(zip(iLay, iRow, iCol))
                 
         return node_indices
 
@@ -2441,96 +3249,189 @@ class ModPathWell:
 
         return flux_total
 
-    def read_pathlinedata(self,fpth, nodes):
+    def calc_flux_field(self, frf,flf,fff):
+        ''' Calculate the volume fluxes along the cell boundaries of all
+        grid cells in one pass, using frf, flf and fff.
+
+        Parameters
+        -----------
+
+        frf: np.array
+            flux right face (= positive to the right) [m^3 d-1]
+        
+        flf: np.array
+            flux lower face (= positive in downward direction) [m^3 d-1]
+        
+        fff: np.array
+            flux front face (= positive in 'southward' direction) [m^3 d-1]
+
+        Returns
+        -------
+        flux_field: dict of np.array (nlay,nrow,ncol)
+            - "frf", "flf", "fff": the cell-budget arrays (as read)
+            - "flux_east", "flux_west", "flux_north", "flux_south", "flux_upper",
+              "flux_lower": face components as used by calc_flux_cell
+            - "flux_total": total flux per cell, equal to calc_flux_cell
+            - "inflow_total": total inflow through the six cell faces
+            - "outflow_total": total outflow through the six cell faces
+        '''
+
+        # Cell-budget arrays (as read) and their float64 counterparts
+        cbc_arrays = {"frf": np.asarray(frf), "flf": np.asarray(flf), "fff": np.asarray(fff)}
+        frf, flf, fff = [np.asarray(iFlux, dtype = 'float') for iFlux in [frf, flf, fff]]
+
+        # Flux entering the cell from the west, north and upper neighbour (positive inflow)
+        flow_from_west = np.zeros_like(frf)
+        flow_from_west[:,:,1:] = frf[:,:,:-1]
+        flow_from_north = np.zeros_like(fff)
+        flow_from_north[:,1:,:] = fff[:,:-1,:]
+        flow_from_upper = np.zeros_like(flf)
+        flow_from_upper[1:,:,:] = flf[:-1,:,:]
+
+        # fluxes along x-direction
+        flux_east = np.maximum(0., frf)
+        flux_west = np.maximum(0., -flow_from_west)
+        # fluxes along y-direction
+        flux_south = np.maximum(0., fff)
+        flux_north = np.maximum(0., -flow_from_north)
+        # fluxes along z-direction (the upper face uses flf of the cell itself, as calc_flux_cell)
+        flux_lower = np.maximum(0., flf)
+        flux_upper = np.zeros_like(flf)
+        flux_upper[1:,:,:] = np.maximum(0., -flf[1:,:,:])
+
+        # Total flux in all directions
+        flux_total = flux_east + flux_west + flux_north + flux_south + flux_upper + flux_lower
+
+        # In- and outflow through all cell faces
+        inflow_total = np.maximum(0., flow_from_west) + np.maximum(0., -frf) + \
+                       np.maximum(0., flow_from_north) + np.maximum(0., -fff) + \
+                       np.maximum(0., flow_from_upper) + np.maximum(0., -flf)
+        outflow_total = np.maximum(0., -flow_from_west) + np.maximum(0., frf) + \
+                        np.maximum(0., -flow_from_north) + np.maximum(0., fff) + \
+                        np.maximum(0., -flow_from_upper) + np.maximum(0., flf)
+
+        flux_field = {**cbc_arrays,
+                      "flux_east": flux_east, "flux_west": flux_west,
+                      "flux_north": flux_north, "flux_south": flux_south,
+                      "flux_upper": flux_upper, "flux_lower": flux_lower,
+                      "flux_total": flux_total,
+                      "inflow_total": inflow_total, "outflow_total": outflow_total}
+
+        return flux_field
+
+    def get_flux_field(self, model_cbc = None):
+        ''' Return the flux field (see calc_flux_field) of cell budget file
+        'model_cbc' (default: self.model_cbc). The flux field is cached on the
+        instance and only recalculated if the cell budget file changes.
+        '''
+
+        # Default value for model_cbc
+        if model_cbc is None:
+            model_cbc = self.model_cbc
+
+        cbc_stat = os.stat(model_cbc)
+        cache_key = (os.path.abspath(model_cbc), cbc_stat.st_mtime_ns, cbc_stat.st_size)
+
+        if getattr(self, "_flux_field_cache", (None,))[0] != cache_key:
+            # flow right face (frf) and flow lower face (flf) (third option: flow front face)
+            frf, flf, fff = self.read_binarycbc_flow(model_cbc)
+            self._flux_field_cache = (cache_key, self.calc_flux_field(frf,flf,fff))
+
+        return self._flux_field_cache[1]
+
+    @staticmethod
+    def read_pathlinedata(fpth, nodes, batchsize = 1000):
         ''' Read pathlinedata from file fpth (extension: '.mppth'),
         given the particle release node index 'nodes' obtained from
         a tuple or list of tuples (iLay,iRow,iCol).
 
+        The pathline file is parsed once (memory-mapped, see ModPathOutputFile),
+        in batches of 'batchsize' particles. Of each batch only the records of the
+        particles passing through 'nodes' and only the fields 'particleid', 'node',
+        'x', 'y', 'z' and 'time' are kept, so the memory use is the size of these
+        records plus one batch. The records are returned as a single recarray, sorted
+        by particleid and time, and split by particleid using the index of the first
+        record of each particle.
+
         Parameters
         -----------
         fpth: str
             filepath of pathline data
-        nodes:
+        nodes: int or list of int
             Cell node indices of starting locations.
             Can be obtained using the method get_node_ID((iLay,iRow,iCol))
+        batchsize: int
+            Number of particles read at once.
         
         Returns
         -------- 
-        xyz_nodes:
-            The xyz coördinates of each node per tracked particle
-        dist: 
-            The distance between each node per tracked particle [L]
-        tdiff:
-            The travel time (difference) between each node per particle [T]
-        dist_tot: 
+        pth_data: np.recarray
+            Pathline records (fields 'particleid', 'node', 'x', 'y', 'z' and 'time')
+            with xyz-coördinates rounded to 4 decimals (duplicate records per particle removed)
+        particle_ids: np.array
+            The particle ids in pth_data (sorted)
+        particle_start: np.array
+            Index of the first record of each particle in pth_data
+        dist: np.array
+            The distance between each record and the previous record
+            of the same particle [L] (0 for the first record)
+        tdiff: np.array
+            The travel time (difference) between each record and the previous
+            record of the same particle [T] (0 for the first record)
+        dist_tot: np.array
             Total distance covered by each tracked particle [L]
-        time_tot: 
+        time_tot: np.array
             Total duration between release and ending of each particle [T]
-        pth_data: np.recarray
-            Complete recarray is returned to see what is in the file fpth.
             
         '''
 
-        pth_object = flopy.utils.PathlineFile(fpth)
-        # Raw pathline data
-        pth_data = pth_object.get_destination_pathline_data(nodes)
-        # Round rec.arrays to 3 decimals
-        for idx,iPart in enumerate(pth_data):
-            pth_data[idx]["x"] = pth_data[idx]["x"].round(4)
-            pth_data[idx]["y"] = pth_data[idx]["y"].round(4)
-            pth_data[idx]["z"] = pth_data[idx]["z"].round(4)
-
-            # # Test unique
-            # test_unique = np.unique(pth_data[idx],return_index=True, return_inverse=True, axis = 0)
-
-        time_nodes, xyz_nodes, txyz, dist, tdiff = {}, {}, {}, {}, {}
-        # number of particles within file
-        npart = len(pth_data)
-        # Numpy arrays storing the total distance traveled for each particle
-        dist_tot = np.zeros((npart), dtype = 'float')
-        # Numpy arrays storing the total travel time for each particle
-        time_tot = np.zeros((npart), dtype = 'float')
-        for idx,iPart in enumerate(pth_data):
-            # n_nodes (ruw)
-            n_nodes_raw = len(pth_data[idx]["x"])
-            # XYZ data
-            txyz[idx] = np.empty((n_nodes_raw,4), dtype = 'float')
-            txyz[idx] = np.array([pth_data[idx]["time"],
-                                pth_data[idx]["x"],
-                                pth_data[idx]["y"],
-                                pth_data[idx]["z"],
-                                ]).T
-
-            # Remove identical data (based on identical times)
-            txyz[idx] = np.unique(txyz[idx], axis = 0)
-            # time data
-            time_nodes[idx] = txyz[idx][:,0]
-            # xyz data
-            xyz_nodes[idx] = txyz[idx][:,1:]
-
-            # Determine number of remaining nodes
-            n_nodes = min(xyz_nodes[idx].shape[0],time_nodes[idx].shape[0])
-            # if xyz_nodes[idx].shape[0] != time_nodes[idx].shape[0]:
-            #     print(xyz_nodes[idx].shape[0],time_nodes[idx].shape[0])
-            #Distance array between nodes
-            dist[idx] = np.zeros((n_nodes-1), dtype = 'float')
-            
-            # Time difference array
-            tdiff[idx] = np.zeros((n_nodes-1), dtype = 'float')
-            for iNode in range(1,n_nodes):
-                # Calculate internodal distance (m)
-                dist[idx][iNode-1] = np.sqrt((xyz_nodes[idx][iNode][0] - xyz_nodes[idx][iNode-1][0])**2 + \
-                    (xyz_nodes[idx][iNode][1] - xyz_nodes[idx][iNode-1][1])**2 + \
-                    (xyz_nodes[idx][iNode][2] - xyz_nodes[idx][iNode-1][2])**2)
-                # Calculate time difference between nodes
-                tdiff[idx][iNode-1] = (time_nodes[idx][iNode] - time_nodes[idx][iNode - 1])
-                
-            # Total distance covered per particle
-            dist_tot[idx] = dist[idx].sum()
-            # Total time covered per particle
-            time_tot[idx] = time_nodes[idx][-1]
+        if np.ndim(nodes) == 0:
+            nodes = [nodes]
+        nodes = [int(iNode) for iNode in nodes]
+
+        # Fields of the pathline records that are kept
+        fields = ["particleid", "node", "x", "y", "z", "time"]
+        pth_batches = [rfn.repack_fields(np.zeros(0, dtype = ModPathOutputFile.pathline_dtype)[fields])]
+
+        # Pathline data sorted by 'particleid' and 'time'
+        # (memory-mapped file, read in batches of particles)
+        with ModPathOutputFile(fpth) as pth_object:
+            for pth_batch in pth_object.iter_data(batchsize = batchsize):
+                # Particles passing the release nodes
+                partids = np.unique(pth_batch["particleid"][np.isin(pth_batch["node"], nodes)])
+                pth_batch = pth_batch[np.isin(pth_batch["particleid"], partids)]
+                # Round rec.arrays to 4 decimals
+                for iCoord in ["x","y","z"]:
+                    pth_batch[iCoord] = pth_batch[iCoord].round(4)
+
+                # Remove identical data (based on identical times and locations)
+                duplicate = pd.DataFrame({iField: pth_batch[iField] for iField in ["particleid","x","y","z","time"]}).duplicated().values
+                pth_batches.append(rfn.repack_fields(pth_batch[~duplicate][fields]))
+        pth_data = np.concatenate(pth_batches).view(np.recarray)
+
+        # First record of each particle
+        particle_ids, particle_start = np.unique(pth_data["particleid"], return_index = True)
+        is_start = np.zeros(len(pth_data), dtype = 'bool')
+        is_start[particle_start] = True
+
+        # Distance array between nodes [m]
+        dist = np.sqrt(np.diff(pth_data["x"].astype('float'), prepend = 0.)**2 + \
+                        np.diff(pth_data["y"].astype('float'), prepend = 0.)**2 + \
+                        np.diff(pth_data["z"].astype('float'), prepend = 0.)**2)
+        dist[is_start] = 0.
+        # Time difference array
+        tdiff = np.diff(pth_data["time"].astype('float'), prepend = 0.)
+        tdiff[is_start] = 0.
+
+        # Total distance covered per particle
+        if len(pth_data) > 0:
+            dist_tot = np.add.reduceat(dist, particle_start)
+        else:
+            dist_tot = np.zeros((0), dtype = 'float')
+        # Total time covered per particle
+        time_tot = pth_data["time"][np.append(particle_start[1:], len(pth_data)) - 1].astype('float')
                         
-        return time_nodes, xyz_nodes, dist, tdiff, dist_tot, time_tot, pth_data
+        return pth_data, particle_ids, particle_start, dist, tdiff, dist_tot, time_tot
 
     # Make df_particle
     def fill_df_particle(self, particle_group,
@@ -2588,122 +3489,102 @@ class ModPathWell:
                 organic carbon fraction (foc) [-]
             solid_density: float
                 Bulk density of the material [kg / L]
+
+        df_particle_data: dict of pandas.DataFrame
+            The rows of df_particle per particle group (key)
         '''
 
         if mppth is None:
             # Use default
             mppth = os.path.join(self.workspace, self.modelname + '_mp.mppth')
 
-        # if particle_data is None:
-        # Temporary storage (dict) of particle_data
-        particle_data = {}
-        # dataframes of particle data (dict)
-        df_particle_data = {}
-        # list the particle_data dataframes
-        df_particle_list = []
+        # Pseudonyms for df_particle column names
+        colnames_df_particle = {"x": "xcoord","y":"ycoord","z":"zcoord","time":"total_travel_time","prsity_uncorr":"porosity",
+                    "solid_density": "solid_density", "fraction_organic_carbon": "fraction_organic_carbon", "redox": "redox", 
+                    "dissolved_organic_carbon":	"dissolved_organic_carbon", "pH": "pH",	"temp_water": "temp_water",
+                    "grainsize": "grainsize", "material": "zone"}
 
+        # Release nodes (and particle group) in order of release
+        release_nodes, release_pg = [], []
         for iPG in particle_group:  # use endpoint_id dict or list
-
             # Node indices to retrieve particle data
             nodes = self.get_node_ID(pg_nodes.get(iPG))
+            release_nodes += nodes
+            release_pg += [iPG] * len(nodes)
+
+        if len(release_nodes) > 0:
+            # Read pathline data (single pass over the pathline file)
+            pth_data, particle_ids, particle_start, \
+                dist_data, time_diff, dist_tot, time_tot = self.read_pathlinedata(fpth = mppth,
+                                                                                nodes = release_nodes)
+        else:
+            pth_data = []
 
-            # Nodes to retrieve
-            for id_,iNode in enumerate(nodes):
-                # print(id_,iNode)
-                # try:
+        if len(pth_data) == 0:
+            df_particle = pd.DataFrame(columns = colnames_df_particle)
+            df_particle_data = {}
+        else:
+            # Particles are ordered by the first release node they pass, then by particleid
+            release_nodes = np.array(release_nodes)
+            node_order, node_rank = np.unique(release_nodes, return_index = True)
+            record_rank = np.full(len(pth_data), len(release_nodes))
+            is_release = np.isin(pth_data["node"], node_order)
+            record_rank[is_release] = node_rank[np.searchsorted(node_order, pth_data["node"][is_release])]
+            particle_rank = np.minimum.reduceat(record_rank, particle_start)
+            particle_order = np.lexsort((particle_ids, particle_rank))
+
+            # Reorder the records, keeping the order (in time) within each particle
+            particle_pos = np.empty(len(particle_ids), dtype = 'int')
+            particle_pos[particle_order] = np.arange(len(particle_ids))
+            nr_records = np.diff(np.append(particle_start, len(pth_data)))
+            record_order = np.argsort(np.repeat(particle_pos, nr_records), kind = 'stable')
+            pth_data = pth_data[record_order]
+
+            # Check, if axisymmetric or 2D --> y should be self.ymid[0]
+            if (self.model_type == "axisymmetric") | (self.model_type == "2D"):
+                xyz = np.column_stack([pth_data["x"].round(4),
+                                       np.full(len(pth_data), np.round(self.ymid[0],4)),
+                                       pth_data["z"].round(4)])
+            else:
+                xyz = np.column_stack([pth_data["x"], pth_data["y"], pth_data["z"]])
 
+            # lay, row, col index of all nodes
+            node_lay, node_row, node_col = self.xyz_to_node_indices(xyz = xyz, decimals = 3)
+            # Use parm values for the first row in both 2D and axisymmetric models
+            if self.model_type in ["axisymmetric","2D"]:
+                node_row = np.zeros_like(node_row)
 
-                # nodes_rel[ = flopy.utils.ra_slice(m.wel.stress_period_data[0], ['k', 'i', 'j'])
-                #     nodes_well = prf.get_nodes(locs = wel_locs, nrow = nrow, ncol = ncol) # m.dis.get_node(wel_locs.tolist())
+            df_particle = pd.DataFrame({iField: pth_data[iField] for iField in ["x","y","z","time"]},
+                                        index = pd.Index(pth_data["particleid"], name = "flowline_id"))
 
-                # Read pathline data
-                time_nodes, xyz_nodes, dist_data,  \
-                time_diff, dist_tot,   \
-                time_tot, pth_data =  \
-                            self.read_pathlinedata(fpth = mppth,
-                                                nodes = iNode)
-                
-                '''                             
-                xyz_points, \    # XYZ data 
-                dist_data,  \    # Distance array between nodes
-                time_diff,  \    # Save flow duration (time_diff) of pathlines: array
-                dist_tot,   \    # Total distance covered per particle
-                time_tot,   \    # Total time covered per particle
-                pth_data =  \    # Raw pathline data
-                '''
-
-                # Check, if axisymmetric or 2D --> y should be self.ymid[0]
-                if (self.model_type == "axisymmetric") | (self.model_type == "2D"):
-                
-                    for iKey in xyz_nodes.keys():
-                        xyz_nodes[iKey] = np.array([(round(idx_[0],4),
-                                                    round(self.ymid[0],4),
-                                                    round(idx_[2],4)) for idx_ in xyz_nodes[iKey]])
-                    
-                # col, lay, row index
-                node_indices = self.get_node_indices(xyz_nodes = xyz_nodes)
-                # Particle indices
-                part_idx = [iPart for iPart in xyz_nodes]
-                # Test array travel times (days)
-                tot_time_arr = {iPart: time_diff[iPart].sum() for iPart in part_idx}
-
-                for iPart in part_idx:
-                    # Loop through converted rec.arrays of pth_data using part_idx 
-                    # Fill recarray using pathline_data
-                    particle_data[f"{iPG}-{iNode}-{iPart}"] = copy.deepcopy(pth_data[iPart][:]) # [:-1]
-                    # Export rec.arrays as pd dataframe
-                    df_particle_data[f"{iPG}-{iNode}-{iPart}"] = pd.DataFrame.from_records(data = particle_data[f"{iPG}-{iNode}-{iPart}"],
-                                                                                index = "particleid",
-                                                                                exclude = ["k"]).iloc[:,:]
-                    # Drop duplicates                                                            
-                    df_particle_data[f"{iPG}-{iNode}-{iPart}"] = df_particle_data[f"{iPG}-{iNode}-{iPart}"].drop_duplicates(
-                        subset=["x","y","z","time"], keep = 'first') 
-
-                    for iParm in parm_list:
-
-                        # Material property array
-                        material_property_arr = getattr(self,iParm)
-                        # dtype of array
-                        mat_dtype = material_property_arr.dtype
-                        # if mat_dtype == 'object':
-                        #     dtype_ = '|S20'
-                        # else:
-                        dtype_ = mat_dtype
-                            
-                        # Numpy array values
-                        # Use parm values for the first row in both 2D and axisymmetric models
-                        if self.model_type in ["axisymmetric","2D"]:
-                            parm_values = np.array([material_property_arr[idx[0],0,idx[2]] for idx in node_indices[iPart]])
-                        else: # else: Use pathline data columns
-                            parm_values = np.array([material_property_arr[idx[0],idx[1],idx[2]] for idx in node_indices[iPart]])
-
-
-                        # Append recarray to particle_data (dict of dicts of np.recarray)
-                        df_particle_data[f"{iPG}-{iNode}-{iPart}"].loc[:,iParm] = parm_values
-
-                    # Change index name of df_particle                                                           
-                    df_particle_data[f"{iPG}-{iNode}-{iPart}"].index.name = "flowline_id"
-                    # Pseudonyms for df_particle column names
-                    colnames_df_particle = {"x": "xcoord","y":"ycoord","z":"zcoord","time":"total_travel_time","prsity_uncorr":"porosity",
-                                "solid_density": "solid_density", "fraction_organic_carbon": "fraction_organic_carbon", "redox": "redox", 
-                                "dissolved_organic_carbon":	"dissolved_organic_carbon", "pH": "pH",	"temp_water": "temp_water",
-                                "grainsize": "grainsize", "material": "zone"}
-                    df_particle_data[f"{iPG}-{iNode}-{iPart}"].rename(columns = colnames_df_particle, 
-                                                                                    inplace = True, errors = "raise")
-                    df_particle_data[f"{iPG}-{iNode}-{iPart}"] = df_particle_data[f"{iPG}-{iNode}-{iPart}"].drop_duplicates(subset=["xcoord","ycoord","zcoord","total_travel_time"], keep = 'first')                                                                
-
-                    # Append dataframes
-                    df_particle_list.append(df_particle_data[f"{iPG}-{iNode}-{iPart}"])
-
-        # Concatenate df_particle dataframes ('combined')
-        if len(df_particle_list) > 0:
-            df_particle = pd.concat(df_particle_list, axis = 0, ignore_index = False) #.drop_duplicates()
-        else:
-            colnames_df_particle = {"x": "xcoord","y":"ycoord","z":"zcoord","time":"total_travel_time","prsity_uncorr":"porosity",
-                                "solid_density": "solid_density", "fraction_organic_carbon": "fraction_organic_carbon", "redox": "redox", 
-                                "dissolved_organic_carbon":	"dissolved_organic_carbon", "pH": "pH",	"temp_water": "temp_water",
-                                "grainsize": "grainsize", "material": "zone"}
-            df_particle = pd.DataFrame(columns = colnames_df_particle)
+            # Flat node indices per grid shape (all vertices of all particles)
+            node_flat = {}
+            for iParm in parm_list:
+
+                # Material property array (integer-coded grids: use the codes)
+                is_coded = hasattr(self, iParm + "_codes")
+                if is_coded:
+                    material_property_arr = getattr(self, iParm + "_codes")
+                else:
+                    material_property_arr = np.asarray(getattr(self,iParm))
+                if material_property_arr.shape not in node_flat:
+                    node_flat[material_property_arr.shape] = np.ravel_multi_index((node_lay, node_row, node_col),
+                                                                                  material_property_arr.shape)
+
+                # Gather the parm values of all nodes at once
+                parm_values = np.take(material_property_arr, node_flat[material_property_arr.shape])
+                if is_coded:
+                    # Categorical column (code 0 --> missing value)
+                    parm_values = pd.Categorical.from_codes(parm_values.astype('int') - 1,
+                                                            categories = getattr(self, iParm + "_table")[1:])
+                df_particle[iParm] = parm_values
+
+            df_particle.rename(columns = colnames_df_particle, inplace = True, errors = "raise")
+
+            # Rows per particle group (of the first release node passed by the particle)
+            particle_group_records = np.repeat(np.array(release_pg)[particle_rank[particle_order]],
+                                               nr_records[particle_order])
+            df_particle_data = {iPG: df_particle.loc[particle_group_records == iPG] for iPG in particle_group}
 
         # y-coordinate equals 0.5 * self.delc[0] in axisymmetric or 2D model
         if self.model_type in ["axisymmetric","2D"]:
@@ -2749,94 +3630,82 @@ class ModPathWell:
         if model_cbc is None:
             model_cbc = self.model_cbc
 
+        if self.trackingdirection not in ["forward","backward"]:
+            raise ValueError(f"Unknown trackingdirection '{self.trackingdirection}', use 'forward' or 'backward'.")
+
         # flowline ID as index
-        flowline_id = list(df_particle.index.unique())
+        flowline_id = df_particle.index.unique()
 
         # Column names in df_flowline
         colnames_df_flowline = ["flowline_type","flowline_discharge","particle_release_day","endpoint_id",
                         "well_discharge", "substance", "removal_function","input_concentration"]
 
-        df_flowline = pd.DataFrame(index = flowline_id, columns = colnames_df_flowline)
-        # Change df_flowline index name
-        df_flowline.index.name = "flowline_id"
-
         ## Obtain flowline discharge ##
         # flux at starting location (grid cell) divided by total flowlines starting there
 
-        # flow right face (frf) and flow lower face (flf) (third option: flow front face)
-        frf, flf, fff = self.read_binarycbc_flow(model_cbc)
-        # flux of pathlines
-        flux_pathline = {}
-        # startpoints and endpoints of flowlines
-        node_start, node_end = {}, {}
-        # startpoint and endpoint counter
-        count_startpoints, count_endpoints = {}, {}
-        # endpoint ids
-        endpoint_id = {}
-
-        # Removal function
-        df_flowline.loc[:,"removal_function"] = self.schematisation.removal_function
-        
-        for fid in flowline_id:
-            # X,Y,Z,time data per particle flowline 
-            xyzt_data = df_particle.loc[df_particle.index == fid,["xcoord","ycoord","zcoord","total_travel_time"]].sort_values(by = "total_travel_time")
-            
-            # Startpoint and endpoint (XYZ-data) of particle flowlines
-            startpoint = xyzt_data.loc[xyzt_data.total_travel_time == xyzt_data.total_travel_time.min(),
-                                        ["xcoord","ycoord","zcoord"]].values.tolist()[0]
-            endpoint = xyzt_data.loc[xyzt_data.total_travel_time == xyzt_data.total_travel_time.max(),
-                                        ["xcoord","ycoord","zcoord"]].values.tolist()[0]
-            # Nodes of start and endpoints
-            node_start[fid] = self.xyz_to_layrowcol(xyz_point = startpoint, decimals = 5)
-            node_end[fid] = self.xyz_to_layrowcol(xyz_point = endpoint, decimals = 5)
-            # Count start points in cell
-            count_startpoints[node_start[fid]] = count_startpoints.get(node_start[fid],0) + 1
-            count_endpoints[node_end[fid]] = count_endpoints.get(node_end[fid],0) + 1
-
-            # flowline_type
-            df_flowline.loc[fid,"flowline_type"] = self.flowline_type[fid]
-
-            # Starting concentration of particles
-            df_flowline.loc[fid,"input_concentration"] = self.inputconc_particle[fid]
-
-
-
-        for fid in flowline_id:
-            if self.trackingdirection == "forward":
-
-                if df_flowline.loc[fid,"flowline_type"] in ["diffuse_source",]:
-                    # starting point is used to calculate flux of pathline (flux_pathline)
-                    flux_pathline[fid] = round(self.calc_flux_cell(frf,flf,fff, loc = node_start[fid]) / \
-                                        count_startpoints[node_start[fid]],4)
-
-                elif df_flowline.loc[fid,"flowline_type"] in ["point_source",]:
-                    flux_pathline[fid] = self.point_discharge[fid]
-
-            elif self.trackingdirection == "backward":
-
-                if df_flowline.loc[fid,"flowline_type"] in ["diffuse_source"]:
-                    # endpoint is used to calculate flux of pathline
-                    flux_pathline[fid] = round(self.calc_flux_cell(frf,flf,fff, loc = node_end[fid]) / \
-                                            count_endpoints[node_end[fid]],4)
-                elif df_flowline.loc[fid,"flowline_type"] in ["point_source",]:
-                    flux_pathline[fid] = self.point_discharge[fid]
+        # Cell face fluxes: flow right face (frf), flow lower face (flf) and flow front face (fff)
+        flux_field = self.get_flux_field(model_cbc)
+        frf, flf, fff = flux_field["frf"], flux_field["flf"], flux_field["fff"]
+        # Total flux per grid cell (see calc_flux_cell)
+        flux_grid = flux_field["flux_total"]
+
+        # Startpoint (first record with the minimum travel time) and
+        # endpoint (first record with the maximum travel time) of the particle flowlines
+        xyzt_data = df_particle[["xcoord","ycoord","zcoord","total_travel_time"]]
+        time_groups = xyzt_data["total_travel_time"].groupby(level = 0, sort = False)
+        startpoints = xyzt_data.loc[(xyzt_data["total_travel_time"] == time_groups.transform("min")).values]
+        startpoints = startpoints[~startpoints.index.duplicated(keep = 'first')].reindex(flowline_id)
+        endpoints = xyzt_data.loc[(xyzt_data["total_travel_time"] == time_groups.transform("max")).values]
+        endpoints = endpoints[~endpoints.index.duplicated(keep = 'first')].reindex(flowline_id)
+
+        # Nodes of start and endpoints (flat node indices)
+        grid_shape = (self.nlay, self.nrow, self.ncol)
+        node_start = np.ravel_multi_index(self.xyz_to_node_indices(startpoints[["xcoord","ycoord","zcoord"]].values,
+                                                                   decimals = 5), grid_shape)
+        node_end = np.ravel_multi_index(self.xyz_to_node_indices(endpoints[["xcoord","ycoord","zcoord"]].values,
+                                                                 decimals = 5), grid_shape)
+        # Count start and end points per cell
+        count_startpoints = np.bincount(node_start, minlength = flux_grid.size)
+        count_endpoints = np.bincount(node_end, minlength = flux_grid.size)
+
+        # flowline_type and starting concentration of particles
+        flowline_type = np.array([self.flowline_type[fid] for fid in flowline_id], dtype = 'object')
+        input_concentration = [self.inputconc_particle[fid] for fid in flowline_id]
+
+        # flux of pathlines: starting point (forward) or endpoint (backward) is used 
+        # to calculate flux of diffuse_source pathlines
+        if self.trackingdirection == "forward":
+            node_flux, count_flux = node_start, count_startpoints
+        else:
+            node_flux, count_flux = node_end, count_endpoints
+        flux_pathline = np.full(len(flowline_id), np.nan)
+        is_diffuse = flowline_type == "diffuse_source"
+        flux_pathline[is_diffuse] = np.round(flux_grid.ravel()[node_flux[is_diffuse]] / \
+                                             count_flux[node_flux[is_diffuse]], 4)
+        is_point = flowline_type == "point_source"
+        flux_pathline[is_point] = [self.point_discharge[fid] for fid in flowline_id[is_point]]
 
-          # endpoint id
-            endpoint_id[fid] = self.material[node_end[fid][0],node_end[fid][1],node_end[fid][2]]
+        # endpoint id
+        endpoint_id = self.material_table[np.take(self.material_codes, node_end)]
 
         # fill flowline_df
-        for fid in flowline_id:
-            df_flowline.loc[fid,"flowline_discharge"] = flux_pathline[fid]
-            df_flowline.loc[fid,"endpoint_id"] = endpoint_id[fid]
-
+        df_flowline = pd.DataFrame({"flowline_type": flowline_type,
+                                    "flowline_discharge": flux_pathline,
+                                    "endpoint_id": endpoint_id,
+                                    "removal_function": self.schematisation.removal_function,
+                                    "input_concentration": input_concentration},
+                                    index = pd.Index(flowline_id, name = "flowline_id"),
+                                    columns = colnames_df_flowline).astype('object')
+
+        well_discharge = {}
         for end_id in df_flowline["endpoint_id"].unique():
-            # well (=endpoint) discharge (using cbc-file)       
-            well_discharge = round(abs(frf[(self.material == end_id) & (self.ibound != 0)]).sum() + \
-                                    abs(flf[(self.material == end_id) & (self.ibound != 0)]).sum() + \
-                                    abs(fff[(self.material == end_id) & (self.ibound != 0)]).sum(), 4)
+            # well (=endpoint) discharge (using cbc-file)
+            is_endpoint = np.isin(self.material_codes, self.get_category_codes([end_id])) & (self.ibound != 0)
+            well_discharge[end_id] = round(abs(frf[is_endpoint]).sum() + \
+                                    abs(flf[is_endpoint]).sum() + \
+                                    abs(fff[is_endpoint]).sum(), 4)
             
-            # well_discharge = df_flowline.loc[df_flowline.endpoint_id == end_id,"flowline_discharge"].astype('float').values.sum()
-            df_flowline.loc[df_flowline.endpoint_id == end_id,"well_discharge"] = well_discharge
+        df_flowline["well_discharge"] = df_flowline["endpoint_id"].map(well_discharge).astype('object')
 
         return df_flowline
 
@@ -2920,10 +3789,49 @@ class ModPathWell:
             if self.schematisation_type in ["phreatic"]:
                 self.calc_traveltime_vadose_analytical(vadose_parameters = self.schematisation_dict["vadose_parameters"])
 
-        # Add travel time from time difference
-        for fid in self.df_particle.index.unique():
-            self.df_particle.loc[fid,"travel_time"] = np.array([0.] + list(self.df_particle.loc[fid,"total_travel_time"].values - self.df_particle.loc[fid,"total_travel_time"].shift(1).values)[1:])
+        # Add travel time from time difference (with the previous record of the same flowline)
+        particle_store = ParticleStore.from_df_particle(self.df_particle, columns = ["total_travel_time"])
+        self.df_particle["travel_time"] = particle_store.to_df_order(particle_store.diff("total_travel_time")).astype('float')
             
+        # Save df_particle and df_flowline
+        self._save_results()
+
+    def _run_metadata(self):
+        ''' Return the metadata of the model run (dict), saved with df_flowline and df_particle. '''
+        return {"schematisation_type": self.schematisation_type,
+                "modelname": self.modelname,
+                "workspace": self.workspace,
+                "mf_exe": self.mf_exe,
+                "mp_exe": self.mp_exe,
+                "trackingdirection": self.trackingdirection,
+                "run_options": {iAttr: getattr(self, iAttr, None) for iAttr in ["xll", "yll", "perlen", "nstp", "nper", "steady"]},
+                "success_mf": getattr(self, "success_mf", None),
+                "success_mp": getattr(self, "success_mp", None),
+                "schematisation": self.schematisation_dict,
+                "export_time": datetime.datetime.now().isoformat()}
+
+    def _save_results(self):
+        ''' Save df_particle and df_flowline (and the run metadata) in the results directory (dstroot),
+        in 'export_format' (see write_results) and as csv files if 'export_csv' is True.
+        Without pyarrow the dataframes are saved as csv files instead of 'export_format'. '''
+
+        export_csv = self.export_csv
+        if self.export_format is not None:
+            if pa is None:
+                warnings.warn("pyarrow is not installed: df_flowline and df_particle are saved as csv files " + \
+                               f"instead of {self.export_format} format (pip install sutra2[arrow]).")
+                export_csv = True
+            else:
+                write_results(df_flowline = self.df_flowline, df_particle = self.df_particle,
+                              dstroot = self.dstroot, name = self.schematisation_type,
+                              file_format = self.export_format, compression = self.export_compression,
+                              metadata = self._run_metadata())
+        if export_csv:
+            self._save_df_csv()
+
+    def _save_df_csv(self):
+        ''' Save df_particle and df_flowline (csv) in the results directory (dstroot). '''
+
         # df_particle file name
         particle_fname = os.path.join(self.dstroot,self.schematisation_type + "_df_particle.csv")
         # Save df_particle
@@ -2961,15 +3869,15 @@ class ModPathWell:
 
         # Keep track of minimum line distance between pathlines ('line_dist')
         xmin_plot = 0.
-        # Flowline IDs
-        flowline_ID = list(df_particle.index.unique())
-        for fid in flowline_ID:
+        # Records per flowline
+        particle_store = ParticleStore.from_df_particle(df_particle, columns = ["xcoord","zcoord","total_travel_time"])
+        for iFlowline in range(particle_store.nr_flowlines):
 
-            x_points = df_particle.loc[df_particle.index == fid, "xcoord"].values
-#           y_points = df_particle.loc[df_particle.index == fid, "ycoord"].values
-            z_points = df_particle.loc[df_particle.index == fid, "zcoord"].values
+            x_points = particle_store.segment(iFlowline, "xcoord")
+#           y_points = particle_store.segment(iFlowline, "ycoord")
+            z_points = particle_store.segment(iFlowline, "zcoord")
             # Cumulative travel times
-            time_points = df_particle.loc[df_particle.index == fid, "total_travel_time"].values
+            time_points = particle_store.segment(iFlowline, "total_travel_time")
 
             # Plot every 'line_dist' number of meters one line
             if trackingdirection == "forward":
@@ -3187,19 +4095,19 @@ class ModPathWell:
             if not dict_key in vadose_parameters.keys():
                 dict_key = vadose_parameters.keys()[0] # Pick first available key in vadose_parameters
 
+            # Records per flowline (in the order of df_particle.index.unique())
+            particle_store = ParticleStore.from_df_particle(self.df_particle,
+                                                columns = ["xcoord","ycoord","zcoord"])
+
             # Create distance array from df_particle if relevant 'vadose_parameters' exist
-            distance_xy = np.zeros((len(self.df_particle.index.unique()),3), dtype = 'float')
+            distance_xy = np.zeros((particle_store.nr_flowlines,3), dtype = 'float')
+            # xcoord and ycoord of the first record of each flowline
+            distance_xy[:,0] = particle_store.first("xcoord")
+            distance_xy[:,1] = particle_store.first("ycoord")
 
             # Obtain gw_levels from df_particle if relevant 'vadose_parameters' exist
-            gw_level_particles = np.zeros((len(self.df_particle.index.unique())), dtype = 'float')
-            for iRow,pid in enumerate(self.df_particle.index.unique()):
-
-                # xcoord
-                distance_xy[iRow,0] = self.df_particle.loc[pid,"xcoord"].iloc[0]
-                # ycoord
-                distance_xy[iRow,1] = self.df_particle.loc[pid,"ycoord"].iloc[0]
-                # gw_level [assuming particles start at groundwater level]
-                gw_level_particles[iRow] = self.df_particle.loc[pid,"zcoord"].iloc[0]
+            # gw_level [assuming particles start at groundwater level]
+            gw_level_particles = particle_store.first("zcoord").astype('float')
 
             #### MOVE TO: section 'create_modpath_packages', so before pathline simulation to determine depth vadose zone boundary (start of particles) ####
 
@@ -3237,9 +4145,11 @@ class ModPathWell:
             df_phreatic.loc[df_index,"zcoord"] = np.array([vadose_parameters[dict_key]['top']] * len(flowline_id))
             # first record no time passed; shift other time values in dataframe afterwards
             df_phreatic.loc[df_index,"total_travel_time"] = np.array([0.] * len(flowline_id))  
-            for iRow,pid in enumerate(self.df_particle.index.unique()):
-                # shift travel times with unsaturated zone traveltime
-                self.df_particle.loc[pid,"total_travel_time"] = self.df_particle.loc[pid,"total_travel_time"] + self.travel_time_unsaturated[iRow] 
+            # shift travel times with unsaturated zone traveltime (of the flowline of each record),
+            # keeping the dtype of 'total_travel_time'
+            total_travel_time = self.df_particle["total_travel_time"].values
+            self.df_particle["total_travel_time"] = total_travel_time + \
+                        particle_store.to_df_order(particle_store.broadcast(self.travel_time_unsaturated)).astype(total_travel_time.dtype)
 
             # Fill arrays to add to df_particle
             df_phreatic.loc[df_index,"porosity"] = np.array([vadose_parameters[dict_key]['porosity']] * len(flowline_id))
@@ -3252,13 +4162,37 @@ class ModPathWell:
             df_phreatic.loc[df_index,"grainsize"] = np.array([vadose_parameters[dict_key]['grainsize']] * len(flowline_id))
             df_phreatic.loc[df_index,"zone"] = np.array(['vadose_zone'] * len(flowline_id))
             
+            # Categorical columns (e.g. 'redox', 'zone'): add the vadose zone records with the
+            # same categories (the values of the vadose zone are added to the categories)
+            for iColumn in df_cols:
+                if (iColumn in self.df_particle.columns) and isinstance(self.df_particle[iColumn].dtype, pd.CategoricalDtype):
+                    categories = self.df_particle[iColumn].cat.categories
+                    new_categories = [iValue for iValue in pd.unique(df_phreatic[iColumn]) if iValue not in categories]
+                    self.df_particle[iColumn] = self.df_particle[iColumn].cat.add_categories(new_categories)
+                    df_phreatic[iColumn] = pd.Categorical(df_phreatic[iColumn],
+                                                          categories = self.df_particle[iColumn].cat.categories)
+
             # Append records to df_particle dataframe 
-            self.df_particle = self.df_particle.append(df_phreatic)
+            self.df_particle = pd.concat([self.df_particle, df_phreatic])
 
             # sort by 'flowline_id' (=index) and 'time'
             self.df_particle = self.df_particle.sort_values(['flowline_id', 'total_travel_time','xcoord'], ascending = [True,True,False])
 
 
+    def _cache_key(self, xll, yll, perlen, nstp, nper, steady):
+        ''' Return the cache key of a model run (see run_model): the schematisation,
+        executables, run options and the options of the model that change the model files. '''
+        run_options = {"xll": xll, "yll": yll, "perlen": perlen, "nstp": nstp,
+                       "nper": nper, "steady": steady,
+                       "trackingdirection": self.trackingdirection,
+                       # Schematisation keys of the grid boundaries (see make_discretisation)
+                       "bound_left": self.bound_left, "bound_right": self.bound_right,
+                       "bound_top": self.bound_top, "bound_bot": self.bound_bot,
+                       "bound_north": self.bound_north, "bound_south": self.bound_south}
+        return self.cache.key(schematisation_dict = self.schematisation_dict,
+                              mf_exe = self.mf_exe, mp_exe = self.mp_exe,
+                              run_options = run_options)
+
     def run_model(self,
                     # simulation_parameters: dict or None = None,
                     xll = 0., yll = 0., perlen:dict or float or int = 365.*50, 
@@ -3271,9 +4205,20 @@ class ModPathWell:
             - "Semi-confined"
             - "Recharge basin (BAR)"
             - "River bank filtration (RBF)"
-            Currently (13-7-2021) only the Phreatic schematisation is supported.'''
+            Currently (13-7-2021) only the Phreatic schematisation is supported.
+
+            With a run cache (see ModPathRunCache) an identical model run is restored
+            from the cache. The model input files are still written (create_modflow_input)
+            before the lookup, only the modflow and modpath runs and the post-processing
+            are skipped.'''
 
         # print(self.schematisation)
+        # Cache key of the model run (before the schematisation is modified)
+        cache_key = None
+        if (self.cache is not None) & run_mfmodel & run_mpmodel:
+            cache_key = self._cache_key(xll = xll, yll = yll, perlen = perlen, nstp = nstp,
+                                        nper = nper, steady = steady)
+
         # Run modflow model (T/F)
         self.run_mfmodel = run_mfmodel
         # Run modpath model (T/F)
@@ -3337,6 +4282,18 @@ class ModPathWell:
 
         #### 29-11-'21: generalize the code based on required modflow_packages
         self.create_modflow_input()
+
+        # Restore model files and results of an identical model run
+        if cache_key is not None:
+            cache_results = self.cache.get(key = cache_key, workspace = self.workspace, modelname = self.modelname)
+            if cache_results is not None:
+                for iAttr in ["success_mf", "success_mp", "head_mf", "df_flowline", "df_particle"]:
+                    setattr(self, iAttr, cache_results[iAttr])
+                self.mppth = os.path.join(self.workspace, self.modelname + '_mp.mppth')
+                self._save_results()
+                print("modelrun of type", self.schematisation_type, "restored from cache.")
+                return
+
         if self.run_mfmodel:
 
             # Run modflow model
@@ -3359,6 +4316,246 @@ class ModPathWell:
             self._export_to_df(mppth = self.mppth)
             print("Post-processing modpathrun completed.")
 
+            # Store model files and results of a succesful model run
+            if (cache_key is not None) and self.success_mf and self.success_mp:
+                self.cache.put(key = cache_key, workspace = self.workspace, modelname = self.modelname,
+                               results = {iAttr: getattr(self, iAttr) for iAttr in \
+                                          ["success_mf", "success_mp", "head_mf", "df_flowline", "df_particle"]})
+
+
+
+def _run_sweep_job(run_id, schematisation, workspace, modelname, model_kwargs, run_kwargs, conn):
+    ''' Run a single ModPathWell model of a ModPathWellSweep (in a separate process),
+    and send the results (dict) through connection 'conn'. '''
+
+    if hasattr(os, "setsid"):
+        # New process group: the solvers (subprocesses) are stopped together with the job
+        os.setsid()
+
+    result = {"run_id": run_id, "workspace": workspace, "success_mf": False, "success_mp": False,
+              "error": None, "df_flowline": None, "df_particle": None}
+    stdout = io.StringIO()
+    start_time = time.time()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stdout):
+            model = ModPathWell(schematisation, workspace = workspace, modelname = modelname, **model_kwargs)
+            result["dstroot"] = model.dstroot
+            model.run_model(**run_kwargs)
+        result["success_mf"] = getattr(model, "success_mf", False)
+        result["success_mp"] = getattr(model, "success_mp", False)
+        result["df_flowline"] = getattr(model, "df_flowline", None)
+        result["df_particle"] = getattr(model, "df_particle", None)
+    except Exception as e:
+        result["error"] = repr(e)
+    result["runtime"] = time.time() - start_time
+    result["stdout"] = stdout.getvalue()
+
+    conn.send(result)
+    conn.close()
+
+
+class ModPathWellSweep():
+    """ Run many ModPathWell models (e.g. a parameter sweep or uncertainty analysis)
+    concurrently, each in a separate process with its own temporary workspace.
+
+    Attributes
+    ----------
+    schematisations: dict
+        Schematisation per run (keys: run_id), HydroChemicalSchematisation objects
+        or schematisation dictionaries, see ModPathWell.
+    runs: pandas.DataFrame
+        Parameters per run (indexed by 'run_id'), only if the sweep is created
+        with 'from_grid'.
+    results: pandas.DataFrame
+        Results per run (indexed by 'run_id'): 'success_mf', 'success_mp', 'error'
+        (None, the exception raised or 'timeout'), 'runtime' [s], 'workspace' and
+        'stdout' (captured output of the run).
+    df_flowline: pandas.DataFrame
+        df_flowline of all runs, indexed by ('run_id', flowline_id).
+    df_particle: pandas.DataFrame
+        df_particle of all runs, indexed by ('run_id', flowline_id).
+        df_particle.loc[run_id] has the layout of ModPathWell.df_particle.
+    """
+
+    def __init__(self, schematisations, workspace: str or None = None, modelname: str = "sweep",
+                 max_workers: int or None = None, timeout: float or None = None,
+                 keep_workspace: bool = False, **model_kwargs):
+        '''
+        Initialize the ModPathWellSweep object.
+
+        Parameters
+        ----------
+        schematisations: list or dict
+            Schematisations (HydroChemicalSchematisation objects or schematisation
+            dictionaries) to run. The run_id is the key (dict) or the list index (list).
+        workspace: str
+            Directory in which the temporary workspace of each run is created
+            (default: the system temp directory).
+        modelname: str
+            Modelname used for each run.
+        max_workers: int
+            Maximum number of concurrent runs (default: number of cpu's).
+        timeout: float
+            Maximum runtime per run [s]; runs exceeding the timeout are stopped (default: None).
+        keep_workspace: bool
+            Keep the workspace of each run after the run (True) or remove it (False).
+        model_kwargs:
+            Keyword arguments of ModPathWell (e.g. 'mf_exe', 'mp_exe', 'trackingdirection').
+        '''
+
+        if isinstance(schematisations, dict):
+            self.schematisations = dict(schematisations)
+        elif isinstance(schematisations, (list, tuple)):
+            self.schematisations = dict(enumerate(schematisations))
+        else:
+            raise TypeError('Error, schematisations should be a list or dict of schematisations.')
+
+        if workspace is None:
+            workspace = tempfile.gettempdir()
+        self.workspace = workspace
+        self.modelname = modelname
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError(f'Error, max_workers should be >= 1, not {max_workers}.')
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.keep_workspace = keep_workspace
+        self.model_kwargs = model_kwargs
+
+    @classmethod
+    def from_grid(cls, parameter_grid: dict, schematisation_kwargs: dict or None = None, **kwargs):
+        '''
+        Create a ModPathWellSweep for all combinations of the parameter values in
+        'parameter_grid'. Each combination is used to create a HydroChemicalSchematisation
+        (computation_method 'modpath').
+
+        Parameters
+        ----------
+        parameter_grid: dict
+            Values (list) per parameter of the HydroChemicalSchematisation,
+            e.g. {'well_discharge': [-5000., -7500.], 'recharge_rate': [0.0008, 0.001]}.
+        schematisation_kwargs: dict
+            Parameters of the HydroChemicalSchematisation used for all runs.
+        kwargs:
+            Keyword arguments of ModPathWellSweep.
+        '''
+
+        if schematisation_kwargs is None:
+            schematisation_kwargs = {}
+        parameter_names = list(parameter_grid.keys())
+        runs = pd.DataFrame(list(itertools.product(*[parameter_grid[iParm] for iParm in parameter_names])),
+                            columns = parameter_names)
+        runs.index.name = 'run_id'
+
+        schematisations = {}
+        for run_id, parameters in runs.iterrows():
+            schematisation = HydroChemicalSchematisation(**{"computation_method": "modpath",
+                                                            **schematisation_kwargs, **parameters.to_dict()})
+            schematisation.make_dictionary()
+            schematisations[run_id] = schematisation
+
+        sweep = cls(schematisations, **kwargs)
+        sweep.runs = runs
+
+        return sweep
+
+    def _stop_job(self, process):
+        ''' Stop the process of a run (and its solvers). '''
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(process.pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+        process.terminate()
+        process.join()
+
+    def run(self, **run_kwargs):
+        '''
+        Run all models, at most 'max_workers' at a time, and collect the results
+        in the attributes 'results', 'df_flowline' and 'df_particle'.
+
+        Parameters
+        ----------
+        run_kwargs:
+            Keyword arguments of ModPathWell.run_model (e.g. 'run_mfmodel', 'perlen').
+        '''
+
+        os.makedirs(self.workspace, exist_ok = True)
+        context = multiprocessing.get_context()
+
+        results = {}
+        pending = list(self.schematisations.keys())
+        # running jobs: connection --> (run_id, process, workspace, start time)
+        running = {}
+
+        while pending or running:
+            # Start new jobs
+            while pending and len(running) < self.max_workers:
+                run_id = pending.pop(0)
+                workspace = tempfile.mkdtemp(prefix = f"{self.modelname}_{run_id}_", dir = self.workspace)
+                conn_parent, conn_child = context.Pipe(duplex = False)
+                process = context.Process(target = _run_sweep_job,
+                                          args = (run_id, self.schematisations[run_id], workspace, self.modelname,
+                                                  self.model_kwargs, run_kwargs, conn_child),
+                                          daemon = True)
+                process.start()
+                conn_child.close()
+                running[conn_parent] = (run_id, process, workspace, time.time())
+
+            # Wait for finished jobs (or the first timeout)
+            wait_time = None
+            if self.timeout is not None:
+                wait_time = max(0., min([start_time + self.timeout for _, _, _, start_time in running.values()]) - time.time())
+            for conn in multiprocessing.connection.wait(list(running.keys()), timeout = wait_time):
+                run_id, process, workspace, start_time = running.pop(conn)
+                try:
+                    results[run_id] = conn.recv()
+                except EOFError:
+                    # Process ended without sending results
+                    results[run_id] = {"run_id": run_id, "workspace": workspace, "success_mf": False,
+                                       "success_mp": False, "error": "process ended unexpectedly",
+                                       "runtime": time.time() - start_time, "stdout": ""}
+                conn.close()
+                process.join()
+
+            # Stop jobs exceeding the timeout
+            if self.timeout is not None:
+                for conn, (run_id, process, workspace, start_time) in list(running.items()):
+                    if time.time() - start_time >= self.timeout:
+                        running.pop(conn)
+                        self._stop_job(process)
+                        conn.close()
+                        results[run_id] = {"run_id": run_id, "workspace": workspace, "success_mf": False,
+                                           "success_mp": False, "error": "timeout",
+                                           "runtime": time.time() - start_time, "stdout": ""}
+
+        self._collect_results(results)
+
+        if not self.keep_workspace:
+            for iResult in results.values():
+                # dstroot ('results' dir) may be located outside of the workspace
+                for iDir in [iResult["workspace"], iResult.get("dstroot")]:
+                    if iDir is not None:
+                        shutil.rmtree(iDir, ignore_errors = True)
+
+    def _collect_results(self, results):
+        ''' Combine the results per run in the attributes 'results', 'df_flowline' and 'df_particle'. '''
+
+        run_ids = [run_id for run_id in self.schematisations if run_id in results]
+        self.results = pd.DataFrame([{iKey: results[run_id].get(iKey) for iKey in \
+                                        ["success_mf", "success_mp", "error", "runtime", "workspace", "stdout"]} \
+                                        for run_id in run_ids],
+                                    index = pd.Index(run_ids, name = 'run_id'))
+
+        for df_name in ["df_flowline", "df_particle"]:
+            dfs = {run_id: results[run_id][df_name] for run_id in run_ids \
+                    if results[run_id].get(df_name) is not None}
+            if len(dfs) > 0:
+                df = pd.concat(dfs, names = ['run_id'])
+            else:
+                df = pd.DataFrame(index = pd.MultiIndex.from_arrays([[], []], names = ['run_id', 'flowline_id']))
+            setattr(self, df_name, df)
 
 
 #%%  
@@ -0,0 +1,297 @@
+#%% ----------------------------------------------------------------------------
+# Columnar particle store
+#
+# Stores the particle records of 'df_particle' (indexed by flowline_id) as
+# contiguous numpy columns, sorted by flowline, with an array of offsets per
+# flowline (compressed sparse row layout). Per-flowline operations (first/last
+# record, difference with the previous record, sum per flowline) are done as
+# segmented array operations instead of 'df_particle.loc[flowline_id, column]'
+# lookups in a loop over the flowlines.
+# ------------------------------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+
+class ParticleStore():
+    """ Columnar (compressed sparse row) store of the particle records of df_particle.
+
+    The records of each flowline are stored contiguously, in the order of the first
+    record of each flowline in df_particle; the order of the records within a flowline
+    is kept. The records of flowline 'i' are the positions offsets[i]:offsets[i + 1]
+    of each column.
+
+    Attributes
+    ----------
+    flowline_id: numpy.ndarray
+        Identifier of each flowline (nr_flowlines).
+    offsets: numpy.ndarray
+        Start position of the records of each flowline, and the number of
+        records as last value (nr_flowlines + 1).
+    counts: numpy.ndarray
+        Number of records per flowline (nr_flowlines).
+    columns: dict
+        Values per column (numpy.ndarray, nr_particles). Columns with strings
+        (e.g. 'redox', 'zone') are stored as integer codes (-1: missing value).
+    categories: dict
+        Values of the integer codes of the columns with strings.
+    dtypes: dict
+        The dtype of each column in df_particle.
+    order: numpy.ndarray or None
+        Position in df_particle of each record of the store,
+        None if the flowlines of df_particle are contiguous already.
+    index_name: str
+        Name of the index of df_particle.
+    """
+
+    def __init__(self, flowline_id, offsets, columns: dict,
+                categories: dict or None = None, dtypes: dict or None = None,
+                order = None, index_name: str or None = 'flowline_id'):
+        '''
+        Initialization of the ParticleStore class, see ParticleStore.from_df_particle
+        to create the store from a df_particle dataframe.
+
+        Parameters
+        ----------
+        flowline_id: array
+            Identifier of each flowline.
+        offsets: array
+            Start position of the records of each flowline, and the number of records as last value.
+        columns: dict
+            Values per column (array with a value for each record).
+        categories: dict
+            Values of the integer codes, for the columns stored as codes.
+        dtypes: dict
+            The dtype of each column in df_particle (default: dtype of the array).
+        order: array or None
+            Position in df_particle of each record of the store (None: same order).
+        index_name: str
+            Name of the index of df_particle.
+        '''
+
+        self.flowline_id = np.asarray(flowline_id)
+        self.offsets = np.asarray(offsets, dtype = 'int64')
+        if (len(self.offsets) != len(self.flowline_id) + 1) or (self.offsets[0] != 0) or np.any(np.diff(self.offsets) < 0):
+            raise ValueError('Error, the offsets should start at 0 and increase, with a value for each flowline plus the number of records.')
+        self.counts = np.diff(self.offsets)
+        self.nr_flowlines = len(self.flowline_id)
+        self.nr_particles = int(self.offsets[-1])
+
+        self.columns = {}
+        for iColumn, iValues in columns.items():
+            iValues = np.asarray(iValues)
+            if len(iValues) != self.nr_particles:
+                raise ValueError(f'Error, column {iColumn} has {len(iValues)} values instead of {self.nr_particles}.')
+            self.columns[iColumn] = iValues
+        self.categories = {} if categories is None else dict(categories)
+        self.dtypes = {iColumn: iValues.dtype for iColumn, iValues in self.columns.items()}
+        if dtypes is not None:
+            self.dtypes.update({iColumn: iDtype for iColumn, iDtype in dtypes.items() if iColumn in self.columns})
+        self.order = None if order is None else np.asarray(order)
+        self.index_name = index_name
+
+    @classmethod
+    def from_df_particle(cls, df_particle: pd.DataFrame, columns: list or None = None,
+                        flowline_column: str or None = None):
+        '''
+        Create the store from df_particle.
+
+        Parameters
+        ----------
+        df_particle: pandas.DataFrame
+            Particle records, indexed by flowline_id (or with the flowline_id in 'flowline_column').
+        columns: list
+            Columns of df_particle to store (default: all columns).
+        flowline_column: str or None
+            Column with the flowline_id, default (None): the index of df_particle.
+
+        Returns
+        -------
+        ParticleStore
+        '''
+
+        if columns is None:
+            columns = list(df_particle.columns)
+        if flowline_column is None:
+            flowline_values = df_particle.index.values
+            index_name = df_particle.index.name
+        else:
+            flowline_values = df_particle[flowline_column].values
+            index_name = flowline_column
+
+        # Flowlines in order of their first record
+        codes, flowline_id = pd.factorize(flowline_values)
+        if np.any(codes < 0):
+            raise ValueError('Error, df_particle contains records without flowline_id.')
+        counts = np.bincount(codes, minlength = len(flowline_id))
+        offsets = np.zeros(len(flowline_id) + 1, dtype = 'int64')
+        np.cumsum(counts, out = offsets[1:])
+
+        # Sort the records by flowline (stable: keeps the order of the records per flowline)
+        order = None
+        if np.any(np.diff(codes) < 0):
+            order = np.argsort(codes, kind = 'stable')
+
+        store_columns, categories, dtypes = {}, {}, {}
+        for iColumn in columns:
+            iSeries = df_particle[iColumn]
+            dtypes[iColumn] = iSeries.dtype
+            if isinstance(iSeries.dtype, pd.CategoricalDtype):
+                values = iSeries.cat.codes.values
+                categories[iColumn] = np.asarray(iSeries.cat.categories, dtype = 'object')
+            elif (iSeries.dtype == 'object') and (pd.api.types.infer_dtype(iSeries.values, skipna = True) == 'string'):
+                values, iCategories = pd.factorize(iSeries.values)
+                values = values.astype('int8' if len(iCategories) < 2**7 else 'int32')
+                categories[iColumn] = np.asarray(iCategories, dtype = 'object')
+            else:
+                values = iSeries.values
+            if order is not None:
+                values = values[order]
+            store_columns[iColumn] = np.ascontiguousarray(values)
+
+        return cls(flowline_id = np.asarray(flowline_id), offsets = offsets, columns = store_columns,
+                    categories = categories, dtypes = dtypes, order = order, index_name = index_name)
+
+    def __len__(self):
+        return self.nr_particles
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def values(self, column: str):
+        ''' Return the values of 'column' for each record (the strings for columns stored as codes). '''
+        values = self.columns[column]
+        if column in self.categories:
+            # Last value: missing values (code -1)
+            return np.append(self.categories[column], [None])[values]
+        return values
+
+    def set_values(self, column: str, values):
+        ''' Add (or replace) 'column' with 'values' for each record, in the order of the store. '''
+        values = np.asarray(values)
+        if len(values) != self.nr_particles:
+            raise ValueError(f'Error, column {column} has {len(values)} values instead of {self.nr_particles}.')
+        self.columns[column] = values
+        self.dtypes[column] = values.dtype
+        self.categories.pop(column, None)
+
+    def segment(self, position: int, column: str):
+        ''' Return the values of 'column' for the records of the flowline at 'position'
+        (view of the column, no copy). '''
+        values = self.columns[column][self.offsets[position]:self.offsets[position + 1]]
+        if column in self.categories:
+            return np.append(self.categories[column], [None])[values]
+        return values
+
+    def flowline_position(self):
+        ''' Return the position of the flowline of each record. '''
+        return np.repeat(np.arange(self.nr_flowlines), self.counts)
+
+    def broadcast(self, values):
+        ''' Return the 'values' per flowline (nr_flowlines) for each record. '''
+        return np.repeat(np.asarray(values), self.counts)
+
+    def first(self, column: str):
+        ''' Return the value of 'column' of the first record of each flowline
+        (missing value for flowlines without records). '''
+        return self._take(column, self.offsets[:-1])
+
+    def last(self, column: str):
+        ''' Return the value of 'column' of the last record of each flowline
+        (missing value for flowlines without records). '''
+        return self._take(column, self.offsets[1:] - 1)
+
+    def _take(self, column, positions):
+        values = self.values(column)
+        has_records = self.counts > 0
+        if has_records.all():
+            return values[positions]
+        result = np.full(self.nr_flowlines, np.nan, dtype = 'float' if values.dtype.kind in 'fiub' else 'object')
+        result[has_records] = values[positions[has_records]]
+        return result
+
+    def diff(self, column: str, first_value = 0.):
+        ''' Return the difference of 'column' with the previous record of the same
+        flowline, 'first_value' for the first record of each flowline. '''
+        values = self.columns[column]
+        difference = np.empty(self.nr_particles, dtype = np.result_type(values.dtype, 'float'))
+        difference[1:] = values[1:] - values[:-1]
+        difference[self.offsets[:-1][self.counts > 0]] = first_value
+        return difference
+
+    def sum(self, column: str or None = None, values = None):
+        ''' Return the sum of 'column' (or 'values' in the order of the store, with the records
+        along the last axis) per flowline, missing values count as 0. The records are added
+        in order (as the builtin sum of the records of each flowline), without padding the
+        flowlines to the same number of records. '''
+        if values is None:
+            values = self.columns[column]
+        values = np.nan_to_num(np.asarray(values, dtype = 'float'), nan = 0.)
+        flowline_position = self.flowline_position()
+        # np.bincount adds the weights of each bin in the order of the records
+        rows = values.reshape(int(np.prod(values.shape[:-1])), self.nr_particles)
+        total = np.empty((rows.shape[0], self.nr_flowlines))
+        for iRow in range(rows.shape[0]):
+            total[iRow] = np.bincount(flowline_position, weights = rows[iRow], minlength = self.nr_flowlines)
+        return total.reshape(values.shape[:-1] + (self.nr_flowlines,))
+
+    def to_df_order(self, values):
+        ''' Return 'values' (in the order of the store, records along the last axis)
+        in the order of the records of df_particle. '''
+        values = np.asarray(values)
+        if self.order is None:
+            return values
+        result = np.empty_like(values)
+        result[..., self.order] = values
+        return result
+
+    def to_store_order(self, values):
+        ''' Return 'values' (in the order of the records of df_particle, records along
+        the last axis) in the order of the store. '''
+        values = np.asarray(values)
+        if self.order is None:
+            return values
+        return values[..., self.order]
+
+    def df_position(self):
+        ''' Return the position in df_particle of each record of the store. '''
+        return np.arange(self.nr_particles) if self.order is None else self.order
+
+    def to_df_particle(self, columns: list or None = None, df_order: bool = False):
+        '''
+        Convert the store to a df_particle dataframe, indexed by flowline_id.
+
+        Parameters
+        ----------
+        columns: list
+            Columns to include (default: all columns).
+        df_order: bool
+            Return the records in the order of the original df_particle (True)
+            or sorted by flowline (False).
+
+        Returns
+        -------
+        df_particle: pandas.DataFrame
+        '''
+        if columns is None:
+            columns = list(self.columns)
+
+        data = {}
+        # Position in the store of each record of df_particle
+        inverse = np.argsort(self.order) if (df_order and self.order is not None) else None
+        for iColumn in columns:
+            dtype = self.dtypes[iColumn]
+            if isinstance(dtype, pd.CategoricalDtype):
+                values = pd.Categorical.from_codes(self.columns[iColumn], dtype = dtype)
+            elif iColumn in self.categories:
+                values = self.values(iColumn)
+            else:
+                values = self.columns[iColumn].astype(dtype, copy = False)
+            if inverse is not None:
+                values = values.take(inverse)
+            data[iColumn] = values
+
+        flowline_id = self.broadcast(self.flowline_id)
+        if df_order:
+            flowline_id = self.to_df_order(flowline_id)
+        return pd.DataFrame(data, index = pd.Index(flowline_id, name = self.index_name))
@@ -31,6 +31,7 @@ import numpy as np
 import pandas as pd
 import os
 import sys
+import copy
 from pandas import read_csv
 from pandas import read_excel
 import math
@@ -45,6 +46,7 @@ from datetime import timedelta
 
 from sutra2.Analytical_Well import AnalyticalWell 
 from sutra2.ModPath_Well import ModPathWell
+from sutra2.Particle_Store import ParticleStore
 
 # from Analytical_Well import AnalyticalWell
 # from ModPath_functions import ModPathWell
@@ -54,6 +56,65 @@ from sutra2.ModPath_Well import ModPathWell
 
 path = os.getcwd()  # path of working directory
 
+#%% ----------------------------------------------------------------------------
+# OMP removal functions, used by Transport (one substance, arrays per particle) and
+# TransportBatch (substance parameters as (nr_substances, 1) arrays, results as
+# (nr_substances, nr_particles) arrays)
+# ------------------------------------------------------------------------------
+
+def _Koc_temperature_correction(log_Koc, temp_water, temp_correction_Koc):
+    ''' Return the Koc corrected for temperature (Equation 3.1 in TRANSATOMIC report,
+    from Luers and Ten Hulscher (1996)) if 'temp_correction_Koc', otherwise log_Koc.
+    Zero for a log_Koc of zero. '''
+    log_Koc = np.broadcast_to(log_Koc, np.broadcast(log_Koc, temp_water).shape)
+    # (all log_Koc zero: no correction, keep the dtype of log_Koc)
+    if temp_correction_Koc and (log_Koc != 0).any():
+        Koc_temperature_correction = 10 ** log_Koc * 10 ** (1913 * (1 / (temp_water + 273.15) - 1 / (20 + 273.15)))
+    else:
+        Koc_temperature_correction = log_Koc.copy()
+    # if log_Koc is zero, assign value of zero
+    Koc_temperature_correction[log_Koc == 0] = 0
+    return Koc_temperature_correction
+
+def _omp_half_life_temperature_correction(omp_half_life, temp_water, temp_correction_halflife):
+    ''' Return the OMP half-life corrected for temperature (Equation 3.2 in TRANSATOMIC
+    report, R = 8.314 J/K/mol, Ea = activation energy = 63*10^3 J/mol) if
+    'temp_correction_halflife', otherwise the half-life. Persistent OMP (half-life 1e99) stay 1e99. '''
+    if temp_correction_halflife:
+        omp_half_life_temperature_corrected = omp_half_life * 10 ** (-63000 / (2.303 * 8.314) * (1 / (20 + 273.15) - 1 / (temp_water + 273.15)))
+    else:
+        omp_half_life_temperature_corrected = omp_half_life.copy()
+    is_persistent = omp_half_life == 1e99
+    if is_persistent.any():
+        omp_half_life_temperature_corrected = np.where(is_persistent, 1e99, omp_half_life_temperature_corrected)
+    return omp_half_life_temperature_corrected
+
+def _retardation(pH, pKa, solid_density, porosity, fraction_organic_carbon,
+                 dissolved_organic_carbon, Koc_temperature_correction, biodegradation_sorbed_phase):
+    ''' Return the retardation of the OMP due to sorption and biodegradation
+    (Equation 4.8-4.10 in TRANSATOMIC report), 1 without 'biodegradation_sorbed_phase'. '''
+    if not biodegradation_sorbed_phase:
+        return 1
+    #0.2 -> fraction of binding sites supplied by DOC which bind the OMP
+    #and prevent sortion to aquifer
+    return (1 + (1 / (1 + 10 ** (pH - pKa)) * solid_density
+                    * (1 - porosity)
+                    * fraction_organic_carbon * Koc_temperature_correction)
+            / (porosity * (1 + (Koc_temperature_correction * 1 / (1 + 10 ** (pH - pKa))
+                                                    * 0.2 * dissolved_organic_carbon * 0.000001))))
+
+def _input_concentration_infiltration(Koc_temperature_correction, dissolved_organic_carbon_infiltration_water,
+                                      total_organic_carbon_infiltration_water):
+    ''' Return the input concentration [%] after degradation prior to infiltration,
+    for the Koc (temperature corrected) of the OMP, or None if the DOC and TOC
+    of the infiltration water are not given. '''
+    DOC_inf = dissolved_organic_carbon_infiltration_water
+    TOC_inf = total_organic_carbon_infiltration_water
+    if DOC_inf and TOC_inf > 0:
+        DOC_TOC_ratio = DOC_inf / TOC_inf
+        return 100 - 100 * (1 - (DOC_TOC_ratio + (1 - DOC_TOC_ratio) / (1 + Koc_temperature_correction * TOC_inf  * 0.000001)))
+    return None
+
 class MicrobialOrganism:
     ''' 
     Placeholder class which will later be replaced by the QSAR functionality of AquaPriori ?!
@@ -478,9 +539,10 @@ class Transport():
         
         # well: AnalyticalWell or Modpath_Well object
         self.well = well
-        # Load input dataframes
-        self.df_particle = well.df_particle
-        self.df_flowline = well.df_flowline
+        # Load input dataframes: (shallow) copies which share the data of the well,
+        # the results are added as new columns and the well is not modified
+        self.df_particle = well.df_particle.copy(deep = False)
+        self.df_flowline = well.df_flowline.copy(deep = False)
 
         # pollutant properties (Substance or MicrobialOrganism)
         self.pollutant = pollutant
@@ -518,7 +580,7 @@ class Transport():
         if self.omp_initialized:
             pass
         else:
-            self.df_particle['omp_half_life'] = self.df_particle['redox'].map(self.removal_parameters['omp_half_life'])
+            self.df_particle['omp_half_life'] = self._map_redox_parameter('omp_half_life')
             self.df_particle['log_Koc'] = self.removal_parameters['log_Koc']
             self.df_particle['pKa'] = self.removal_parameters['pKa']
 
@@ -531,14 +593,31 @@ class Transport():
         if self.micro_organism_initialized:
             pass
         else:
-            self.df_particle['mu1'] = self.df_particle['redox'].map(self.removal_parameters['mu1'])
-            self.df_particle['alpha0'] = self.df_particle['redox'].map(self.removal_parameters['alpha0'])
-            self.df_particle['pH0'] = self.df_particle['redox'].map(self.removal_parameters['pH0'])
+            self.df_particle['mu1'] = self._map_redox_parameter('mu1')
+            self.df_particle['alpha0'] = self._map_redox_parameter('alpha0')
+            self.df_particle['pH0'] = self._map_redox_parameter('pH0')
             # Add "organism_diam" to df_flowline (is independent of node)
             self.df_flowline['organism_diam'] = self.removal_parameters['organism_diam']
 
         self.micro_organism_initialized = True
 
+    def _map_redox_parameter(self, parameter):
+        ''' Return the (redox dependent) removal parameter 'parameter' per record
+        of df_particle, using the dict per redox condition in self.removal_parameters.
+        For a categorical (integer-coded) 'redox' column the values are gathered
+        per category code; other redox columns are mapped per record.
+        '''
+        redox = self.df_particle['redox']
+        parameter_per_redox = self.removal_parameters[parameter]
+
+        if isinstance(redox.dtype, pd.CategoricalDtype):
+            # Parameter value per category (last value: missing redox, code -1)
+            category_values = np.array([parameter_per_redox.get(iRedox, np.nan) for iRedox in redox.cat.categories] + [np.nan],
+                                        dtype = 'float')
+            return pd.Series(category_values[redox.cat.codes.values], index = redox.index)
+        else:
+            return redox.map(parameter_per_redox)
+
     #@Steven_todo, @MartinK: include in a function (used for both omp_removal as well as mbo removal)     
     def _contamination_date_vs_well_abstraction(self):
         # reduce the amount of text per line by extracting the following parameters
@@ -578,16 +657,14 @@ class Transport():
             Column 'retardation': float
 
         '''
-        #0.2 -> fraction of binding sites supplied by DOC which bind the OMP
-        #and prevent sortion to aquifer
-        if self.well.schematisation.biodegradation_sorbed_phase:
-            self.df_particle['retardation'] = (1 + (1 / (1 + 10 ** (self.df_particle.pH - self.df_particle.pKa)) * self.df_particle.solid_density
-                            * (1 - self.df_particle.porosity)
-                            * self.df_particle.fraction_organic_carbon * self.df_particle.Koc_temperature_correction)
-                    / (self.df_particle.porosity * (1 + (self.df_particle.Koc_temperature_correction * 1 / (1 + 10 ** (self.df_particle.pH - self.df_particle.pKa))
-                                                            * 0.2 * self.df_particle.dissolved_organic_carbon * 0.000001))))
-        else:
-            self.df_particle['retardation'] = 1
+        self.df_particle['retardation'] = _retardation(pH = self.df_particle.pH.values,
+                                                       pKa = self.df_particle.pKa.values,
+                                                       solid_density = self.df_particle.solid_density.values,
+                                                       porosity = self.df_particle.porosity.values,
+                                                       fraction_organic_carbon = self.df_particle.fraction_organic_carbon.values,
+                                                       dissolved_organic_carbon = self.df_particle.dissolved_organic_carbon.values,
+                                                       Koc_temperature_correction = self.df_particle.Koc_temperature_correction.values,
+                                                       biodegradation_sorbed_phase = self.well.schematisation.biodegradation_sorbed_phase)
 
     def _calculate_omp_half_life_temperature_correction(self):
         '''
@@ -603,12 +680,10 @@ class Transport():
         df_particle: pandas.dataframe
             Column 'omp_half_life_temperature_corrected': float'''
 
-        if self.well.schematisation.temp_correction_halflife:
-            self.df_particle['omp_half_life_temperature_corrected'] = self.df_particle['omp_half_life'] * 10 ** (-63000 / (2.303 * 8.314) * (1 / (20 + 273.15) - 1 / (self.df_particle.temp_water + 273.15)))
-        else:
-            self.df_particle['omp_half_life_temperature_corrected'] = self.df_particle['omp_half_life']
-
-        self.df_particle.loc[self.df_particle.omp_half_life == 1e99, 'omp_half_life_temperature_corrected'] = 1e99
+        self.df_particle['omp_half_life_temperature_corrected'] = _omp_half_life_temperature_correction(
+                                        omp_half_life = self.df_particle['omp_half_life'].values,
+                                        temp_water = self.df_particle.temp_water.values,
+                                        temp_correction_halflife = self.well.schematisation.temp_correction_halflife)
 
     def _calculate_Koc_temperature_correction(self):
         ''' Corrects the OMP Koc for temperature if 'temp_correction_Koc' is 'True' in the HydroChemicalSchematisation.
@@ -625,16 +700,10 @@ class Transport():
         '''
 
 
-        # empty Koc_temperature_correction series to start with
-        self.df_particle['Koc_temperature_correction'] = 0
-        if self.well.schematisation.temp_correction_Koc:
-            self.df_particle.loc[self.df_particle.log_Koc != 0,'Koc_temperature_correction'] = 10 ** self.df_particle.loc[self.df_particle.log_Koc != 0,"log_Koc"] * \
-                                                                        10 ** (1913 * (1 / (self.df_particle.loc[self.df_particle.log_Koc != 0,"temp_water"] + 273.15) - 1 / (20 + 273.15)))
-        else:
-            self.df_particle.loc[:,'Koc_temperature_correction'] = self.df_particle.loc[:,"log_Koc"]
-        
-        # if log_Koc is zero, assign value of zero
-        self.df_particle.loc[self.df_particle.log_Koc == 0,'Koc_temperature_correction'] = 0
+        self.df_particle['Koc_temperature_correction'] = _Koc_temperature_correction(
+                                        log_Koc = self.df_particle.log_Koc.values,
+                                        temp_water = self.df_particle.temp_water.values,
+                                        temp_correction_Koc = self.well.schematisation.temp_correction_Koc)
 
     def _calculate_steady_state_concentration_in_zone_omp(self):
         '''
@@ -651,37 +720,39 @@ class Transport():
         '''
 
         #check if there is degradation prior to infiltration
-        DOC_inf = self.well.schematisation.dissolved_organic_carbon_infiltration_water
-        TOC_inf = self.well.schematisation.total_organic_carbon_infiltration_water
-
-        if DOC_inf and TOC_inf > 0:
-            DOC_TOC_ratio = DOC_inf / TOC_inf
-            K_oc = self.df_particle['Koc_temperature_correction'].iloc[0]
-            c_in = 100 - 100 * (1 - (DOC_TOC_ratio + (1 - DOC_TOC_ratio) / (1 + K_oc * TOC_inf  * 0.000001)))
+        c_in = _input_concentration_infiltration(Koc_temperature_correction = self.df_particle['Koc_temperature_correction'].iloc[0],
+                                                 dissolved_organic_carbon_infiltration_water = self.well.schematisation.dissolved_organic_carbon_infiltration_water,
+                                                 total_organic_carbon_infiltration_water = self.well.schematisation.total_organic_carbon_infiltration_water)
+        if c_in is not None:
             self.df_particle.loc[self.df_particle.zone=='surface', 'input_concentration']=c_in
 
-        for i in range(len(self.df_particle)):
-            if self.df_particle.steady_state_concentration.iloc[i] is None:
-
-                # if omp is persistent, value at end of zone equal to value incoming to zone
-                if (self.df_particle.omp_half_life.iloc[i] == 1e99) | np.isnan(self.df_particle.omp_half_life_temperature_corrected.iloc[i]):
-                    self.df_particle.steady_state_concentration.iloc[i] = self.df_particle.steady_state_concentration.iloc[i-1]
-
-                # Column O in Phreatic excel sheet
-                # # AH 300 limit only to avoid very small numnbers, makes no difference for other calculations therefore left in
-                # Put back in, otherwise there is an error there are too many numbers in the output
-                # can't reproduce the error, so take out again
-                
-                elif (self.df_particle.travel_time.iloc[i] * self.df_particle.retardation.iloc[i]
-                                                                            / self.df_particle.omp_half_life_temperature_corrected.iloc[i]) >300:
-                    self.df_particle.steady_state_concentration.iloc[i] = 0
-
-                # otherwise, calculate the outcoming concentration from the zone, given the input concentration to the zone.
-                # in the case of the vadose zone, the incoming concentration is the initial concentration
-                else:
-                    self.df_particle.steady_state_concentration.iloc[i] = (self.df_particle.steady_state_concentration.iloc[i-1]
-                                                                            / (2 ** (self.df_particle.travel_time.iloc[i] * self.df_particle.retardation.iloc[i]
-                                                                            / self.df_particle.omp_half_life_temperature_corrected.iloc[i])))
+        # Records with a known concentration (the input concentration at the start of each
+        # flowline) are the starting points of a segment; the concentration of the other
+        # records is the concentration of the previous record divided by 2 ** (t * R / T_half),
+        # which is computed as cumulative product of the divisors per segment.
+        steady_state_concentration = self.df_particle['steady_state_concentration'].values
+        is_start = ~np.equal(steady_state_concentration, None)
+        segment = np.cumsum(is_start) - 1
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+            exponent = (self.df_particle.travel_time.values.astype('float') * self.df_particle.retardation.values.astype('float')
+                        / self.df_particle.omp_half_life_temperature_corrected.values.astype('float'))
+            # if omp is persistent, value at end of zone equal to value incoming to zone
+            # Column O in Phreatic excel sheet
+            # # AH 300 limit only to avoid very small numnbers, makes no difference for other calculations therefore left in
+            divisor = np.where((self.df_particle.omp_half_life.values == 1e99) |
+                                np.isnan(self.df_particle.omp_half_life_temperature_corrected.values.astype('float')), 1.,
+                        np.where(exponent > 300, np.inf, 2 ** exponent))
+        divisor[is_start] = 1.
+
+        if is_start.any():
+            # cumulative product of the divisors within each segment
+            cumulative_divisor = pd.Series(divisor).groupby(segment).cumprod(skipna = False).values
+            start_concentration = steady_state_concentration[is_start].astype('float')
+            concentration = np.full(len(divisor), np.nan)
+            concentration[segment >= 0] = (start_concentration[segment[segment >= 0]]
+                                            / cumulative_divisor[segment >= 0])
+            self.df_particle['steady_state_concentration'] = concentration
 
     def _calculate_total_breakthrough_travel_time(self):
         ''' Calculate the total time for breakthrough for each flowline at the well
@@ -692,76 +763,41 @@ class Transport():
             Column 'total_breakthrough_travel_time': float
 
         '''
-        self.df_flowline['total_breakthrough_travel_time']  = 0
-        self.df_flowline['breakthrough_concentration']  = 0.
-
-        for fid in self.df_flowline.index: # range(len(self.df_flowline)):
-            # flowline_id = i + 1
-
-            # df = self.df_particle.loc[fid,:]
-            # df.fillna(0)['breakthrough_travel_time']
-            self.df_flowline.at[fid, 'total_breakthrough_travel_time'] = sum(self.df_particle.loc[fid,:].fillna(0)['breakthrough_travel_time'])
-            self.df_flowline.at[fid, 'breakthrough_concentration'] = self.df_particle.loc[fid,'steady_state_concentration'].iloc[-1]
-
-    def compute_omp_removal(self):
-        """ 
-        Calculates the concentration in the well of each flowline. Returns
-        the values in 'df_flowline' and 'df_particle' as attributes of the object.
+        # Records per flowline
+        particle_store = ParticleStore.from_df_particle(self.df_particle,
+                                columns = ['breakthrough_travel_time', 'steady_state_concentration'])
+        # Position of the flowlines of df_flowline in the store (-1: no records, missing value)
+        position = pd.Index(particle_store.flowline_id).get_indexer(self.df_flowline.index)
+
+        # Sum of the breakthrough travel time (missing values: 0) and the concentration of the last record
+        total_breakthrough_travel_time = particle_store.sum('breakthrough_travel_time')
+        breakthrough_concentration = particle_store.last('steady_state_concentration').astype('float')
+        self.df_flowline['total_breakthrough_travel_time'] = np.append(total_breakthrough_travel_time, np.nan)[position]
+        self.df_flowline['breakthrough_concentration'] = np.append(breakthrough_concentration, np.nan)[position]
+
+    def _add_input_concentration(self):
+        ''' Add the (diffuse) input concentration to df_flowline and the start of each flowline
+        in df_particle, and add the flowlines of the point source contamination (if any)
+        with the point input concentration.
 
         Returns
         -------
         df_flowline: pandas.DataFrame
-            Column 'flowline_id': Integer
-            Column 'flowline_type': string
-            Column 'flowline_discharge': Float
-            Column 'particle_release_day': Float
             Column 'input_concentration': float
-            Column 'endpoint_id': Integer
-            Column 'well_discharge': float
-            Column 'name': string
-            Column 'removal_function': string
-            Column 'total_breakthrough_travel_time': float
-            The breakthrough concentration in the well for the OMP taking into account retardation.
-            Column 'breakthrough_concentration': float
-            The breakthrough concentration in the well for the OMP taking into account sorption
-            and biodegradation.
-
         df_particle: pandas.DataFrame
-            Column 'flowline_id': int
-            Column 'zone': string
-            Column 'travel_time': float
-            Column 'xcoord': float
-            Column 'ycoord': float
-            Column 'zcoord': float
-            Column 'redox': float
-            Column 'temp_water': float
-            Column 'travel_distance': float
-            Column 'porosity': float
-            Column 'dissolved_organic_carbon': float
-            Column 'pH': float
-            Column 'fraction_organic_carbon': float
-            Column 'solid_density': float
             Column 'input_concentration': float
             Column 'steady_state_concentration': float
-            The steady state concentration at the well of the OMP for the flowline, [mass/L]
-            Column 'omp_half_life': float
-            Column 'log_Koc': float
-            Column 'pKa': float
-            Column 'Koc_temperature_correction': float
-            The temperature corrected Koc value, only if 'temp_correction_Koc' is 'True' in the HydroChemicalSchematisation.
-            Column 'omp_half_life_temperature_corrected': float
-            The temperature corrected OMP half-life value, if 'temp_correction_halflife' is 'True' in the HydroChemicalSchematisation.
-            Column 'retardation': float
-            Column 'breakthrough_travel_time': float
-
-            """
+                The input concentration at the start of each flowline, None for the other records.
+        '''
 
-        # load (diffuse) input concentration    
-        self.df_flowline.loc[:,'input_concentration'] = self.well.schematisation.diffuse_input_concentration
-        self.df_particle.loc[:,'input_concentration'] = None
+        self.df_flowline['input_concentration'] = self.well.schematisation.diffuse_input_concentration
+        self.df_particle['input_concentration'] = None
         if 'steady_state_concentration' not in self.df_particle.columns:
             # Steady state concentration [-]
-            self.df_particle.loc[:,'steady_state_concentration'] = None
+            self.df_particle['steady_state_concentration'] = None
+        else:
+            # Copy of the column, the values are set below (the input df_particle is not modified)
+            self.df_particle['steady_state_concentration'] = self.df_particle['steady_state_concentration'].copy()
 
         # First value of input_concentration/steady_state_concentration equals diffuse input concentration of pathline
         self.df_particle.loc[self.df_particle.total_travel_time == 0.,"input_concentration"] = self.df_flowline.loc[:,'input_concentration'].values
@@ -782,16 +818,22 @@ class Transport():
                                                         * distance ** 2)/abs(self.well.schematisation.well_discharge)
             ind = self.df_particle.flowline_id.iat[-1]
 
-            if self.well.schematisation.schematisation_type == 'phreatic':
-                head = self.well.schematisation._calculate_hydraulic_head_phreatic(distance=distance)
-                df_flowline_points, df_particle_points = self.well._add_phreatic_point_sources(distance=distance,
+            # The point source calculations set attributes of the well and its schematisation
+            # (e.g. 'head', 'travel_time_unsaturated'): calculate them on a (shallow) copy, the
+            # flow solution of the well is not modified
+            point_well = copy.copy(self.well)
+            point_well.schematisation = copy.copy(self.well.schematisation)
+
+            if point_well.schematisation.schematisation_type == 'phreatic':
+                head = point_well.schematisation._calculate_hydraulic_head_phreatic(distance=distance)
+                df_flowline_points, df_particle_points = point_well._add_phreatic_point_sources(distance=distance,
                                             depth_point_contamination=depth,
                                             cumulative_fraction_abstracted_water=cumulative_fraction_abstracted_water)
 
-            elif self.well.schematisation.schematisation_type == 'semiconfined':
-                bottom_vadose_zone = self.well.schematisation.bottom_vadose_zone_at_boundary
+            elif point_well.schematisation.schematisation_type == 'semiconfined':
+                bottom_vadose_zone = point_well.schematisation.bottom_vadose_zone_at_boundary
 
-                df_flowline_points, df_particle_points = self.well._add_semiconfined_point_sources(distance=distance,
+                df_flowline_points, df_particle_points = point_well._add_semiconfined_point_sources(distance=distance,
                                         depth_point_contamination=depth,  )
             # Assign flowline id to point
             df_particle_points.loc[:,'flowline_id'] = df_particle_points.loc[:,'flowline_id'].values + ind
@@ -826,8 +868,70 @@ class Transport():
             self.df_flowline.index = self.df_flowline.loc[:,"flowline_id"].values
             # self.df_flowline.reset_index(drop=True, inplace=True)
 
+    def compute_omp_removal(self):
+        """ 
+        Calculates the concentration in the well of each flowline. Returns
+        the values in 'df_flowline' and 'df_particle' as attributes of the object.
+
+        Returns
+        -------
+        df_flowline: pandas.DataFrame
+            Column 'flowline_id': Integer
+            Column 'flowline_type': string
+            Column 'flowline_discharge': Float
+            Column 'particle_release_day': Float
+            Column 'input_concentration': float
+            Column 'endpoint_id': Integer
+            Column 'well_discharge': float
+            Column 'name': string
+            Column 'removal_function': string
+            Column 'total_breakthrough_travel_time': float
+            The breakthrough concentration in the well for the OMP taking into account retardation.
+            Column 'breakthrough_concentration': float
+            The breakthrough concentration in the well for the OMP taking into account sorption
+            and biodegradation.
+
+        df_particle: pandas.DataFrame
+            Column 'flowline_id': int
+            Column 'zone': string
+            Column 'travel_time': float
+            Column 'xcoord': float
+            Column 'ycoord': float
+            Column 'zcoord': float
+            Column 'redox': float
+            Column 'temp_water': float
+            Column 'travel_distance': float
+            Column 'porosity': float
+            Column 'dissolved_organic_carbon': float
+            Column 'pH': float
+            Column 'fraction_organic_carbon': float
+            Column 'solid_density': float
+            Column 'input_concentration': float
+            Column 'steady_state_concentration': float
+            The steady state concentration at the well of the OMP for the flowline, [mass/L]
+            Column 'omp_half_life': float
+            Column 'log_Koc': float
+            Column 'pKa': float
+            Column 'Koc_temperature_correction': float
+            The temperature corrected Koc value, only if 'temp_correction_Koc' is 'True' in the HydroChemicalSchematisation.
+            Column 'omp_half_life_temperature_corrected': float
+            The temperature corrected OMP half-life value, if 'temp_correction_halflife' is 'True' in the HydroChemicalSchematisation.
+            Column 'retardation': float
+            Column 'breakthrough_travel_time': float
+
+            """
+
+        # Start from the flow solution of the well (repeated calls give the same result)
+        self.df_particle = self.well.df_particle.copy(deep = False)
+        self.df_flowline = self.well.df_flowline.copy(deep = False)
+        self.omp_initialized = False
+
+        # load (diffuse and point source) input concentration
+        self._add_input_concentration()
+
+        if self.well.schematisation.point_input_concentration:
             # Add substance name
-            self.df_flowline.loc[:,'name'] = self.pollutant_name
+            self.df_flowline['name'] = self.pollutant_name
 
         self._init_omp()
 
@@ -839,7 +943,7 @@ class Transport():
 
         self._calculate_steady_state_concentration_in_zone_omp()
 
-        self.df_particle.loc[:,'breakthrough_travel_time'] = self.df_particle.loc[:,"retardation"].values * self.df_particle.loc[:,"total_travel_time"].values
+        self.df_particle['breakthrough_travel_time'] = self.df_particle.loc[:,"retardation"].values * self.df_particle.loc[:,"total_travel_time"].values
 
         self._calculate_total_breakthrough_travel_time()
 
@@ -847,16 +951,60 @@ class Transport():
         self._contamination_date_vs_well_abstraction()
 
         # add the particle release date
-        self.df_flowline.loc[:,'particle_release_day'] = self.particle_release_day
+        self.df_flowline['particle_release_day'] = self.particle_release_day
 
 
-    def compute_concentration_in_well_at_date(self):
-        #@Martink, this function is quite slow. I'm not sure how to make it go faster?
+    def _sum_over_breakthrough_period(self, time_array, start_time, end_time, values):
+        ''' Sum 'values' of the flowlines for which start_time <= t <= end_time, for each
+        time t in 'time_array'. Uses the sorted start and end times (cumulative sums and
+        searchsorted) instead of filtering all flowlines for each time step.
+
+        Parameters
+        ----------
+        time_array: array
+            Times to compute the sum for [days].
+        start_time, end_time: array
+            Start and end time of each flowline [days], with end_time >= start_time.
+        values: array
+            Value of each flowline.
+
+        Returns
+        -------
+        total: array
+            Sum of the values of the active flowlines for each time in 'time_array'.
+        '''
+        order_start = np.argsort(start_time, kind = 'stable')
+        order_end = np.argsort(end_time, kind = 'stable')
+        cumulative_start = np.append(0., np.cumsum(values[order_start]))
+        cumulative_end = np.append(0., np.cumsum(values[order_end]))
+
+        # number of flowlines started (start_time <= t) and ended (end_time < t)
+        nr_started = np.searchsorted(start_time[order_start], time_array, side = 'right')
+        nr_ended = np.searchsorted(end_time[order_end], time_array, side = 'left')
+
+        total = cumulative_start[nr_started] - cumulative_end[nr_ended]
+        # no active flowlines: exactly zero
+        total[nr_started == nr_ended] = 0.
+
+        return total
+
+    def compute_concentration_in_well_at_date(self, freq = 'D'):
         ''' 
         Calculates the concentration in the well up to a specific date,
         taking into account the start and end date of the contamiantion and
         start date of the well.
 
+        Each flowline contributes to the concentration in the well from its breakthrough
+        time up to the end of the contamination breakthrough. These periods are summed
+        using the sorted start and end times, so the computation time does not scale with
+        (number of dates x number of flowlines).
+
+        Parameters
+        ----------
+        freq: str
+            Frequency of the output dates (pandas offset alias). Default is 'D' (daily),
+            e.g. 'W' for weekly or 'MS' for monthly values (first day of the month).
+
         Returns
         -------
         df_well_concentration: pandas.dataframe
@@ -876,28 +1024,38 @@ class Transport():
             end_time = self.end_date_contamination- self.start_date
             self.df_flowline['end_time_contamination_breakthrough'] = self.df_flowline['total_breakthrough_travel_time'] + end_time.days
 
-        # AH_todo, Solution to make this faster is to erduce this down to xx timesteps, e.g. once a month
-        time_array = np.arange(0, self.compute_date.days+1, 1)
-        back_date_array = np.arange(-self.back_compute_date.days,0, 1)
-        time_array = np.append(back_date_array,time_array)
-        time_array_dates = pd.date_range(start=self.back_date_start,end=self.compute_contamination_for_date)
+        # dates and time relative to the start date [days]
+        time_array_dates = pd.date_range(start=self.back_date_start,end=self.compute_contamination_for_date, freq = freq)
+        time_array = (time_array_dates - self.start_date).days.values
 
         #Calculate the concentration in the well,
         self.df_flowline['concentration_in_well'] = (self.df_flowline['breakthrough_concentration']
                             * self.df_flowline['flowline_discharge']/ self.df_flowline['well_discharge'])
         df_flowline = self.df_flowline
 
-        # AH_todo, preset the length of list to improve some time
-        well_concentration = []
+        concentration_in_well = df_flowline['concentration_in_well'].values.astype('float')
+        start_time = df_flowline['total_breakthrough_travel_time'].values.astype('float')
+        if self.end_date_contamination is None:
+            end_time = np.full(len(df_flowline), np.inf)
+        else:
+            end_time = df_flowline['end_time_contamination_breakthrough'].values.astype('float')
+
+        # flowlines which contribute to the well concentration at some time
+        contributes = end_time >= start_time
+        # missing concentrations make the sum missing (NaN) while the flowline contributes
+        missing = np.isnan(concentration_in_well)
 
         #sum the concentration in the well for each timestep
-        for i in range(len(time_array)):
-            t = time_array[i]
-            if self.end_date_contamination is None:
-                well_conc = sum(df_flowline['concentration_in_well'].loc[(df_flowline['total_breakthrough_travel_time'] <= t)])
-            else:
-                well_conc = sum(df_flowline['concentration_in_well'].loc[(df_flowline['total_breakthrough_travel_time'] <= t) & (df_flowline['end_time_contamination_breakthrough'] >= t)])
-            well_concentration.append(well_conc)
+        well_concentration = self._sum_over_breakthrough_period(time_array,
+                                        start_time = start_time[contributes],
+                                        end_time = end_time[contributes],
+                                        values = np.where(missing, 0., concentration_in_well)[contributes])
+        nr_missing = self._sum_over_breakthrough_period(time_array,
+                                        start_time = start_time[contributes],
+                                        end_time = end_time[contributes],
+                                        values = missing[contributes].astype('float'))
+        well_concentration[nr_missing > 0] = np.nan
+
         df_well_concentration = pd.DataFrame({'time':time_array, 'date':time_array_dates, 'total_concentration_in_well': well_concentration})
 
         return df_well_concentration
@@ -1010,12 +1168,17 @@ class Transport():
             # Add dataframe column with default value
             df[df_column] = value
         else:
+            if isinstance(df[df_column].dtype, pd.CategoricalDtype) and dtype_ == 'object':
+                # Keep categorical (integer-coded) columns, with the default value as category
+                dtype_ = 'category'
+                if value not in df[df_column].cat.categories:
+                    df[df_column] = df[df_column].cat.add_categories([value])
             # Fill dataframe series (if needed with default value)
             if df[df_column].dropna().empty:
                 df[df_column] = df[df_column].fillna(value)
             else: 
                 # fill empty rows (with mean value of other records)
-                if not dtype_ == 'object':
+                if not dtype_ in ['object','category']:
                     value_mean = df[df_column].values.mean()
                     df[df_column] = df[df_column].fillna(value_mean)
                 else: 
@@ -1025,6 +1188,47 @@ class Transport():
 
         return df
 
+    def _calculate_porewater_velocity(self, df_particle):
+        ''' Calculate the distance between the nodes of each pathline and the
+        porewater velocity [m/day] (not corrected for the effective porosity).
+        The first node of a pathline gets the velocity of the segment that follows it.
+
+        Return df_particle with the columns 'relative_distance' and 'porewater_velocity'
+        (df_particle is indexed by flowline_id).
+        '''
+        # Particles per flowline (df_particle is indexed by flowline_id)
+        groups = df_particle.groupby(level = 0, sort = False)
+        # First node of each flowline
+        is_first = (groups.cumcount() == 0).values
+
+        # Distance squared argument, per node relative to the previous node of the same flowline
+        coord_diff = groups[["xcoord","ycoord","zcoord"]].diff().astype('float')
+        dist_ = (coord_diff["xcoord"].values**2 + 
+                    coord_diff["ycoord"].values**2 + 
+                    coord_diff["zcoord"].values**2)
+        # Replace nan values (first node of each flowline)
+        dist_ = np.nan_to_num(dist_, nan = 0.)
+        # Distance array between nodes
+        dist = np.sqrt(dist_)
+        # Time difference array
+        tdiff = np.nan_to_num(groups["total_travel_time"].diff().values.astype('float'), nan = 0.)
+
+        # Calculate porewater velocity [m/day] (do not include effective porosity)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            v_por = np.abs(dist/tdiff)
+        # correct "0" velocity values
+        v_por[v_por == 0.] = 0.001
+        # The first node of a pathline gets the velocity of the segment that follows it
+        v_next = pd.Series(v_por, index = df_particle.index).groupby(level = 0, sort = False).shift(-1).values
+        v_por[is_first] = v_next[is_first]
+
+        # Fill column relative_distance in 'df_particle' 
+        df_particle['relative_distance'] = dist
+        # Fill porewater velocity in 'df_particle'
+        df_particle["porewater_velocity"] = v_por
+
+        return df_particle
+
     def calc_lambda(self, df_particle, df_flowline, 
                 redox = 'anoxic',
                 mu1 = 0.149,
@@ -1098,6 +1302,10 @@ class Transport():
         # Boltzmann coefficient [J K-1]
         const_BM = 1.38e-23 
 
+        # (shallow) copies of the input dataframes, which are not modified
+        df_particle = df_particle.copy(deep = False)
+        df_flowline = df_flowline.copy(deep = False)
+
         # Create empty column 'relative_distance' in df_particle
         df_particle['relative_distance'] = None  
         # Create empty column 'porewater_velocity' in df_particle
@@ -1153,99 +1361,59 @@ class Transport():
                                 df_column = 'mu1',
                                 value = mu1)
 
-        # Create empty column 'alpha' in df_particle
-        df_particle['alpha'] = None  
+        # Calculate 'sticky coefficient' alpha [-]
+        alpha = df_particle["alpha0"].values * 0.9**((df_particle["pH"].values - df_particle["pH0"].values)/0.1)
+        # Fill df_particle 'alpha'
+        df_particle["alpha"] = alpha
 
-        # Calculate 'sticky coefficient' alpha [np.array]
-        alpha = {}
-        for pid in df_flowline.index:
-            alpha[pid] = df_particle.loc[pid,"alpha0"].values * 0.9**((df_particle.loc[pid,"pH"].values - df_particle.loc[pid,"pH0"].values )/0.1)
+        # Fill columns 'relative_distance' and 'porewater_velocity' in 'df_particle'
+        df_particle = self._calculate_porewater_velocity(df_particle)
+        v_por = df_particle["porewater_velocity"].values
 
-            # Fill df_particle 'alpha'
-            df_particle.loc[pid,"alpha"] = alpha[pid]
+        # Node arrays
+        porosity = df_particle["porosity"].values
+        grainsize_ = df_particle["grainsize"].values
+        temp_water_ = df_particle["temp_water"].values
+        # Pathogen diameter for each node
+        organism_diam_ = df_flowline["organism_diam"].reindex(df_particle.index).values
 
-        # Create empty column 'k_att' in df_particle
-        df_particle['k_att'] = None
-        # Create empty column 'lambda' in df_particle
-        df_particle['lamda'] = None        
-        
-        # Calculate porewater velocity
-        v_por, dist, tdiff = {}, {}, {}   
-        for pid in df_flowline.index:
-
-            # Distance squared argument
-            dist_ = (df_particle.loc[pid,"xcoord"].diff().values**2 + 
-                                df_particle.loc[pid,"ycoord"].diff().values**2 + 
-                                df_particle.loc[pid,"zcoord"].diff().values**2)
-            # Replace nan values
-            dist_ = np.nan_to_num(dist_.astype('float'),nan=0.)
-            #Distance array between nodes
-            dist[pid] = np.sqrt(dist_)
-            # Time difference array
-            tdiff[pid] = np.nan_to_num(df_particle.loc[pid,"total_travel_time"].diff().values.astype('float'),0.001)
-
-            # Calculate porewater velocity [m/day] (do not include effective porosity)
-            v_por[pid] = abs(dist[pid][1:]/tdiff[pid][1:])
-            # correct "0" velocity values
-            v_por[pid][v_por[pid] == 0.] = 0.001
-
-            # Fill column relative_distance in 'df_particle' 
-            df_particle.loc[pid,'relative_distance'] = np.array([0] + list(dist[pid][1:]))
-            # df_particle.loc[pid,'relative_distance'][-1] = 0
-
-            # Fill porewater velocity in 'df_particle'
-            df_particle.loc[pid,"porewater_velocity"] = np.array([v_por[pid][0]] + list(v_por[pid]))
-            # In the last pathline row the porewater_velocity is equal to previous velocity
-            # df_particle.loc[pid,"porewater_velocity"][-1] = v_por[pid][-1]
-
-            # number of nodes
-            n_nodes = len(df_particle.loc[pid,:])            
-
-
-        # Create empty dicts and keys to keep track of arrays per particle id
-        k_coll, gamma, As_happ, mu = {}, {}, {}, {}
-        D_BM, k_diff, k_att, lamda = {}, {}, {}, {}
-        # particle ids
-        for pid in df_flowline.index:
-
-            # Collision term 'k_coll'
-            k_coll[pid] = (3/2.)*((1-df_particle.loc[pid,"porosity"].values) / \
-                        df_particle.loc[pid,"grainsize"].values) * df_particle.loc[pid,"alpha"].values
-
-            # Porosity dependent variable 'gamma'
-            gamma[pid] = (1-df_particle.loc[pid,"porosity"].values)**(1/3)
-
-            # Calculate Happel’s porosity dependent parameter 'A_s' (Eq. 5: BTO2012.015)
-            ''' !!! Use correct formula:-> As =  2 * (1-gamma**5) /  (2 - 3 * gamma + 3 * gamma**5 - 2 * gamma**6)
-                instead of... 2 * (1-gamma)**5 / (.......) 
-            '''
-            As_happ[pid] = 2 * (1-gamma[pid]**5) / \
-                    (2 - 3 * gamma[pid] + 3 * gamma[pid]**5 - 2 * gamma[pid]**6)
-
-            # Dynamic viscosity (mu) [kg m-1 s-1]
-            mu[pid] = (df_particle.loc[pid,"rho_water"].values * 497.e-6) / \
-                        (df_particle.loc[pid,"temp_water"].values + 42.5)**(3/2)
- 
-            # Diffusion constant 'D_BM' (Eq.6: BTO2012.015) --> unit: m2 s-1
-            D_BM[pid] = (const_BM * (df_particle.loc[pid,"temp_water"].values + 273.)) / \
-                        (3 * np.pi * df_flowline.loc[pid,"organism_diam"] * mu[pid])
-            # Diffusion constant 'D_BM' (Eq.6: BTO2012.015) --> unit: m2 d-1
-            D_BM[pid] *= 86400.
-
-            # Diffusion related attachment term 'k_diff'
-            k_diff[pid] = ((D_BM[pid] /
-                        (df_particle.loc[pid,"grainsize"].values * df_particle.loc[pid,"porosity"].values * df_particle.loc[pid,"porewater_velocity"].values))**(2/3) * 
-                            df_particle.loc[pid,"porewater_velocity"].values)
-
-            # 'attachment coefficient' k_att [/dag]
-            k_att[pid] = k_coll[pid] * 4 * As_happ[pid]**(1/3) * k_diff[pid]
-            # removal coefficient 'lamda' [/day], using the 'mu1' mean.
-            lamda[pid] = k_att[pid] + mu1
-
-            # Fill df_particle 'k_att'
-            df_particle.loc[pid,"k_att"] = k_att[pid]
-            # Fill df_particle 'lambda'
-            df_particle.loc[pid,"lamda"] = lamda[pid]
+        # Collision term 'k_coll'
+        k_coll = (3/2.)*((1-porosity) / grainsize_) * alpha
+
+        # Porosity dependent variable 'gamma'
+        gamma = (1-porosity)**(1/3)
+
+        # Calculate Happel’s porosity dependent parameter 'A_s' (Eq. 5: BTO2012.015)
+        ''' !!! Use correct formula:-> As =  2 * (1-gamma**5) /  (2 - 3 * gamma + 3 * gamma**5 - 2 * gamma**6)
+            instead of... 2 * (1-gamma)**5 / (.......) 
+        '''
+        As_happ = 2 * (1-gamma**5) / \
+                (2 - 3 * gamma + 3 * gamma**5 - 2 * gamma**6)
+
+        # Dynamic viscosity (mu) [kg m-1 s-1]
+        mu = (df_particle["rho_water"].values * 497.e-6) / \
+                    (temp_water_ + 42.5)**(3/2)
+
+        # Diffusion constant 'D_BM' (Eq.6: BTO2012.015) --> unit: m2 s-1
+        D_BM = (const_BM * (temp_water_ + 273.)) / \
+                    (3 * np.pi * organism_diam_ * mu)
+        # Diffusion constant 'D_BM' (Eq.6: BTO2012.015) --> unit: m2 d-1
+        D_BM *= 86400.
+
+        # Diffusion related attachment term 'k_diff'
+        k_diff = ((D_BM /
+                    (grainsize_ * porosity * v_por))**(2/3) * 
+                        v_por)
+
+        # 'attachment coefficient' k_att [/dag]
+        k_att = k_coll * 4 * As_happ**(1/3) * k_diff
+        # removal coefficient 'lamda' [/day], using the 'mu1' mean.
+        lamda = k_att + mu1
+
+        # Fill df_particle 'k_att'
+        df_particle["k_att"] = k_att
+        # Fill df_particle 'lambda'
+        df_particle["lamda"] = lamda
 
         # return (adjusted) df_particle and df_flowline
         return df_particle, df_flowline
@@ -1391,13 +1559,20 @@ class Transport():
                     Steady-state concentration at each node, calculated [N/L]
 
         '''
+        if trackingdirection not in ['forward', 'backward']:
+            raise ValueError(f"trackingdirection should be 'forward' or 'backward', not '{trackingdirection}'")
+
         if organism_name is None:
             organism_name = self.pollutant_name
         
+        # (shallow) copies of the input dataframes, which are not modified
         if df_particle is not None:
-            self.df_particle = df_particle
+            self.df_particle = df_particle.copy(deep = False)
+            # (re)initialize the mbo-parameters for the new df_particle
+            self.micro_organism_initialized = False
         if df_flowline is not None:
-            self.df_flowline = df_flowline
+            self.df_flowline = df_flowline.copy(deep = False)
+            self.micro_organism_initialized = False
 
         # Organism/Species name
         self.df_flowline['name'] = organism_name
@@ -1440,69 +1615,66 @@ class Transport():
             # steady-state concentration for particles along a certain flowline
             self.df_particle['steady_state_concentration'] = None
         
-        for pid in self.df_flowline.index:
-            self.df_particle.loc[pid,"steady_state_concentration"].iloc[0] = self.df_flowline.at[pid,"input_concentration"]
-
-        # Start dictionaries for relative and steady-state concentrations
-        conc_rel = {}
-        conc_steady = {}  # concentration corrected for initial concentration
-        for pid in self.df_flowline.index:
-            
-            # Calculate the relative removal along pathlines
-            exp_arg = -((self.df_particle.loc[pid,"lamda"].values / self.df_particle.loc[pid,"porewater_velocity"].values) *
-                                self.df_particle.loc[pid,'relative_distance'].values).astype('float')
-
-            conc_rel[pid] = self.df_flowline.loc[pid,"input_concentration_gw"] + \
-                            (self.df_flowline.loc[pid,"input_concentration"] - self.df_flowline.loc[pid,"input_concentration_gw"]) * \
-                                np.exp(exp_arg)
-
-            if trackingdirection == 'forward':
-                conc_steady[pid] = (conc_rel[pid]/self.df_flowline.loc[pid,"input_concentration"]).cumprod() * \
-                                    self.df_flowline.loc[pid,"input_concentration"]
-                # Replace 'nan'-values by 0.
-                conc_steady[pid]  = np.nan_to_num(conc_steady[pid],0.)
-                
-                # Index of average final concentration "C_"  idx=-1[C0,...,..,...,Ct-1,C_final]
-                idx_final = -1
-                                
-            elif trackingdirection == 'backward':
-                conc_steady[pid] = (conc_rel[pid][::-1]/self.df_flowline.loc[pid,"input_concentration"]).cumprod() * \
-                                    self.df_flowline.loc[pid,"input_concentration"]
-                # Replace 'nan'-values by 0.
-                conc_steady[pid]  = np.nan_to_num(conc_steady[pid],0.)
-                # First value represents concentration of endpoint and v.v.
-                # Reverse array--> [C_final,Ct-1,..,...,C0]
-                conc_steady[pid] = conc_steady[pid][::-1]
-                # Index of average final concentration "C_" idx=0 [C_final,Ct-1,..,...,C0]
-                idx_final = 0
-
-            # Add steady_state_concentration to df_particle
-            self.df_particle.loc[pid,'steady_state_concentration'] = conc_steady[pid]
-
-        # Calculate average final concentration
-        C_final = 0.
-        for pid in self.df_flowline.index:
-            if self.df_flowline.loc[pid,"endpoint_id"] == endpoint_id:
-                # Steady-state concentration after breakthrough
-                C_breakthrough = conc_steady[pid][idx_final]
-                # Traveltime from contamination to endpoint location [days]
-                time_breakthrough = self.df_particle.loc[pid,"total_travel_time"].iloc[-1]
-
-                # Steady-state final concentration
-                C_final += (C_breakthrough * self.df_flowline.loc[pid,"flowline_discharge"]) / \
-                            self.df_flowline.loc[pid,"well_discharge"]
-
-                # Add breakthrough_concentration to df_flowline
-                self.df_flowline.loc[pid,'breakthrough_concentration'] = C_breakthrough
-                # Add breakthrough_traveltime to df_flowline
-                self.df_flowline.loc[pid,'breakthrough_travel_time'] = time_breakthrough
+        # Flowline parameters for each node (df_particle is indexed by flowline_id)
+        input_concentration = self.df_flowline["input_concentration"].reindex(self.df_particle.index).values
+        input_concentration_gw = self.df_flowline["input_concentration_gw"].reindex(self.df_particle.index).values
+
+        # Calculate the relative removal along pathlines
+        exp_arg = -((self.df_particle["lamda"].values / self.df_particle["porewater_velocity"].values) *
+                            self.df_particle['relative_distance'].values).astype('float')
+
+        conc_rel = input_concentration_gw + \
+                        (input_concentration - input_concentration_gw) * np.exp(exp_arg)
+
+        # Segmented cumulative product of the relative removal per flowline
+        flowline_id = self.df_particle.index.values
+        if trackingdirection == 'forward':
+            conc_steady = pd.Series(conc_rel/input_concentration).groupby(flowline_id, sort = False). \
+                                    cumprod(skipna = False).values * input_concentration
+        elif trackingdirection == 'backward':
+            # First value represents concentration of endpoint and v.v.
+            # --> cumprod over the reversed array and reverse the result [C_final,Ct-1,..,...,C0]
+            conc_steady = pd.Series((conc_rel/input_concentration)[::-1]).groupby(flowline_id[::-1], sort = False). \
+                                    cumprod(skipna = False).values[::-1] * input_concentration
+        # Replace 'nan'-values by 0.
+        conc_steady = np.nan_to_num(conc_steady)
+
+        # Add steady_state_concentration to df_particle
+        self.df_particle['steady_state_concentration'] = conc_steady
+
+        # Final node of each flowline: idx=-1 [C0,...,..,...,Ct-1,C_final] (forward)
+        # or idx=0 [C_final,Ct-1,..,...,C0] (backward)
+        df_node = pd.DataFrame({'steady_state_concentration': conc_steady}, index = self.df_particle.index)
+        if trackingdirection == 'forward':
+            C_breakthrough = df_node.groupby(level = 0, sort = False).tail(1)['steady_state_concentration']
+        else:
+            C_breakthrough = df_node.groupby(level = 0, sort = False).head(1)['steady_state_concentration']
+        C_breakthrough = C_breakthrough.reindex(self.df_flowline.index)
+        # Traveltime from contamination to endpoint location [days]
+        time_breakthrough = self.df_particle.groupby(level = 0, sort = False).tail(1)["total_travel_time"]. \
+                                reindex(self.df_flowline.index)
+
+        # Calculate average final concentration: flow-weighted sum of the breakthrough
+        # concentrations per endpoint
+        C_contribution = (C_breakthrough * self.df_flowline["flowline_discharge"]) / \
+                            self.df_flowline["well_discharge"]
+        C_final = C_contribution.groupby(self.df_flowline["endpoint_id"]).sum().get(endpoint_id, 0.)
+
+        is_endpoint = self.df_flowline["endpoint_id"] == endpoint_id
+        # Add breakthrough_concentration to df_flowline
+        self.df_flowline['breakthrough_concentration'] = C_breakthrough.where(is_endpoint,
+                                                            self.df_flowline['breakthrough_concentration'])
+        # Add breakthrough_traveltime to df_flowline
+        self.df_flowline['breakthrough_travel_time'] = time_breakthrough.where(is_endpoint,
+                                                            self.df_flowline['breakthrough_travel_time'])
         
         # Add final concentration in well (at endpoint_id)
-        self.df_flowline.loc[self.df_flowline.endpoint_id == endpoint_id,"concentration_in_well"] = C_final
+        self.df_flowline['concentration_in_well'] = np.where(is_endpoint, C_final,
+                                                            self.df_flowline.get('concentration_in_well', np.nan))
 
         # No retardation included with mbo removal
         self.df_particle['retardation'] = 1.       
-        self.df_particle.loc[:,'breakthrough_travel_time'] = self.df_particle.loc[:,"retardation"].values * self.df_particle.loc[:,"total_travel_time"].values
+        self.df_particle['breakthrough_travel_time'] = self.df_particle.loc[:,"retardation"].values * self.df_particle.loc[:,"total_travel_time"].values
 
         # SR_todo: @MartinvdS required to calc total_breakthrough_travel_time mbo?
         self._calculate_total_breakthrough_travel_time()
@@ -1522,24 +1694,18 @@ class Transport():
         ''' Plot cumululative travel times using column 'times_col' relative to distance 'distance_col' 
             per pathline with index column 'index_col'.'''
 
-        # Pathline indices
-        flowline_ids = list(df_particle.loc[:,index_col].unique())
+        # Records per pathline (index column 'index_col')
+        particle_store = ParticleStore.from_df_particle(df_particle, columns = [distance_col,times_col],
+                                                        flowline_column = index_col)
         
         ## modpath solution ##
-        # Distance points
-        distance_points = np.empty((len(flowline_ids)), dtype = 'float')
-        # Time points
-        time_points = np.empty((len(flowline_ids)), dtype = 'float')
-
-        for idx, fid in enumerate(flowline_ids):
-
-            # Fill distance_points array
-            distance_points[idx] = df_particle.loc[df_particle[index_col] == fid, [distance_col,times_col]].sort_values(
-                                        by = times_col, ascending = True).iloc[0,0]
-            
-            # Fill time_points array
-            time_points[idx] = df_particle.loc[df_particle[index_col] == fid, [distance_col,times_col]].sort_values(
-                                        by = times_col, ascending = True).iloc[-1,1]
+        # Records sorted by pathline and time
+        times = particle_store.columns[times_col].astype('float')
+        order = np.lexsort((times, particle_store.flowline_position()))
+        # Distance points: distance at the first time of each pathline
+        distance_points = particle_store.columns[distance_col][order][particle_store.offsets[:-1]].astype('float')
+        # Time points: last time of each pathline
+        time_points = times[order][particle_store.offsets[1:] - 1]
         
         
         # Create travel time distribution plot
@@ -1584,15 +1750,15 @@ class Transport():
 
         # Keep track of minimum line distance between pathlines ('line_dist')
         xmin_plot = 0.
-        # Flowline IDs
-        flowline_ID = list(df_particle.index.unique())
-        for fid in flowline_ID:
+        # Records per flowline
+        particle_store = ParticleStore.from_df_particle(df_particle, columns = ["xcoord","zcoord","total_travel_time"])
+        for iFlowline in range(particle_store.nr_flowlines):
 
-            x_points = df_particle.loc[df_particle.index == fid, "xcoord"].values
-#           y_points = df_particle.loc[df_particle.index == fid, "ycoord"].values
-            z_points = df_particle.loc[df_particle.index == fid, "zcoord"].values
+            x_points = particle_store.segment(iFlowline, "xcoord")
+#           y_points = particle_store.segment(iFlowline, "ycoord")
+            z_points = particle_store.segment(iFlowline, "zcoord")
             # Cumulative travel times
-            time_points = df_particle.loc[df_particle.index == fid, "total_travel_time"].values
+            time_points = particle_store.segment(iFlowline, "total_travel_time")
 
             # Plot every 'line_dist' number of meters one line
             if trackingdirection == "forward":
@@ -1696,15 +1862,15 @@ class Transport():
 
         # Keep track of minimum line distance between pathlines ('line_dist')
         xmin_plot = 0.
-        # Flowline IDs
-        flowline_ID = list(df_particle.index.unique())
-        for fid in flowline_ID:
+        # Records per flowline
+        particle_store = ParticleStore.from_df_particle(df_particle, columns = ["xcoord","zcoord","steady_state_concentration"])
+        for iFlowline, fid in enumerate(particle_store.flowline_id):
 
-            x_points = df_particle.loc[fid, "xcoord"].values
-#           y_points = df_particle.loc[fid, "ycoord"].values
-            z_points = df_particle.loc[fid, "zcoord"].values
+            x_points = particle_store.segment(iFlowline, "xcoord")
+#           y_points = particle_store.segment(iFlowline, "ycoord")
+            z_points = particle_store.segment(iFlowline, "zcoord")
             # Concentration along pathlines
-            conc_points = df_particle.loc[fid, "steady_state_concentration"].values
+            conc_points = particle_store.segment(iFlowline, "steady_state_concentration")
             # Starting concentration of pathline
             input_concentration = df_flowline.loc[fid,"input_concentration"]
             # Concentration relative to input
@@ -1794,3 +1960,501 @@ class Transport():
     # def plot_logremoval(self):
     #     #AH_todo
     #     pass
+
+
+class TransportBatch():
+    """ Compute the removal of many organic micro pollutants (OMP) for the same flow
+    solution (well) at once. The flow solution (df_particle, df_flowline) is prepared once;
+    the removal parameters are calculated as (nr_substances, nr_particles) arrays, see
+    Transport.compute_omp_removal, without copying the flow solution per substance.
+
+    Attributes
+    ----------
+    well: object
+        The AnalyticalWell or ModPathWell object (with df_particle and df_flowline).
+    substances: list
+        The Substance objects, the substance names must be unique.
+    df_particle: pandas.DataFrame
+        The flow solution shared by all substances: the df_particle of the well with the
+        input concentration and the point source flowlines, see Transport.compute_omp_removal.
+    df_flowline: pandas.DataFrame
+        The df_flowline of the well with the input concentration and the point source flowlines.
+    df_particle_omp: pandas.DataFrame
+        Substance dependent columns of df_particle, indexed by ('substance', flowline_id),
+        in the order of the records in df_particle for each substance:
+        'omp_half_life', 'log_Koc', 'pKa', 'Koc_temperature_correction',
+        'omp_half_life_temperature_corrected', 'retardation', 'steady_state_concentration',
+        'breakthrough_travel_time' and 'input_concentration' (only if the input concentration
+        depends on the substance, i.e. for degradation prior to infiltration).
+    df_flowline_omp: pandas.DataFrame
+        Columns 'total_breakthrough_travel_time' and 'breakthrough_concentration',
+        indexed by ('substance', flowline_id).
+    """
+
+    def __init__(self,
+                well: AnalyticalWell or ModPathWell,
+                substances: list or None = None,
+                substance_chunksize: int = 64):
+        '''
+        Initialization of the TransportBatch class.
+
+        Parameters
+        ----------
+        well: object
+            The AnalyticalWell or ModPathWell object for the schematisation of the aquifer type.
+        substances: list
+            Substance objects or substance names (str). Default (None): all substances
+            of the substance_database of the Substance class.
+        substance_chunksize: int
+            Number of substances calculated at once (limits the size of the
+            (nr_substances, nr_particles) arrays).
+        '''
+
+        if substances is None:
+            substances = list(Substance(substance_name = None).substance_database.keys())
+        self.substances = [Substance(substance_name = iSubstance) if isinstance(iSubstance, str) else iSubstance
+                            for iSubstance in substances]
+        if len(self.substances) == 0:
+            raise ValueError('Error, no substances given.')
+        for iSubstance in self.substances:
+            if not isinstance(iSubstance, Substance):
+                raise TypeError(f'Error, {iSubstance} is not a Substance (or substance name).')
+        self.substance_names = [iSubstance.substance_name for iSubstance in self.substances]
+        if len(set(self.substance_names)) != len(self.substance_names):
+            raise ValueError('Error, the substance names should be unique.')
+
+        self.well = well
+        self.substance_chunksize = substance_chunksize
+
+        # Prepare the flow solution once (Transport does not modify the well)
+        transport = Transport(well, pollutant = self.substances[0])
+        transport._add_input_concentration()
+        transport.df_flowline['particle_release_day'] = transport.particle_release_day
+        self.df_particle = transport.df_particle
+        self.df_flowline = transport.df_flowline
+
+    def _calculate_omp_chunk(self, substances):
+        ''' Return the substance dependent columns of df_particle (dict of
+        (nr_substances, nr_particles) arrays) for the list of 'substances',
+        using the equations of Transport.compute_omp_removal. '''
+
+        schematisation = self.well.schematisation
+        df_particle = self.df_particle
+
+        # Flow solution (per particle)
+        temp_water = df_particle.temp_water.values.astype('float')
+        pH = df_particle.pH.values.astype('float')
+        porosity = df_particle.porosity.values.astype('float')
+        solid_density = df_particle.solid_density.values.astype('float')
+        fraction_organic_carbon = df_particle.fraction_organic_carbon.values.astype('float')
+        dissolved_organic_carbon = df_particle.dissolved_organic_carbon.values.astype('float')
+
+        # Substance parameters, shape (nr_substances, 1)
+        log_Koc = np.array([iSubstance.substance_dict['log_Koc'] for iSubstance in substances], dtype = 'float')[:, np.newaxis]
+        pKa = np.array([iSubstance.substance_dict['pKa'] for iSubstance in substances], dtype = 'float')[:, np.newaxis]
+
+        # Half life per redox condition (last value: missing redox, code -1)
+        redox_codes, redox_names = pd.factorize(df_particle['redox'])
+        half_life_redox = np.array([[iSubstance.substance_dict['omp_half_life'].get(iRedox, np.nan) for iRedox in redox_names] + [np.nan]
+                                    for iSubstance in substances], dtype = 'float')
+        omp_half_life = half_life_redox[:, redox_codes]
+
+        Koc_temperature_correction = _Koc_temperature_correction(log_Koc = log_Koc, temp_water = temp_water,
+                                                                 temp_correction_Koc = schematisation.temp_correction_Koc)
+        omp_half_life_temperature_corrected = _omp_half_life_temperature_correction(omp_half_life = omp_half_life, temp_water = temp_water,
+                                                                                    temp_correction_halflife = schematisation.temp_correction_halflife)
+        retardation = np.broadcast_to(_retardation(pH = pH, pKa = pKa, solid_density = solid_density, porosity = porosity,
+                                                   fraction_organic_carbon = fraction_organic_carbon,
+                                                   dissolved_organic_carbon = dissolved_organic_carbon,
+                                                   Koc_temperature_correction = Koc_temperature_correction,
+                                                   biodegradation_sorbed_phase = schematisation.biodegradation_sorbed_phase),
+                                      omp_half_life.shape).astype('float')
+
+        omp = {'omp_half_life': omp_half_life,
+                'log_Koc': np.broadcast_to(log_Koc, omp_half_life.shape),
+                'pKa': np.broadcast_to(pKa, omp_half_life.shape),
+                'Koc_temperature_correction': Koc_temperature_correction,
+                'omp_half_life_temperature_corrected': omp_half_life_temperature_corrected,
+                'retardation': retardation}
+
+        # Degradation prior to infiltration
+        c_in = _input_concentration_infiltration(Koc_temperature_correction = Koc_temperature_correction[:, 0],
+                                                 dissolved_organic_carbon_infiltration_water = schematisation.dissolved_organic_carbon_infiltration_water,
+                                                 total_organic_carbon_infiltration_water = schematisation.total_organic_carbon_infiltration_water)
+        if c_in is not None:
+            input_concentration = np.tile(df_particle['input_concentration'].values.astype('object'), (len(substances), 1))
+            input_concentration[:, (df_particle.zone == 'surface').values] = c_in[:, np.newaxis]
+            omp['input_concentration'] = input_concentration
+
+        # Steady state concentration: cumulative product of the divisors per segment
+        # (flowline), starting at the input concentration
+        steady_state_concentration = df_particle['steady_state_concentration'].values
+        is_start = ~np.equal(steady_state_concentration, None)
+        segment = np.cumsum(is_start) - 1
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+            exponent = (df_particle.travel_time.values.astype('float') * retardation
+                        / omp_half_life_temperature_corrected)
+            divisor = np.where((omp_half_life == 1e99) | np.isnan(omp_half_life_temperature_corrected), 1.,
+                        np.where(exponent > 300, np.inf, 2 ** exponent))
+        divisor[:, is_start] = 1.
+
+        concentration = np.full(divisor.shape, np.nan)
+        if is_start.any():
+            cumulative_divisor = pd.DataFrame(divisor.T).groupby(segment).cumprod(skipna = False).values.T
+            start_concentration = steady_state_concentration[is_start].astype('float')
+            in_segment = segment >= 0
+            concentration[:, in_segment] = (start_concentration[segment[in_segment]]
+                                            / cumulative_divisor[:, in_segment])
+        omp['steady_state_concentration'] = concentration
+
+        omp['breakthrough_travel_time'] = retardation * df_particle.loc[:,"total_travel_time"].values.astype('float')
+
+        return omp
+
+    def compute_omp_removal(self):
+        """
+        Calculates the removal of all substances for each flowline, see
+        Transport.compute_omp_removal. The results are stored (long format) in
+        'df_particle_omp' and 'df_flowline_omp'.
+
+        Returns
+        -------
+        df_flowline_omp: pandas.DataFrame
+            Columns 'total_breakthrough_travel_time' and 'breakthrough_concentration',
+            indexed by ('substance', flowline_id).
+        """
+
+        flowline_id = self.df_particle.index.values
+        nr_particles = len(flowline_id)
+
+        # Records per flowline (in the order of df_particle)
+        particle_store = ParticleStore.from_df_particle(self.df_particle, columns = [])
+        # Position in df_particle of the last record of each flowline
+        last = particle_store.df_position()[particle_store.offsets[1:] - 1]
+        # Position of the flowlines of df_flowline in the store (-1: no records, missing value)
+        flowline_index = pd.Index(particle_store.flowline_id).get_indexer(self.df_flowline.index)
+
+        df_particle_omp = []
+        df_flowline_omp = []
+        for iStart in range(0, len(self.substances), self.substance_chunksize):
+            substances = self.substances[iStart:iStart + self.substance_chunksize]
+            omp = self._calculate_omp_chunk(substances)
+
+            # Sum of the breakthrough travel time per flowline, adding the records in order
+            total_breakthrough_travel_time = particle_store.sum(
+                                        values = particle_store.to_store_order(omp['breakthrough_travel_time']))
+
+            names = np.repeat(self.substance_names[iStart:iStart + self.substance_chunksize], nr_particles)
+            df_particle_omp.append(pd.DataFrame({iColumn: np.ravel(iValues) for iColumn, iValues in omp.items()},
+                                        index = pd.MultiIndex.from_arrays([names, np.tile(flowline_id, len(substances))],
+                                                                        names = ['substance', 'flowline_id'])))
+            # Per flowline of df_flowline (missing values for flowlines without records)
+            total_breakthrough_travel_time = np.append(total_breakthrough_travel_time,
+                                                    np.full((len(substances), 1), np.nan), axis = 1)[:, flowline_index]
+            breakthrough_concentration = np.append(omp['steady_state_concentration'][:, last],
+                                                    np.full((len(substances), 1), np.nan), axis = 1)[:, flowline_index]
+
+            names = np.repeat(self.substance_names[iStart:iStart + self.substance_chunksize], len(self.df_flowline))
+            df_flowline_omp.append(pd.DataFrame({'total_breakthrough_travel_time': np.ravel(total_breakthrough_travel_time),
+                                        'breakthrough_concentration': np.ravel(breakthrough_concentration)},
+                                        index = pd.MultiIndex.from_arrays([names, np.tile(self.df_flowline.index.values, len(substances))],
+                                                                        names = ['substance', 'flowline_id'])))
+
+        self.df_particle_omp = pd.concat(df_particle_omp)
+        self.df_flowline_omp = pd.concat(df_flowline_omp)
+
+        return self.df_flowline_omp
+
+
+class MicrobialTransportBatch():
+    """ Compute the advective removal of many microbial organisms (mbo) for the same flow
+    solution (well) at once. The organism independent part of the calculation (porewater
+    velocity, distance between the nodes) is done once; the removal parameters are calculated
+    as (nr_organisms, nr_particles) arrays, see Transport.calc_advective_microbial_removal,
+    without copying the flow solution per organism.
+
+    Attributes
+    ----------
+    well: object
+        The AnalyticalWell or ModPathWell object (with df_particle and df_flowline).
+    organisms: list
+        The MicrobialOrganism objects, the organism names must be unique.
+    df_particle: pandas.DataFrame
+        The flow solution shared by all organisms: the df_particle of the well with the
+        (organism independent) columns of Transport.calc_advective_microbial_removal, e.g.
+        'relative_distance' and 'porewater_velocity'.
+    df_flowline: pandas.DataFrame
+        The df_flowline of the well with the (organism independent) columns
+        'input_concentration', 'input_concentration_gw', 'breakthrough_travel_time',
+        'total_breakthrough_travel_time' and 'particle_release_day'.
+    df_particle_mbo: pandas.DataFrame
+        Organism dependent columns of df_particle, indexed by ('organism', flowline_id),
+        in the order of the records in df_particle for each organism:
+        'mu1', 'alpha0', 'pH0', 'alpha', 'k_att', 'lamda' and 'steady_state_concentration'.
+        'lamda' uses the 'mu1' argument of compute_microbial_removal, not the 'mu1' column.
+    df_flowline_mbo: pandas.DataFrame
+        Columns 'organism_diam', 'breakthrough_concentration' and 'concentration_in_well',
+        indexed by ('organism', flowline_id).
+    df_organism: pandas.DataFrame
+        Columns 'organism_diam', 'concentration_in_well' and 'log_removal' per organism
+        for the endpoint_id of the calculation.
+    """
+
+    def __init__(self,
+                well: AnalyticalWell or ModPathWell,
+                organisms: list or None = None,
+                organism_chunksize: int = 64):
+        '''
+        Initialization of the MicrobialTransportBatch class.
+
+        Parameters
+        ----------
+        well: object
+            The AnalyticalWell or ModPathWell object for the schematisation of the aquifer type.
+        organisms: list
+            MicrobialOrganism objects or organism names (str). Default (None): all organisms
+            of the micro_organism_database of the MicrobialOrganism class.
+        organism_chunksize: int
+            Number of organisms calculated at once (limits the size of the
+            (nr_organisms, nr_particles) arrays).
+        '''
+
+        if organisms is None:
+            organisms = list(MicrobialOrganism(organism_name = None).micro_organism_database.keys())
+        self.organisms = [MicrobialOrganism(organism_name = iOrganism) if isinstance(iOrganism, str) else iOrganism
+                            for iOrganism in organisms]
+        if len(self.organisms) == 0:
+            raise ValueError('Error, no organisms given.')
+        for iOrganism in self.organisms:
+            if not isinstance(iOrganism, MicrobialOrganism):
+                raise TypeError(f'Error, {iOrganism} is not a MicrobialOrganism (or organism name).')
+        self.organism_names = [iOrganism.organism_name for iOrganism in self.organisms]
+        if len(set(self.organism_names)) != len(self.organism_names):
+            raise ValueError('Error, the organism names should be unique.')
+
+        self.well = well
+        self.organism_chunksize = organism_chunksize
+
+        # Flow solution shared by all organisms (Transport does not modify the well). Each call of
+        # compute_microbial_removal fills a copy, with the default values of that call
+        self._transport = Transport(well, pollutant = self.organisms[0])
+        self._df_particle_well = self._transport.df_particle
+        self._df_flowline_well = self._transport.df_flowline
+        self.df_particle = self._df_particle_well
+        self.df_flowline = self._df_flowline_well
+
+    def _calculate_mbo_chunk(self, organisms, redox_codes, redox_names,
+                            mu1, alpha0, pH0, organism_diam):
+        ''' Return the organism dependent columns of df_particle (dict of
+        (nr_organisms, nr_particles) arrays) and the organism diameters for the
+        list of 'organisms', using the equations of Transport.calc_lambda. '''
+
+        # Boltzmann coefficient [J K-1]
+        const_BM = 1.38e-23
+        df_particle = self.df_particle
+
+        mbo = {}
+        for iParameter, iDefault in (('mu1', mu1), ('alpha0', alpha0), ('pH0', pH0)):
+            # Parameter per redox condition (last value: missing redox, code -1)
+            parameter_redox = np.array([[iOrganism.organism_dict[iParameter].get(iRedox, np.nan) for iRedox in redox_names] + [np.nan]
+                                        for iOrganism in organisms], dtype = 'float')
+            parameter = parameter_redox[:, redox_codes]
+            # Default value if the parameter is missing for all records (see Transport._df_fillna)
+            parameter[np.isnan(parameter).all(axis = 1)] = iDefault
+            mbo[iParameter] = parameter
+
+        # Pathogen diameter per organism, missing for records without flowline in df_flowline
+        organism_diam_ = np.array([iOrganism.organism_dict['organism_diam'] for iOrganism in organisms], dtype = 'float')
+        organism_diam_[np.isnan(organism_diam_)] = organism_diam
+        in_flowline = np.isin(df_particle.index.values, self.df_flowline.index.values)
+        organism_diam_particle = np.where(in_flowline, organism_diam_[:, np.newaxis], np.nan)
+
+        # Node arrays
+        porosity = df_particle["porosity"].values
+        grainsize_ = df_particle["grainsize"].values
+        temp_water_ = df_particle["temp_water"].values
+        v_por = df_particle["porewater_velocity"].values
+
+        # Calculate 'sticky coefficient' alpha [-]
+        alpha = mbo["alpha0"] * 0.9**((df_particle["pH"].values - mbo["pH0"])/0.1)
+        mbo["alpha"] = alpha
+
+        # Collision term 'k_coll'
+        k_coll = (3/2.)*((1-porosity) / grainsize_) * alpha
+        # Porosity dependent variable 'gamma'
+        gamma = (1-porosity)**(1/3)
+        # Happel’s porosity dependent parameter 'A_s' (Eq. 5: BTO2012.015)
+        As_happ = 2 * (1-gamma**5) / \
+                (2 - 3 * gamma + 3 * gamma**5 - 2 * gamma**6)
+        # Dynamic viscosity (mu) [kg m-1 s-1]
+        mu = (df_particle["rho_water"].values * 497.e-6) / \
+                    (temp_water_ + 42.5)**(3/2)
+
+        # Diffusion constant 'D_BM' (Eq.6: BTO2012.015) --> unit: m2 d-1
+        D_BM = (const_BM * (temp_water_ + 273.)) / \
+                    (3 * np.pi * organism_diam_particle * mu)
+        D_BM *= 86400.
+
+        # Diffusion related attachment term 'k_diff'
+        k_diff = ((D_BM /
+                    (grainsize_ * porosity * v_por))**(2/3) * 
+                        v_por)
+
+        # 'attachment coefficient' k_att [/dag]
+        mbo["k_att"] = k_coll * 4 * As_happ**(1/3) * k_diff
+        # removal coefficient 'lamda' [/day], using the 'mu1' mean (see Transport.calc_lambda):
+        # the 'mu1' argument, not the mu1 of the organism
+        mbo["lamda"] = mbo["k_att"] + mu1
+
+        return mbo, organism_diam_
+
+    def compute_microbial_removal(self,
+                                endpoint_id: str = "well1", trackingdirection = "forward",
+                                grainsize = 0.00025,
+                                temp_water = 11., rho_water = 999.703,
+                                redox = 'anoxic', por_eff = 0.33,
+                                pH = 7.5,
+                                organism_diam = 2.33e-8,
+                                mu1 = 0.023, alpha0 = 1.E-5, pH0 = 6.8,
+                                conc_start = 1., conc_gw = 0.):
+        """
+        Calculates the advective removal of all organisms along the pathlines to endpoint_id,
+        see Transport.calc_advective_microbial_removal for the parameters (default values
+        in case of missing values in df_particle or df_flowline). The default values only
+        apply to this call. The results are stored (long format) in 'df_particle_mbo' and
+        'df_flowline_mbo'.
+
+        Note: as in Transport.calc_lambda, the removal coefficient 'lamda' uses the
+        inactivation rate 'mu1' (argument) for all organisms, it is not organism-specific.
+        The mu1 of each organism (per redox condition) is only reported in df_particle_mbo.
+
+        Returns
+        -------
+        df_organism: pandas.DataFrame
+            Indexed by organism name.
+            Column 'organism_diam': float
+                organism/species diameter [m]
+            Column 'concentration_in_well': float
+                Steady-state concentration in well for endpoint_id [N/L]
+            Column 'log_removal': float
+                Log10 removal of the (flow-weighted) input concentration in the well [-]
+        """
+        if trackingdirection not in ['forward', 'backward']:
+            raise ValueError(f"trackingdirection should be 'forward' or 'backward', not '{trackingdirection}'")
+
+        # Fill a (shallow) copy of the flow solution: the default values only apply to this call
+        transport = self._transport
+        transport.df_particle = self._df_particle_well.copy(deep = False)
+        transport.df_flowline = self._df_flowline_well.copy(deep = False)
+        # Redox condition per record, prior to filling the missing values (see Transport._init_micro_organism)
+        redox_codes, redox_names = pd.factorize(transport.df_particle['redox'])
+
+        # Organism independent parameters (see Transport.calc_lambda)
+        for iColumn, iValue, iDtype in (('temp_water', temp_water, 'float'), ('rho_water', rho_water, 'float'),
+                                        ('porosity', por_eff, 'float'), ('grainsize', grainsize, 'float'),
+                                        ('pH', pH, 'float'), ('redox', redox, 'object')):
+            transport.df_particle = transport._df_fillna(transport.df_particle, df_column = iColumn,
+                                                        value = iValue, dtype_ = iDtype)
+        transport.df_particle = transport._calculate_porewater_velocity(transport.df_particle)
+        for iColumn, iValue in (('input_concentration', conc_start), ('input_concentration_gw', conc_gw)):
+            transport.df_flowline = transport._df_fillna(transport.df_flowline, df_column = iColumn,
+                                                        value = iValue, dtype_ = 'float')
+        self.df_particle = transport.df_particle
+        self.df_flowline = transport.df_flowline
+        df_particle = self.df_particle
+        df_flowline = self.df_flowline
+
+        flowline_id = df_particle.index.values
+        # Flowline parameters for each node (df_particle is indexed by flowline_id)
+        input_concentration = df_flowline["input_concentration"].reindex(df_particle.index).values
+        input_concentration_gw = df_flowline["input_concentration_gw"].reindex(df_particle.index).values
+        is_endpoint = (df_flowline["endpoint_id"] == endpoint_id).values
+        flowline_discharge = df_flowline["flowline_discharge"].values.astype('float')
+        well_discharge = df_flowline["well_discharge"].values.astype('float')
+        # Flow-weighted input concentration at endpoint_id
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            C_input = ((df_flowline["input_concentration"].values * flowline_discharge) / well_discharge)[is_endpoint].sum()
+
+        # Position in df_particle of the breakthrough (endpoint) record and the last record of each
+        # flowline of df_flowline (last position: flowlines without records)
+        particle_store = ParticleStore.from_df_particle(df_particle, columns = [])
+        flowline_index = pd.Index(particle_store.flowline_id).get_indexer(df_flowline.index)
+        position_first = np.append(particle_store.df_position()[particle_store.offsets[:-1]], len(flowline_id))
+        position_last = np.append(particle_store.df_position()[particle_store.offsets[1:] - 1], len(flowline_id))
+        position_breakthrough = (position_last if trackingdirection == 'forward' else position_first)[flowline_index]
+        position_last = position_last[flowline_index]
+
+        # Traveltime from contamination to endpoint location [days] (no retardation with mbo removal)
+        time_breakthrough = df_particle.groupby(level = 0, sort = False).tail(1)["total_travel_time"]. \
+                                reindex(df_flowline.index)
+        df_flowline['breakthrough_travel_time'] = time_breakthrough.where(is_endpoint)
+        df_particle['retardation'] = 1.
+        df_particle['breakthrough_travel_time'] = df_particle["retardation"].values * df_particle["total_travel_time"].values
+        # Sum of the breakthrough travel time per flowline, adding the records in order
+        # (see Transport._calculate_total_breakthrough_travel_time)
+        total_breakthrough_travel_time = particle_store.sum(
+                                    values = particle_store.to_store_order(df_particle['breakthrough_travel_time'].values))
+        df_flowline['total_breakthrough_travel_time'] = np.append(total_breakthrough_travel_time, np.nan)[flowline_index]
+        transport._contamination_date_vs_well_abstraction()
+        df_flowline['particle_release_day'] = transport.particle_release_day
+
+        df_particle_mbo = []
+        df_flowline_mbo = []
+        df_organism = []
+        for iStart in range(0, len(self.organisms), self.organism_chunksize):
+            organisms = self.organisms[iStart:iStart + self.organism_chunksize]
+            names = self.organism_names[iStart:iStart + self.organism_chunksize]
+            mbo, organism_diam_ = self._calculate_mbo_chunk(organisms, redox_codes, redox_names,
+                                                            mu1 = mu1, alpha0 = alpha0, pH0 = pH0,
+                                                            organism_diam = organism_diam)
+
+            # Relative removal along the pathlines
+            exp_arg = -((mbo["lamda"] / df_particle["porewater_velocity"].values) *
+                                df_particle['relative_distance'].values).astype('float')
+            conc_rel = input_concentration_gw + \
+                            (input_concentration - input_concentration_gw) * np.exp(exp_arg)
+
+            # Segmented cumulative product of the relative removal per flowline
+            if trackingdirection == 'forward':
+                conc_steady = pd.DataFrame((conc_rel/input_concentration).T).groupby(flowline_id, sort = False). \
+                                        cumprod(skipna = False).values.T * input_concentration
+            else:
+                conc_steady = pd.DataFrame((conc_rel/input_concentration)[:, ::-1].T).groupby(flowline_id[::-1], sort = False). \
+                                        cumprod(skipna = False).values.T[:, ::-1] * input_concentration
+            conc_steady = np.nan_to_num(conc_steady)
+            mbo['steady_state_concentration'] = conc_steady
+
+            # Breakthrough concentration per flowline of df_flowline (missing: flowlines without records)
+            conc_steady = np.append(conc_steady, np.full((len(organisms), 1), np.nan), axis = 1)
+            C_breakthrough = conc_steady[:, position_breakthrough]
+
+            # Average final concentration: flow-weighted sum of the breakthrough concentrations at endpoint_id
+            with np.errstate(divide = 'ignore', invalid = 'ignore'):
+                C_contribution = pd.DataFrame(((C_breakthrough * flowline_discharge) / well_discharge).T)
+                C_final = C_contribution.groupby(df_flowline["endpoint_id"].values).sum()
+                C_final = C_final.loc[endpoint_id].values if endpoint_id in C_final.index else np.zeros(len(organisms))
+                log_removal = np.log10(C_input / C_final)
+
+            names_particle = np.repeat(names, len(flowline_id))
+            df_particle_mbo.append(pd.DataFrame({iColumn: np.ravel(iValues) for iColumn, iValues in mbo.items()},
+                                        index = pd.MultiIndex.from_arrays([names_particle, np.tile(flowline_id, len(organisms))],
+                                                                        names = ['organism', 'flowline_id'])))
+            # Breakthrough concentration of the last record of each flowline (see
+            # Transport._calculate_total_breakthrough_travel_time)
+            names_flowline = np.repeat(names, len(df_flowline))
+            df_flowline_mbo.append(pd.DataFrame({'organism_diam': np.repeat(organism_diam_, len(df_flowline)),
+                                        'breakthrough_concentration': np.ravel(conc_steady[:, position_last]),
+                                        'concentration_in_well': np.ravel(np.where(is_endpoint, C_final[:, np.newaxis], np.nan))},
+                                        index = pd.MultiIndex.from_arrays([names_flowline, np.tile(df_flowline.index.values, len(organisms))],
+                                                                        names = ['organism', 'flowline_id'])))
+            df_organism.append(pd.DataFrame({'organism_diam': organism_diam_,
+                                        'concentration_in_well': C_final,
+                                        'log_removal': log_removal},
+                                        index = pd.Index(names, name = 'organism')))
+
+        self.df_particle_mbo = pd.concat(df_particle_mbo)
+        self.df_flowline_mbo = pd.concat(df_flowline_mbo)
+        self.df_organism = pd.concat(df_organism)
+
+        return self.df_organism
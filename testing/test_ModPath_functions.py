@@ -9,6 +9,7 @@ import os
 import ast  # abstract syntax trees
 import sys
 import copy
+import time
 # path = os.getcwd()  # path of working directory
 from pathlib import Path
 
@@ -24,6 +25,8 @@ import sutra2.Analytical_Well as AW
 import sutra2.ModPath_Well as mpw
 import sutra2.Transport_Removal as TR
 
+import flopy
+
 from pandas._testing import assert_frame_equal
 
 # get directory of this file
@@ -1103,6 +1106,671 @@ def test_phreatic_scheme_withgravelpack_dictinput(organism_name = "MS2"):
 
 #%%
 
+def test_modpath_output_file_pathline_endpoint(tmp_path):
+    ''' Compare the memory-mapped MODPATH 7 output reader with flopy. '''
+
+    fpath_pathline = str(tmp_path / "mp7_output_test.mppth")
+    fpath_endpoint = str(tmp_path / "mp7_output_test.mpend")
+
+    # Small pathline file: 3 particles (the second particle has no records passing node 5)
+    with open(fpath_pathline, "w") as pth_file:
+        pth_file.write("MODPATH_PATHLINE_FILE         7         0\n")
+        pth_file.write("         1   0.000000000000E+00   0.000000000000E+00   0.000000000000E+00\n")
+        pth_file.write("END HEADER\n")
+        for seq, nodes in enumerate([[5, 4, 3], [9, 8], [7, 5, 5, 1]]):
+            pth_file.write(f"{seq + 1:10d}{1:10d}{seq + 1:10d}{len(nodes):10d}\n")
+            for idx, node in enumerate(nodes):
+                pth_file.write(f"{node:10d}{10. - idx:18.9E}{0.5:18.9E}{-1.5 * idx:18.9E}{12.5 * idx:18.9E}"
+                               f"{0.5:18.9E}{0.5:18.9E}{0.5:18.9E}{1:10d}{1:10d}{1:10d}\n")
+
+    with open(fpath_endpoint, "w") as end_file:
+        end_file.write("MODPATH_ENDPOINT_FILE         7         0\n")
+        end_file.write("         1         1   0.000000000000E+00   0.000000000000E+00\n")
+        end_file.write("END HEADER\n")
+        for seq in range(3):
+            end_file.write(f"{seq + 1:10d}{1:10d}{seq + 1:10d}{2:10d}{0.:18.9E}{25.:18.9E}{5:10d}{1:10d}"
+                           + f"{0.5:18.9E}" * 6 + f"{1:10d}{0:10d}{1:10d}{1:10d}" + f"{0.5:18.9E}" * 6 + f"{1:10d}{0:10d}\n")
+
+    pth_flopy = flopy.utils.PathlineFile(fpath_pathline)
+    with mpw.ModPathOutputFile(fpath_pathline, chunksize = 64) as pth_mmap:
+        assert pth_mmap.output_type == "pathline"
+        assert list(pth_mmap.particle_ids) == [0, 1, 2]
+        assert list(pth_mmap.counts) == [3, 2, 4]
+        # particles passing (zero-based) node 4
+        pth_data = pth_mmap.get_destination_data([4], batchsize = 2)
+        pth_data_flopy = pth_flopy.get_destination_pathline_data([4], to_recarray = True)
+        assert np.array_equal(np.asarray(pth_data), np.asarray(pth_data_flopy))
+        assert sorted(set(pth_data.particleid)) == [0, 2]
+        assert np.array_equal(np.asarray(pth_mmap.get_data(1)[["x","y","z","time","k","particleid"]]),
+                            np.asarray(pth_flopy.get_data(1)))
+
+    # read_pathlinedata: records of the particles passing node 4, read in batches of 1 particle
+    pth_data, particle_ids, particle_start = mpw.ModPathWell.read_pathlinedata(fpath_pathline, nodes = [4],
+                                                                               batchsize = 1)[:3]
+    assert pth_data.dtype.names == ("particleid", "node", "x", "y", "z", "time")
+    for iField in pth_data.dtype.names:
+        assert np.array_equal(pth_data[iField], pth_data_flopy[iField])
+    assert list(particle_ids) == [0, 2] and list(particle_start) == [0, 3]
+
+    end_flopy = flopy.utils.EndpointFile(fpath_endpoint)
+    with mpw.ModPathOutputFile(fpath_endpoint) as end_mmap:
+        assert end_mmap.output_type == "endpoint"
+        assert np.array_equal(np.asarray(end_mmap.get_alldata()), np.asarray(end_flopy.get_alldata()))
+
+#%%
+
+def _modpath_grid(tmp_path, schematisation_type = "semiconfined"):
+    ''' ModPathWell with model grid and parameter grids (modflow/modpath not run). '''
+
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type = schematisation_type,
+                                                    well_discharge = -7500., recharge_rate = 0.0008,
+                                                    thickness_shallow_aquifer = 8., thickness_target_aquifer = 30.)
+    schematisation.make_dictionary()
+    modpath = mpw.ModPathWell(schematisation, workspace = str(tmp_path), modelname = schematisation_type)
+    modpath.run_model(run_mfmodel = False, run_mpmodel = False)
+
+    return modpath
+
+def _xyz_to_layrowcol_loop(modpath, xyz_point, decimals = 3):
+    ''' Former (per point) lay, row, col index of xyz_point [x,y,z]. '''
+
+    xyz_point = [np.round(iVal,decimals) for iVal in xyz_point]
+    bounds = {"x": (np.round(np.array([modpath.xmid[0] - 0.5 * modpath.delr[0]] + list(modpath.xmid[:-1] + 0.5 * modpath.delr[:-1])), decimals),
+                    np.round(modpath.xmid + 0.5 * modpath.delr, decimals)),
+              "y": (np.round(modpath.ymid - 0.5 * modpath.delc, decimals),
+                    np.round(np.array([modpath.ymid[0] + 0.5 * modpath.delc[0]] + list(modpath.ymid[:-1] - 0.5 * modpath.delc[:-1])), decimals)),
+              "z": (np.round(modpath.zmid - 0.5 * modpath.delv, decimals),
+                    np.round(np.array([modpath.zmid[0] + 0.5 * modpath.delv[0]] + list(modpath.zmid[:-1] - 0.5 * modpath.delv[:-1])), decimals))}
+    node_idx = []
+    for iAxis, iDim in zip([2,1,0],["z","y","x"]):
+        min_arr, max_arr = bounds[iDim]
+        try:
+            node_idx.append(np.argwhere((xyz_point[iAxis] > min_arr) & (xyz_point[iAxis] <= max_arr))[0][0])
+        except IndexError:
+            node_idx.append(np.argwhere((xyz_point[iAxis] >= min_arr) & (xyz_point[iAxis] <= max_arr))[0][0])
+
+    return tuple(node_idx)
+
+def test_modpath_xyz_to_node_indices(tmp_path):
+    ''' xyz_to_node_indices equals the former per point search, for cell centers,
+    cell edges and random points (also after a change of the grid). '''
+
+    modpath = _modpath_grid(tmp_path)
+    rng = np.random.default_rng(0)
+
+    for iGrid in range(2):
+        # Cell centers and edges (upper and lower cell boundaries)
+        x_values = np.concatenate([modpath.xmid, modpath.xmid - 0.5 * modpath.delr, modpath.xmid + 0.5 * modpath.delr])
+        z_values = np.concatenate([modpath.zmid, modpath.zmid - 0.5 * modpath.delv, modpath.zmid + 0.5 * modpath.delv])
+        # (axisymmetric model: y-coordinates within the first row)
+        y_values = modpath.ymid[0] + np.array([-0.5, 0., 0.5]) * modpath.delc[0]
+        xyz = np.column_stack([rng.choice(x_values, 500), rng.choice(y_values, 500), rng.choice(z_values, 500)])
+        # Random points within the grid
+        xyz = np.concatenate([xyz, np.column_stack([rng.uniform(x_values.min(), x_values.max(), 500),
+                                                    rng.uniform(y_values.min(), y_values.max(), 500),
+                                                    rng.uniform(z_values.min(), z_values.max(), 500)])])
+
+        for decimals in [3, 5]:
+            node_lay, node_row, node_col = modpath.xyz_to_node_indices(xyz = xyz, decimals = decimals)
+            node_idx_loop = np.array([_xyz_to_layrowcol_loop(modpath, iPoint, decimals = decimals) for iPoint in xyz])
+            assert np.array_equal(np.column_stack([node_lay, node_row, node_col]), node_idx_loop)
+
+        # Shifted grid (the cached cell boundaries are recomputed)
+        modpath.xmid = modpath.xmid + 1.5
+        modpath.zmid = modpath.zmid - 0.25
+
+    with pytest.raises(IndexError):
+        modpath.xyz_to_node_indices(xyz = [[modpath.xmid[-1] + modpath.delr[-1], modpath.ymid[0], modpath.zmid[0]]])
+
+def _write_pathline_file(fpath, particles, nodes):
+    ''' Write a MODPATH 7 pathline file with the records [x,y,z,time] of
+    'particles' (list of np.array) in (zero-based) cell 'nodes' (list of np.array). '''
+
+    with open(fpath, "w") as pth_file:
+        pth_file.write("MODPATH_PATHLINE_FILE         7         0\n")
+        pth_file.write("         1   0.000000000000E+00   0.000000000000E+00   0.000000000000E+00\n")
+        pth_file.write("END HEADER\n")
+        for seq, (records, records_node) in enumerate(zip(particles, nodes)):
+            pth_file.write(f"{seq + 1:10d}{1:10d}{seq + 1:10d}{len(records):10d}\n")
+            for (x, y, z, time), node in zip(records, records_node):
+                pth_file.write(f"{node + 1:10d}{x:18.9E}{y:18.9E}{z:18.9E}{time:18.9E}"
+                               f"{0.5:18.9E}{0.5:18.9E}{0.5:18.9E}{1:10d}{1:10d}{1:10d}\n")
+
+def test_modpath_fill_df_particle_properties(tmp_path):
+    ''' fill_df_particle: the material properties per pathline record equal
+    the grid values at the (former per point) lay, row, col index. '''
+
+    modpath = _modpath_grid(tmp_path)
+    rng = np.random.default_rng(1)
+
+    # Particles of 5 records at cell centers and edges (first row)
+    x_values = np.concatenate([modpath.xmid, modpath.xmid + 0.5 * modpath.delr])
+    z_values = np.concatenate([modpath.zmid, modpath.zmid - 0.5 * modpath.delv])
+    particles, nodes = [], []
+    for iPart in range(4):
+        records = np.column_stack([rng.choice(x_values, 5), np.full(5, modpath.ymid[0]),
+                                   rng.choice(z_values, 5), np.arange(5) * 10. + iPart]).round(4)
+        particles.append(records)
+        nodes.append(modpath.get_node_ID([_xyz_to_layrowcol_loop(modpath, iRecord[:3]) for iRecord in records]))
+    fpath_pathline = str(tmp_path / "fill_df_particle.mppth")
+    _write_pathline_file(fpath_pathline, particles, nodes)
+
+    # Particle groups released at the first record of the particles (particle 1 and 3 in group 'pg2')
+    pg_nodes = {"pg1": [_xyz_to_layrowcol_loop(modpath, particles[iPart][0,:3]) for iPart in [0, 2]],
+                "pg2": [_xyz_to_layrowcol_loop(modpath, particles[iPart][0,:3]) for iPart in [1, 3]]}
+    parm_list = ["prsity_uncorr","solid_density","grainsize","fraction_organic_carbon",
+                "redox","dissolved_organic_carbon", "pH","temp_water","material"]
+    df_particle, df_particle_data = modpath.fill_df_particle(particle_group = ["pg1","pg2"], pg_nodes = pg_nodes,
+                                                             parm_list = parm_list, mppth = fpath_pathline)
+
+    assert len(df_particle) == 20
+    assert list(df_particle.index.unique()) == [0, 2, 1, 3]
+    assert sorted(df_particle_data) == ["pg1", "pg2"]
+    assert list(df_particle_data["pg1"].index.unique()) == [0, 2]
+
+    # Grid values at the (former) lay, row, col index of each record (first row in axisymmetric model)
+    node_idx = [_xyz_to_layrowcol_loop(modpath, iRecord) for iRecord in df_particle[["xcoord","ycoord","zcoord"]].values]
+    colnames = {"prsity_uncorr": "porosity", "material": "zone"}
+    for iParm in parm_list:
+        parm_values = np.array([np.asarray(getattr(modpath, iParm))[iLay,0,iCol] for iLay, iRow, iCol in node_idx])
+        df_values = np.asarray(df_particle[colnames.get(iParm, iParm)], dtype = parm_values.dtype)
+        assert np.array_equal(df_values, parm_values), iParm
+
+def _write_cbc_file(fpath, flux_arrays):
+    ''' Write a (single precision) MODFLOW cell budget file with the face flows
+    'flux_arrays' {"FLOW RIGHT FACE": frf, "FLOW FRONT FACE": fff, "FLOW LOWER FACE": flf}. '''
+
+    header_dtype = [("kstp","<i4"),("kper","<i4"),("text","S16"),("ncol","<i4"),("nrow","<i4"),("nlay","<i4")]
+    with open(fpath, "wb") as cbc_file:
+        for iText, iFlux in flux_arrays.items():
+            nlay, nrow, ncol = iFlux.shape
+            np.array([(1, 1, iText.rjust(16).encode(), ncol, nrow, nlay)], dtype = header_dtype).tofile(cbc_file)
+            np.asarray(iFlux, dtype = "<f4").tofile(cbc_file)
+
+def _fill_df_flowline_loop(modpath, df_particle, frf, flf, fff):
+    ''' Former (per flowline) flowline discharge and endpoint assignment of fill_df_flowline. '''
+
+    flowline_id = list(df_particle.index.unique())
+    df_flowline = pd.DataFrame(index = flowline_id, columns = ["flowline_type","flowline_discharge","particle_release_day","endpoint_id",
+                                                               "well_discharge", "substance", "removal_function","input_concentration"])
+    df_flowline.index.name = "flowline_id"
+    df_flowline.loc[:,"removal_function"] = modpath.schematisation.removal_function
+    material = np.asarray(modpath.material)
+
+    node_start, node_end, count_startpoints, count_endpoints = {}, {}, {}, {}
+    for fid in flowline_id:
+        xyzt_data = df_particle.loc[df_particle.index == fid,["xcoord","ycoord","zcoord","total_travel_time"]].sort_values(by = "total_travel_time")
+        startpoint = xyzt_data.loc[xyzt_data.total_travel_time == xyzt_data.total_travel_time.min(),
+                                    ["xcoord","ycoord","zcoord"]].values.tolist()[0]
+        endpoint = xyzt_data.loc[xyzt_data.total_travel_time == xyzt_data.total_travel_time.max(),
+                                    ["xcoord","ycoord","zcoord"]].values.tolist()[0]
+        node_start[fid] = _xyz_to_layrowcol_loop(modpath, startpoint, decimals = 5)
+        node_end[fid] = _xyz_to_layrowcol_loop(modpath, endpoint, decimals = 5)
+        count_startpoints[node_start[fid]] = count_startpoints.get(node_start[fid],0) + 1
+        count_endpoints[node_end[fid]] = count_endpoints.get(node_end[fid],0) + 1
+        df_flowline.loc[fid,"flowline_type"] = modpath.flowline_type[fid]
+        df_flowline.loc[fid,"input_concentration"] = modpath.inputconc_particle[fid]
+
+    for fid in flowline_id:
+        if df_flowline.loc[fid,"flowline_type"] == "point_source":
+            df_flowline.loc[fid,"flowline_discharge"] = modpath.point_discharge[fid]
+        elif modpath.trackingdirection == "forward":
+            df_flowline.loc[fid,"flowline_discharge"] = round(modpath.calc_flux_cell(frf,flf,fff, loc = node_start[fid]) / \
+                                                              count_startpoints[node_start[fid]],4)
+        else:
+            df_flowline.loc[fid,"flowline_discharge"] = round(modpath.calc_flux_cell(frf,flf,fff, loc = node_end[fid]) / \
+                                                              count_endpoints[node_end[fid]],4)
+        df_flowline.loc[fid,"endpoint_id"] = material[node_end[fid]]
+
+    for end_id in df_flowline["endpoint_id"].unique():
+        is_endpoint = (material == end_id) & (modpath.ibound != 0)
+        df_flowline.loc[df_flowline.endpoint_id == end_id,"well_discharge"] = round(abs(frf[is_endpoint]).sum() + \
+                                                                                    abs(flf[is_endpoint]).sum() + \
+                                                                                    abs(fff[is_endpoint]).sum(), 4)
+
+    return df_flowline
+
+def test_modpath_fill_df_flowline_discharge(tmp_path):
+    ''' fill_df_flowline on a synthetic cell budget file equals the former
+    per flowline discharge and endpoint assignment (forward and backward). '''
+
+    modpath = _modpath_grid(tmp_path)
+    rng = np.random.default_rng(2)
+
+    # Random face flows (zero in inactive cells)
+    flux_arrays = {iText: np.where(modpath.ibound != 0, rng.normal(0., 50., modpath.ibound.shape), 0.).astype("<f4") \
+                    for iText in ["FLOW RIGHT FACE", "FLOW FRONT FACE", "FLOW LOWER FACE"]}
+    fpath_cbc = str(tmp_path / "fill_df_flowline.cbc")
+    _write_cbc_file(fpath_cbc, flux_arrays)
+    frf, flf, fff = modpath.read_binarycbc_flow(fpath_cbc)
+
+    # Flowlines of 4 records, sharing start and end cells (last flowline ends in the well)
+    x_values = np.concatenate([modpath.xmid[:5], modpath.xmid[:5] + 0.5 * modpath.delr[:5]])
+    z_values = np.concatenate([modpath.zmid[-5:], modpath.zmid[-5:] - 0.5 * modpath.delv[-5:]])
+    well_x, well_z = modpath.xmid[0], modpath.zmid[np.argmax(np.asarray(modpath.material)[:,0,0] == "well1")]
+    records = []
+    for fid in range(12):
+        xz = np.column_stack([rng.choice(x_values, 4), rng.choice(z_values, 4)])
+        if fid == 11:
+            xz[-1] = [well_x, well_z]
+        records.append(pd.DataFrame({"xcoord": xz[:,0], "ycoord": 0.5, "zcoord": xz[:,1],
+                                     "total_travel_time": rng.permutation(4) * 10. + fid},
+                                     index = pd.Index([fid] * 4, name = "flowline_id")))
+    df_particle = pd.concat(records)
+
+    modpath.flowline_type = {fid: "point_source" if fid in [3, 7] else "diffuse_source" for fid in range(12)}
+    modpath.inputconc_particle = {fid: 10. * fid for fid in range(12)}
+    modpath.point_discharge = {3: 2.5, 7: 5.}
+    for trackingdirection in ["forward", "backward"]:
+        modpath.trackingdirection = trackingdirection
+        df_flowline = modpath.fill_df_flowline(df_particle = df_particle, model_cbc = fpath_cbc)
+        assert_frame_equal(df_flowline, _fill_df_flowline_loop(modpath, df_particle, frf, flf, fff))
+    assert "well1" in set(df_flowline["endpoint_id"])
+
+    modpath.trackingdirection = "sideways"
+    with pytest.raises(ValueError):
+        modpath.fill_df_flowline(df_particle = df_particle, model_cbc = fpath_cbc)
+
+def test_modpath_flux_field(tmp_path):
+    ''' calc_flux_field equals calc_flux_cell (and the in- and outflow per
+    cell face) for all cells; get_flux_field is recalculated once the cell
+    budget file changes. '''
+
+    modpath = _modpath_grid(tmp_path)
+    rng = np.random.default_rng(3)
+    grid_shape = (4, 3, 5)
+    frf, flf, fff = [rng.normal(0., 50., grid_shape) for iFlux in range(3)]
+
+    flux_field = modpath.calc_flux_field(frf,flf,fff)
+    inflow_total, outflow_total = np.zeros(grid_shape), np.zeros(grid_shape)
+    for loc in np.ndindex(grid_shape):
+        assert flux_field["flux_total"][loc] == modpath.calc_flux_cell(frf,flf,fff, loc = loc)
+        iLay, iRow, iCol = loc
+        # Flow through the cell faces (positive: inflow)
+        face_flows = [-frf[loc], -fff[loc], -flf[loc]]
+        if iCol > 0:
+            face_flows.append(frf[iLay,iRow,iCol-1])
+        if iRow > 0:
+            face_flows.append(fff[iLay,iRow-1,iCol])
+        if iLay > 0:
+            face_flows.append(flf[iLay-1,iRow,iCol])
+        inflow_total[loc] = sum(max(0., iFlow) for iFlow in face_flows)
+        outflow_total[loc] = sum(max(0., -iFlow) for iFlow in face_flows)
+    assert np.allclose(flux_field["inflow_total"], inflow_total, rtol = 1e-12, atol = 0.)
+    assert np.allclose(flux_field["outflow_total"], outflow_total, rtol = 1e-12, atol = 0.)
+
+    # Cached flux field of the cell budget file
+    fpath_cbc = str(tmp_path / "flux_field.cbc")
+    _write_cbc_file(fpath_cbc, {"FLOW RIGHT FACE": frf, "FLOW FRONT FACE": fff, "FLOW LOWER FACE": flf})
+    flux_field = modpath.get_flux_field(fpath_cbc)
+    assert modpath.get_flux_field(fpath_cbc) is flux_field
+    assert np.array_equal(flux_field["frf"], frf.astype("<f4"))
+    _write_cbc_file(fpath_cbc, {"FLOW RIGHT FACE": -frf, "FLOW FRONT FACE": fff, "FLOW LOWER FACE": flf, "CONSTANT HEAD": frf})
+    assert np.array_equal(modpath.get_flux_field(fpath_cbc)["frf"], -frf.astype("<f4"))
+
+def _water_table_loop(modpath):
+    ''' Former (per column) groundwater level of _create_diffuse_particles. '''
+
+    gw_level = np.zeros((modpath.nrow,modpath.ncol), dtype = 'float') + modpath.top
+    for iRow in range(modpath.nrow):
+        for iCol in range(modpath.ncol):
+            for iLay in range(modpath.nlay):
+                # Uppermost active and wetted cell
+                if (modpath.ibound[iLay,iRow,iCol] == 0) or \
+                        (abs(modpath.head_mf[iLay,iRow,iCol]) > 0.9 * abs(modpath.head_dry)):
+                    continue
+                top_cell = modpath.top if iLay == 0 else modpath.bot[iLay-1]
+                if (modpath.laytyp[iLay] == 0) or (modpath.head_mf[iLay,iRow,iCol] < modpath.bot[iLay]) or \
+                        (modpath.head_mf[iLay,iRow,iCol] > top_cell):
+                    gw_level[iRow,iCol] = top_cell
+                else:
+                    gw_level[iRow,iCol] = modpath.head_mf[iLay,iRow,iCol]
+                break
+
+    return gw_level
+
+def test_modpath_water_table_release(tmp_path):
+    ''' get_water_table and the release locations of the diffuse particles
+    equal the former per column (and per cell) loops. '''
+
+    modpath = _modpath_grid(tmp_path, schematisation_type = "phreatic")
+    rng = np.random.default_rng(4)
+
+    # Confined and unconfined layers, random heads with dry and inactive cells
+    modpath.laytyp = rng.integers(0, 2, modpath.nlay)
+    modpath.laytyp[:5] = 1
+    modpath.head_dry = -1.e30
+    # (heads below, within and above the cell)
+    cell_bot = modpath.bot[:,np.newaxis,np.newaxis]
+    cell_top = np.append(modpath.top, modpath.bot[:-1])[:,np.newaxis,np.newaxis]
+    modpath.head_mf = cell_bot + rng.uniform(-0.5, 1.5, modpath.ibound.shape) * (cell_top - cell_bot)
+    modpath.head_mf[rng.random(modpath.ibound.shape) < 0.3] = modpath.head_dry
+    modpath.head_mf[:,:,-1] = modpath.head_dry
+    modpath.ibound = np.where(rng.random(modpath.ibound.shape) < 0.1, 0, modpath.ibound)
+
+    gw_level = _water_table_loop(modpath)
+    assert np.array_equal(modpath.get_water_table(), gw_level)
+
+    # Particles released at the groundwater level (active cells between xmin and xmax)
+    modpath._create_diffuse_particles(recharge_parameters = "recharge_parameters")
+    recharge_parameters = modpath.schematisation_dict["recharge_parameters"]["source1"]
+    release_cols = np.flatnonzero((modpath.xmid + 0.5 * modpath.delr >= recharge_parameters["xmin"]) & \
+                                  (modpath.xmid - 0.5 * modpath.delr <= recharge_parameters["xmax"]))
+    part_locs, localz = [], []
+    for iCol in range(release_cols[0], release_cols[-1] + 1):
+        iLay = _xyz_to_layrowcol_loop(modpath, (modpath.xmid[iCol], modpath.ymid[0], gw_level[0,iCol]), decimals = 5)[0]
+        if modpath.ibound[iLay,0,iCol] == 0:
+            continue
+        top_cell = modpath.top if iLay == 0 else modpath.bot[iLay-1]
+        part_locs.append((iLay,0,iCol))
+        localz.append((gw_level[0,iCol] - modpath.bot[iLay]) / (top_cell - modpath.bot[iLay]))
+    assert modpath.part_locs["source1"] == part_locs
+    assert modpath.pg_nodes["source1"] == part_locs
+    assert np.array_equal(modpath.localz["source1"], localz)
+    assert modpath.pids["source1"] == list(range(len(part_locs)))
+
+def _fill_grid_loop(modpath, dict_keys, parameter, grid):
+    ''' Former fill_grid: rasterize each region of 'parameter' (no cache). '''
+
+    for iDict in dict_keys:
+        for iDict_sub in modpath.schematisation_dict[iDict]:
+            if parameter in modpath.schematisation_dict[iDict][iDict_sub]:
+                layidx_min,layidx_max,rowidx_min,rowidx_max,colidx_min,colidx_max = \
+                    modpath._rasterize_region(modpath.schematisation_dict, dict_key = iDict, dict_subkey = iDict_sub)
+                if not None in [layidx_min,layidx_max,colidx_min,colidx_max]:
+                    grid[layidx_min: layidx_max, rowidx_min: rowidx_max, colidx_min: colidx_max] = \
+                        modpath.schematisation_dict[iDict][iDict_sub][parameter]
+                if modpath.model_type in ["axisymmetric","2D"]:
+                    grid[:,1,:] = grid[:,0,:]
+
+    return grid
+
+def test_modpath_cell_bounds_region_cache(tmp_path):
+    ''' cell_bounds returns the (cached) index slab of _rasterize_region, once per region;
+    fill_grid equals the former per region and parameter rasterization. '''
+
+    modpath = _modpath_grid(tmp_path)
+
+    parameters = dict(modpath.geoparm_names)
+    parameters.update({"ibound": [["ibound_parameters"],"int",1], "head": [["ibound_parameters"],"float",0.]})
+    for iParm, (dict_keys, dtype, value) in parameters.items():
+        unitgrid = np.full((modpath.nlay,modpath.nrow,modpath.ncol), value, dtype = dtype)
+        grid = modpath.fill_grid(schematisation = modpath.schematisation_dict, dict_keys = dict_keys,
+                                 parameter = iParm, grid = unitgrid.copy(), dtype = dtype)
+        assert np.array_equal(grid, _fill_grid_loop(modpath, dict_keys, iParm, unitgrid.copy())), iParm
+
+    # One index slab per region (with the same boundaries)
+    regions = [(iDict, iDict_sub) for iDict in ["geo_parameters", "ibound_parameters", "well_parameters"] \
+                    for iDict_sub in modpath.schematisation_dict[iDict]]
+    nr_slabs = len(modpath._region_slabs)
+    for iDict, iDict_sub in regions:
+        assert modpath.cell_bounds(modpath.schematisation_dict, dict_key = iDict, dict_subkey = iDict_sub) == \
+            modpath._rasterize_region(modpath.schematisation_dict, dict_key = iDict, dict_subkey = iDict_sub)
+    assert len(modpath._region_slabs) == nr_slabs <= len(regions)
+
+    # New index slabs after a change of the grid
+    modpath.zmid = modpath.zmid - 0.5 * modpath.delv
+    for iDict, iDict_sub in regions:
+        assert modpath.cell_bounds(modpath.schematisation_dict, dict_key = iDict, dict_subkey = iDict_sub) == \
+            modpath._rasterize_region(modpath.schematisation_dict, dict_key = iDict, dict_subkey = iDict_sub)
+    assert len(modpath._region_slabs) == 2 * nr_slabs
+
+def test_modpath_axisym_correction_center_points(tmp_path):
+    ''' axisym_correction and the cell center points of _assign_cellboundaries
+    equal the former per column and per cell loops. '''
+
+    modpath = _modpath_grid(tmp_path)
+    grid = np.random.default_rng(5).uniform(1., 50., (modpath.nlay,modpath.nrow,modpath.ncol))
+
+    grid_axi = np.zeros((modpath.nlay,modpath.nrow,modpath.ncol))
+    for iCol in range(modpath.ncol):
+        grid_axi[:,:,iCol] = 2 * np.pi * modpath.xmid[iCol] * grid[:,:,iCol]
+    assert np.array_equal(modpath.axisym_correction(grid = grid), grid_axi)
+
+    for bound_min, bound_max, n_refinement, ascending in [("xmin","xmax","ncols",True), ("bot","top","nlayers",False)]:
+        len_arr, cell_sizes, center_points, bound_list = modpath._assign_cellboundaries(modpath.schematisation_dict,
+                                                                 dict_keys = ["geo_parameters"], bound_min = bound_min,
+                                                                 bound_max = bound_max, n_refinement = n_refinement,
+                                                                 ascending = ascending)
+        sign = 1. if ascending else -1.
+        center_points_loop = [bound_list[0] + sign * cell_sizes[0] * 0.5]
+        for idx in range(1, len_arr):
+            center_points_loop.append(center_points_loop[-1] + sign * ((cell_sizes[idx] + cell_sizes[idx - 1]) * 0.5))
+        assert center_points.dtype == 'float'
+        assert np.array_equal(center_points, center_points_loop)
+
+#%%
+
+def test_modpath_material_grid_codes(tmp_path):
+    ''' Material grid stored as integer codes: 'material' decodes the codes (read-only). '''
+
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type = "semiconfined",
+                                                    well_discharge = -7500., recharge_rate = 0.0008,
+                                                    thickness_shallow_aquifer = 8., thickness_target_aquifer = 30.)
+    schematisation.make_dictionary()
+    modpath = mpw.ModPathWell(schematisation, workspace = str(tmp_path), modelname = "semiconfined")
+    modpath.run_model(run_mfmodel = False, run_mpmodel = False)
+
+    assert modpath.material.shape == modpath.material_codes.shape
+    assert np.array_equal(modpath.material, modpath.get_category_grid("material"))
+    assert {"shallow_aquifer", "target_aquifer", "well1"} <= set(modpath.material.ravel())
+    assert modpath.get_category_codes(["target_aquifer"]) == \
+        [list(modpath.material_table).index("target_aquifer")]
+    with pytest.raises(AttributeError):
+        modpath.material = modpath.material
+
+    # Redox grid (integer codes, "anoxic" outside the geo_parameters materials)
+    assert np.array_equal(modpath.redox, modpath.get_category_grid("redox"))
+    assert (modpath.redox[modpath.material == "well1"] == "anoxic").all()
+    with pytest.raises(AttributeError):
+        modpath.redox = modpath.redox
+
+
+def test_modpath_vadose_zone_records_categorical(tmp_path):
+    ''' The vadose zone records (phreatic) are added to df_particle with the same
+    (Categorical) dtype of 'redox' and 'zone' as the modpath records. '''
+
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type = "phreatic",
+                                                    well_discharge = -7500., recharge_rate = 0.0008,
+                                                    ground_surface = 22., thickness_vadose_zone_at_boundary = 5.,
+                                                    thickness_shallow_aquifer = 10., thickness_target_aquifer = 40.,
+                                                    hor_permeability_target_aquifer = 35.)
+    schematisation.make_dictionary()
+    modpath = mpw.ModPathWell(schematisation, workspace = str(tmp_path), modelname = "phreatic")
+    modpath.run_model(run_mfmodel = False, run_mpmodel = False)
+
+    # Modpath records of two flowlines
+    modpath.df_particle = pd.DataFrame({"xcoord": [10., 5., 100., 50.], "ycoord": 0.5, "zcoord": [16., 0., 16., 0.],
+                                        "total_travel_time": [0., 100., 0., 500.], "porosity": 0.3,
+                                        "solid_density": 2.65, "fraction_organic_carbon": 0.001,
+                                        "redox": pd.Categorical(["anoxic"] * 4), "dissolved_organic_carbon": 1.,
+                                        "pH": 7., "temp_water": 11., "grainsize": 0.00025,
+                                        "zone": pd.Categorical(["shallow_aquifer", "well1"] * 2)},
+                                        index = pd.Index([1, 1, 2, 2], name = "flowline_id"))
+    modpath.calc_traveltime_vadose_analytical(vadose_parameters = modpath.schematisation_dict["vadose_parameters"])
+
+    assert len(modpath.df_particle) == 6
+    for iColumn in ["redox", "zone"]:
+        assert isinstance(modpath.df_particle[iColumn].dtype, pd.CategoricalDtype)
+    assert list(modpath.df_particle["zone"]) == ["vadose_zone", "shallow_aquifer", "well1"] * 2
+    assert list(modpath.df_particle["redox"]) == [modpath.schematisation_dict["vadose_parameters"]["vadose_zone"]["redox"],
+                                                  "anoxic", "anoxic"] * 2
+
+#%%
+
+def test_modpath_sweep_runs_and_workspaces(tmp_path):
+    ''' Parameter sweep: one result row per run and no remaining workspaces (modflow/modpath not run). '''
+
+    sweep = mpw.ModPathWellSweep.from_grid({"well_discharge": [-5000., -7500.], "recharge_rate": [0.0008, 0.001]},
+                                           schematisation_kwargs = {"schematisation_type": "semiconfined",
+                                                                    "ground_surface": 22.0,
+                                                                    "thickness_vadose_zone_at_boundary": 5.0,
+                                                                    "thickness_shallow_aquifer": 10.0,
+                                                                    "thickness_target_aquifer": 40.0,
+                                                                    "hor_permeability_target_aquifer": 35.0},
+                                           workspace = str(tmp_path), max_workers = 2,
+                                           mf_exe = mf_exe, mp_exe = mp_exe)
+    sweep.run(run_mfmodel = False, run_mpmodel = False)
+
+    assert list(sweep.results.index) == list(sweep.runs.index) == [0, 1, 2, 3]
+    assert sweep.results["error"].isnull().all()
+    assert os.listdir(tmp_path) == []
+
+def _stub_sweep_job(run_id, schematisation, workspace, modelname, model_kwargs, run_kwargs, conn):
+    ''' Stub of a sweep job: 'schematisation' is the runtime [s] or the action of the run. '''
+    if hasattr(os, "setsid"):
+        os.setsid()
+    if schematisation == "crash":
+        # Process ends without sending results
+        os._exit(1)
+    time.sleep(schematisation)
+    index = pd.Index([0, 1], name = "flowline_id")
+    conn.send({"run_id": run_id, "workspace": workspace, "success_mf": True, "success_mp": True,
+               "error": None, "runtime": schematisation, "stdout": "",
+               "df_flowline": pd.DataFrame({"flowline_discharge": [run_id, 2. * run_id]}, index = index),
+               "df_particle": pd.DataFrame({"total_travel_time": [10. * run_id, 20. * run_id]}, index = index)})
+    conn.close()
+
+def test_modpath_sweep_errors_timeout_and_results(tmp_path, monkeypatch):
+    ''' Parameter sweep: failing, crashing and timed out runs are reported per run_id,
+    the results of the other runs are combined in tables indexed by ('run_id', flowline_id). '''
+
+    # Exception raised in the run (invalid schematisation)
+    sweep = mpw.ModPathWellSweep({"invalid": {}}, workspace = str(tmp_path), mf_exe = mf_exe, mp_exe = mp_exe)
+    sweep.run(run_mfmodel = False, run_mpmodel = False)
+    assert sweep.results.loc["invalid", "error"] is not None
+    assert not sweep.results.loc["invalid", ["success_mf", "success_mp"]].any()
+    assert len(sweep.df_flowline) == 0 and sweep.df_flowline.index.names == ["run_id", "flowline_id"]
+
+    monkeypatch.setattr(mpw, "_run_sweep_job", _stub_sweep_job)
+    sweep = mpw.ModPathWellSweep({1: 0., 2: 0., 3: "crash", 4: 60.}, workspace = str(tmp_path),
+                                 max_workers = 4, timeout = 2.)
+    start_time = time.time()
+    sweep.run()
+    # The run exceeding the timeout is stopped
+    assert time.time() - start_time < 30.
+    assert list(sweep.results.index) == [1, 2, 3, 4]
+    assert list(sweep.results["error"]) == [None, None, "process ended unexpectedly", "timeout"]
+
+    assert sweep.df_flowline.index.names == sweep.df_particle.index.names == ["run_id", "flowline_id"]
+    assert list(sweep.df_flowline.index) == [(1, 0), (1, 1), (2, 0), (2, 1)]
+    assert list(sweep.df_flowline["flowline_discharge"]) == [1., 2., 2., 4.]
+    assert_frame_equal(sweep.df_particle.loc[2],
+                       pd.DataFrame({"total_travel_time": [20., 40.]}, index = pd.Index([0, 1], name = "flowline_id")))
+    assert os.listdir(tmp_path) == []
+
+#%%
+
+def test_modpath_run_cache_restore_and_evict(tmp_path, monkeypatch):
+    ''' Cache of model runs: restore files/results under a new modelname and remove least recently used entries. '''
+
+    # The cache stores the results as arrow files (pyarrow is required)
+    with monkeypatch.context() as patch:
+        patch.setattr(mpw, "pa", None)
+        with pytest.raises(ImportError):
+            mpw.ModPathRunCache(cache_dir = str(tmp_path / "cache"))
+    pytest.importorskip("pyarrow")
+
+    cache = mpw.ModPathRunCache(cache_dir = str(tmp_path / "cache"), max_size = 10**6)
+    schematisation_dict = {"geo_parameters": {"layer1": {"top": 0., "bot": np.float64(-10.)}}}
+    run_options = {"perlen": 365.*50, "trackingdirection": "forward"}
+    key = cache.key(schematisation_dict, mf_exe = mf_exe, mp_exe = mp_exe, run_options = run_options)
+    assert key == cache.key(copy.deepcopy(schematisation_dict), mf_exe = mf_exe, mp_exe = mp_exe, run_options = run_options)
+    assert key != cache.key(schematisation_dict, mf_exe = mf_exe, mp_exe = mp_exe,
+                            run_options = {**run_options, "trackingdirection": "backward"})
+
+    workspace = tmp_path / "ws1"
+    workspace.mkdir()
+    (workspace / "model1.hds").write_bytes(b"heads")
+    (workspace / "model1_mp.mppth").write_bytes(b"pathlines")
+    df_flowline = pd.DataFrame({"flowline_discharge": [1., 2.], "endpoint_id": ["well1", "well1"]},
+                               index = pd.Index([0, 1], name = "flowline_id"))
+    df_particle = pd.DataFrame({"total_travel_time": [0., 10.], "redox": pd.Categorical(["anoxic", "suboxic"])})
+    head_mf = np.linspace(0., 1., 6).reshape((3, 1, 2))
+    assert cache.get(key, workspace = str(tmp_path / "ws2"), modelname = "model2") is None
+    cache.put(key, workspace = str(workspace), modelname = "model1",
+              results = {"success_mf": True, "head_mf": head_mf, "df_flowline": df_flowline, "df_particle": df_particle})
+
+    results = cache.get(key, workspace = str(tmp_path / "ws2"), modelname = "model2")
+    assert results["success_mf"] is True
+    assert np.array_equal(results["head_mf"], head_mf)
+    assert_frame_equal(results["df_flowline"], df_flowline)
+    assert_frame_equal(results["df_particle"], df_particle)
+    assert (tmp_path / "ws2" / "model2_mp.mppth").read_bytes() == b"pathlines"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Entry (partly) removed by a concurrent run: miss
+    os.remove(os.path.join(cache.cache_dir, key, "model_mp.mppth"))
+    assert cache.get(key, workspace = str(tmp_path / "ws3"), modelname = "model3") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.evict(max_size = 0)
+    assert cache.get(key, workspace = str(tmp_path / "ws2"), modelname = "model2") is None
+
+    # The keys of the grid boundaries in the schematisation (bound_* options of ModPathWell) change the model
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type = "semiconfined",
+                                                    well_discharge = -7500., recharge_rate = 0.0008,
+                                                    thickness_shallow_aquifer = 8., thickness_target_aquifer = 30.)
+    schematisation.make_dictionary()
+    run_options = {"xll": 0., "yll": 0., "perlen": 365.*50, "nstp": 1, "nper": 1, "steady": True}
+    cache_keys = [mpw.ModPathWell(schematisation, workspace = str(tmp_path / "ws4"), modelname = "model4",
+                                  cache = cache, **iBounds)._cache_key(**run_options)
+                  for iBounds in [{}, {}, {"bound_top": "bot", "bound_bot": "top"}]]
+    assert (cache_keys[0] == cache_keys[1]) and (cache_keys[0] != cache_keys[2])
+
+#%%
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_write_read_results(tmp_path, file_format):
+    ''' Export (import) of df_flowline, df_particle and the run metadata in a binary format:
+    index, dtypes and values are kept. '''
+    pytest.importorskip("pyarrow")
+
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type = "semiconfined",
+                                                    well_discharge = -7500., recharge_rate = 0.0008,
+                                                    thickness_shallow_aquifer = 8., thickness_target_aquifer = 30.)
+    well = AW.AnalyticalWell(schematisation)
+    well.semiconfined()
+    df_particle = well.df_particle.astype({"redox": "category"})
+
+    fnames = mpw.write_results(well.df_flowline, df_particle, dstroot = str(tmp_path), name = "semiconfined",
+                               file_format = file_format, metadata = {"schematisation_type": "semiconfined",
+                                                                      "perlen": {0: np.float64(18250.)}})
+    assert os.path.basename(fnames["df_particle"]) == "semiconfined_df_particle." + file_format
+
+    df_flowline, df_particle_read, metadata = mpw.read_results(str(tmp_path), "semiconfined", file_format = file_format)
+    # object columns with numbers (e.g. 'flowline_discharge') are read as float columns
+    assert_frame_equal(df_flowline, well.df_flowline, check_dtype = False)
+    assert df_flowline["flowline_discharge"].dtype == "float64"
+    assert_frame_equal(df_particle_read, df_particle)
+    assert metadata == {"schematisation_type": "semiconfined", "perlen": {"0": 18250.}}
+
+    _, df_particle_read, _ = mpw.read_results(str(tmp_path), "semiconfined", file_format = file_format,
+                                              columns = ["total_travel_time", "redox"])
+    assert_frame_equal(df_particle_read, df_particle[["total_travel_time", "redox"]])
+
+def test_save_results_csv_without_pyarrow(tmp_path, monkeypatch):
+    ''' Without pyarrow the results of a model run are saved as csv files (with a warning). '''
+
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type = "semiconfined",
+                                                    well_discharge = -7500., recharge_rate = 0.0008,
+                                                    thickness_shallow_aquifer = 8., thickness_target_aquifer = 30.)
+    well = AW.AnalyticalWell(schematisation)
+    well.semiconfined()
+    schematisation.make_dictionary()
+    modpath = mpw.ModPathWell(schematisation, workspace = str(tmp_path), modelname = "semiconfined")
+    modpath.run_model(run_mfmodel = False, run_mpmodel = False)
+    modpath.df_flowline, modpath.df_particle = well.df_flowline, well.df_particle
+
+    monkeypatch.setattr(mpw, "pa", None)
+    with pytest.warns(UserWarning, match = "saved as csv files"):
+        modpath._save_results()
+    df_particle = pd.read_csv(os.path.join(modpath.dstroot, "semiconfined_df_particle.csv"), index_col = 0)
+    assert len(df_particle) == len(well.df_particle)
+    assert not os.path.exists(os.path.join(modpath.dstroot, "semiconfined_df_particle.parquet"))
+
+#%%
+
 def test_travel_time_distribution_phreatic_analytical_plus_modpath(organism_name = "MS2"):
     ''' Compare AnalyticalWell.py and ModpathWell.py travel times distribution.'''
 
@@ -7,6 +7,7 @@ from pandas import read_csv
 import pandas as pd
 import os
 import sys
+import copy
 
 # path = os.getcwd()  # path of working directory
 from pathlib import Path
@@ -239,6 +240,40 @@ def test_steady_concentration_temp_koc_correction_phreatic(pollutant='benzene'):
 
 # %%
 
+def test_steady_concentration_nan_travel_time():
+    """ A missing (NaN) travel time in the middle of a flowline gives a missing steady state
+    concentration for the rest of that flowline, the other flowlines are not affected """
+
+    def phreatic_well():
+        schematisation = AW.HydroChemicalSchematisation(schematisation_type='phreatic',
+                                                    well_discharge=-7500., recharge_rate=0.0008,
+                                                    ground_surface=22., thickness_vadose_zone_at_boundary=5.,
+                                                    thickness_shallow_aquifer=10., thickness_target_aquifer=40.,
+                                                    hor_permeability_target_aquifer=35.,
+                                                    diffuse_input_concentration=100)
+        well = AW.AnalyticalWell(schematisation)
+        well.phreatic()
+        return well
+
+    reference = TR.Transport(phreatic_well(), pollutant = TR.Substance(substance_name = 'benzene'))
+    reference.compute_omp_removal()
+
+    well = phreatic_well()
+    flowline_id = well.df_particle.index[0]
+    position = np.flatnonzero(well.df_particle.index == flowline_id)
+    well.df_particle.iloc[position[1], well.df_particle.columns.get_loc('travel_time')] = np.nan
+    transport = TR.Transport(well, pollutant = TR.Substance(substance_name = 'benzene'))
+    transport.compute_omp_removal()
+
+    concentration = transport.df_particle['steady_state_concentration'].values.astype('float')
+    concentration_reference = reference.df_particle['steady_state_concentration'].values.astype('float')
+    assert concentration[position[0]] == concentration_reference[position[0]]
+    assert np.isnan(concentration[position[1]:position[-1] + 1]).all()
+    other = np.ones(len(concentration), dtype = bool)
+    other[position] = False
+    assert np.array_equal(concentration[other], concentration_reference[other])
+
+
 def test_travel_time_distribution_semiconfined():
     """ Compares the calculated travel times (total, unsaturated zone, shallow aquifer and target aquifer) 
     against a known case from TRANSATOMIC excel """
@@ -596,6 +631,45 @@ def test_phreatic_diffuse_only_source():
     assert_frame_equal(df_well_concentration, df_well_concentration_test, check_dtype=False,
                         rtol = rtol, atol = atol)
 
+#%%
+def test_concentration_in_well_at_date_frequency():
+    ''' Tests the well concentration for non-daily output dates ('freq'): equal to the daily
+    concentration at the same dates and to the sum over the flowlines in breakthrough '''
+
+    phreatic_scheme = AW.HydroChemicalSchematisation(schematisation_type='phreatic',
+                                    well_discharge=-319.4*24, #m3/day
+                                    recharge_rate=0.3/365.25, #m/day
+                                    ground_surface=22., thickness_vadose_zone_at_boundary=5.,
+                                    thickness_shallow_aquifer=10., thickness_target_aquifer=40.,
+                                    hor_permeability_target_aquifer=35.,
+                                    diffuse_input_concentration=100, #ug/L
+                                    start_date_well=dt.datetime.strptime('1968-01-01',"%Y-%m-%d"),
+                                    start_date_contamination= dt.datetime.strptime('1966-01-01',"%Y-%m-%d"),
+                                    compute_contamination_for_date=dt.datetime.strptime('2050-01-01',"%Y-%m-%d"),
+                                    end_date_contamination=dt.datetime.strptime('1990-01-01',"%Y-%m-%d"),
+                                    )
+    phreatic_well = AW.AnalyticalWell(phreatic_scheme)
+    phreatic_well.phreatic()
+
+    phreatic_conc = TR.Transport(phreatic_well, pollutant = TR.Substance(substance_name = 'OMP-X'))
+    phreatic_conc.compute_omp_removal()
+    df_daily = phreatic_conc.compute_concentration_in_well_at_date().set_index('date')
+
+    df_flowline = phreatic_conc.df_flowline
+    for freq in ['W', 'MS', '5D']:
+        df_well_concentration = phreatic_conc.compute_concentration_in_well_at_date(freq = freq)
+        assert len(df_well_concentration) < len(df_daily)
+        assert (df_well_concentration['date'] == pd.date_range(df_daily.index[0], df_daily.index[-1], freq = freq)).all()
+        # equal to the daily concentration at the same dates
+        assert np.array_equal(df_well_concentration['total_concentration_in_well'].values,
+                              df_daily.loc[df_well_concentration['date'], 'total_concentration_in_well'].values)
+        # sum of the flowlines in breakthrough at each date
+        for time, total in df_well_concentration[['time', 'total_concentration_in_well']].values[::25]:
+            in_breakthrough = ((df_flowline['total_breakthrough_travel_time'] <= time) &
+                               (df_flowline['end_time_contamination_breakthrough'] >= time))
+            assert np.isclose(total, df_flowline.loc[in_breakthrough, 'concentration_in_well'].sum())
+        assert df_well_concentration["total_concentration_in_well"].max() > 0
+
 #%%
 def test_phreatic_point_only_source():
     ''' Test for phreatic case with only a diffuse source contamination,
@@ -693,6 +767,264 @@ def test_drawdown_lower_than_target_aquifer():
     assert "The drawdown at the well is lower than the bottom of the target aquifer. Please select a different schematisation." in str(exc.value)
 
 
+def test_batch_travel_time_distribution():
+    ''' Compares the travel time distribution of the batch calculation (AnalyticalWellBatch)
+    with the AnalyticalWell calculation of each of the wells '''
+
+    wells = pd.DataFrame({'well_id': ['well_A', 'well_B', 'well_C'],
+                        'well_discharge': [-319.4*24, -5000., -2500.],
+                        'recharge_rate': [0.3/365.25, 0.0008, 0.001],
+                        'hor_permeability_shallow_aquifer': [0.02, 0.05, 0.01],
+                        'hor_permeability_target_aquifer': [35., 20., 10.],
+                        'thickness_vadose_zone_at_boundary': [5., 3., 2.],
+                        'thickness_shallow_aquifer': [10., 8., 12.],
+                        'thickness_target_aquifer': [40., 30., 25.],
+                        'redox_target_aquifer': ['deeply_anoxic', 'anoxic', 'suboxic'],
+                        'ground_surface': [22., 15., 10.],
+                        'temp_water': [11., 10., 12.],
+                        })
+
+    for schematisation_type in ['phreatic', 'semiconfined']:
+        batch = AW.AnalyticalWellBatch(wells, schematisation_type = schematisation_type,
+                                    thickness_full_capillary_fringe = 0.4,
+                                    moisture_content_vadose_zone = 0.15)
+        getattr(batch, schematisation_type)()
+
+        for well_id, parameters in wells.set_index('well_id').iterrows():
+            schematisation = AW.HydroChemicalSchematisation(schematisation_type = schematisation_type,
+                                                        thickness_full_capillary_fringe = 0.4,
+                                                        moisture_content_vadose_zone = 0.15,
+                                                        **parameters.to_dict())
+            well = AW.AnalyticalWell(schematisation)
+            getattr(well, schematisation_type)()
+
+            assert_frame_equal(batch.df_particle.loc[well_id], well.df_particle, check_dtype=False)
+            assert_frame_equal(batch.df_flowline.loc[well_id], well.df_flowline, check_dtype=False)
+
+    # point sources are not computed in the batch calculation
+    with pytest.raises(ValueError):
+        AW.AnalyticalWellBatch(wells.assign(point_input_concentration = [None, 100., None]))
+
+
+def test_transport_batch_omp_removal():
+    ''' Compares the removal of several substances calculated at once (TransportBatch)
+    with the Transport calculation of each substance '''
+
+    def phreatic_well():
+        schematisation = AW.HydroChemicalSchematisation(schematisation_type='phreatic',
+                                                    well_discharge=-7500., recharge_rate=0.0008,
+                                                    ground_surface=22., thickness_vadose_zone_at_boundary=5.,
+                                                    thickness_shallow_aquifer=10., thickness_target_aquifer=40.,
+                                                    hor_permeability_target_aquifer=35.,
+                                                    temp_water=12., redox_vadose_zone='suboxic',
+                                                    point_input_concentration=100.,
+                                                    distance_point_contamination_from_well=25.,
+                                                    depth_point_contamination=21.,
+                                                    discharge_point_contamination=-1000.)
+        well = AW.AnalyticalWell(schematisation)
+        well.phreatic()
+        return well
+
+    def phreatic_well_nan_travel_time():
+        # missing (NaN) travel time in the middle of the first flowline
+        well = phreatic_well()
+        well.df_particle.iloc[1, well.df_particle.columns.get_loc('travel_time')] = np.nan
+        return well
+
+    substances = ['benzene', 'AMPA', TR.Substance(substance_name='OMP-Y', partition_coefficient_water_organic_carbon=2.5)]
+    for create_well in [phreatic_well, phreatic_well_nan_travel_time]:
+        well = create_well()
+        df_particle_well = well.df_particle.copy()
+        batch = TR.TransportBatch(well, substances = substances, substance_chunksize = 2)
+        batch.compute_omp_removal()
+        # the flow solution of the well is not modified
+        assert_frame_equal(well.df_particle, df_particle_well)
+
+        for substance in substances:
+            if isinstance(substance, str):
+                substance = TR.Substance(substance_name = substance)
+            transport = TR.Transport(create_well(), pollutant = substance)
+            transport.compute_omp_removal()
+            df_particle_omp = batch.df_particle_omp.loc[substance.substance_name]
+            assert_frame_equal(df_particle_omp, transport.df_particle.loc[:, df_particle_omp.columns],
+                                check_dtype = False, check_index_type = False, check_names = False)
+            df_flowline_omp = batch.df_flowline_omp.loc[substance.substance_name]
+            assert_frame_equal(df_flowline_omp, transport.df_flowline.loc[:, df_flowline_omp.columns],
+                                check_dtype = False, check_index_type = False, check_names = False)
+
+
+def test_microbial_transport_batch_removal():
+    ''' Compares the advective removal of several microbial organisms calculated at once
+    (MicrobialTransportBatch) with the Transport calculation of each organism '''
+
+    def phreatic_well():
+        schematisation = AW.HydroChemicalSchematisation(schematisation_type='phreatic',
+                                                    well_discharge=-7500., recharge_rate=0.0008,
+                                                    ground_surface=22., thickness_vadose_zone_at_boundary=5.,
+                                                    thickness_shallow_aquifer=10., thickness_target_aquifer=40.,
+                                                    hor_permeability_target_aquifer=35.,
+                                                    temp_water=12., redox_vadose_zone='suboxic')
+        well = AW.AnalyticalWell(schematisation)
+        well.phreatic()
+        return well
+
+    well = phreatic_well()
+    df_particle_well = well.df_particle.copy()
+    organisms = ['solani', 'carotovorum', TR.MicrobialOrganism(organism_name='MBO-Y', alpha0_anoxic=0.2, organism_diam=3.e-6)]
+    batch = TR.MicrobialTransportBatch(well, organisms = organisms, organism_chunksize = 2)
+    df_organism = batch.compute_microbial_removal(endpoint_id = 'well1', mu1 = 0.)
+    # the flow solution of the well is not modified
+    assert_frame_equal(well.df_particle, df_particle_well)
+    assert list(df_organism.index) == ['solani', 'carotovorum', 'MBO-Y']
+
+    for organism in organisms:
+        if isinstance(organism, str):
+            organism = TR.MicrobialOrganism(organism_name = organism)
+        well = phreatic_well()
+        transport = TR.Transport(well, pollutant = organism)
+        df_particle, df_flowline, C_final = transport.calc_advective_microbial_removal(well.df_particle, well.df_flowline,
+                                                                            endpoint_id = 'well1', mu1 = 0.)
+        df_particle_mbo = batch.df_particle_mbo.loc[organism.organism_name]
+        assert_frame_equal(df_particle_mbo, df_particle.loc[:, df_particle_mbo.columns].astype('float'),
+                            check_index_type = False, check_names = False)
+        df_flowline_mbo = batch.df_flowline_mbo.loc[organism.organism_name]
+        assert_frame_equal(df_flowline_mbo, df_flowline.loc[:, df_flowline_mbo.columns].astype('float'),
+                            check_index_type = False, check_names = False)
+        assert df_organism.loc[organism.organism_name, 'concentration_in_well'] == C_final
+
+    # The default values only apply to their own call: a repeated call with other
+    # default values equals the calculation on a new batch
+    batch.compute_microbial_removal(endpoint_id = 'well1', mu1 = 0., grainsize = 0.0005, rho_water = 998.)
+    batch_new = TR.MicrobialTransportBatch(phreatic_well(), organisms = organisms, organism_chunksize = 2)
+    batch_new.compute_microbial_removal(endpoint_id = 'well1', mu1 = 0., grainsize = 0.0005, rho_water = 998.)
+    assert_frame_equal(batch.df_particle_mbo, batch_new.df_particle_mbo)
+    assert_frame_equal(batch.df_organism, batch_new.df_organism)
+
+
+def test_transport_does_not_modify_well():
+    ''' Transport reads the flow solution of the well without modifying it: repeated
+    and subsequent calculations on the same well equal the calculation on a new well '''
+
+    def phreatic_well(schematisation_type = 'phreatic'):
+        schematisation = AW.HydroChemicalSchematisation(schematisation_type=schematisation_type,
+                                                    well_discharge=-7500., recharge_rate=0.0008,
+                                                    ground_surface=22., thickness_vadose_zone_at_boundary=5.,
+                                                    thickness_shallow_aquifer=10., thickness_target_aquifer=40.,
+                                                    hor_permeability_target_aquifer=35.,
+                                                    temp_water=12., redox_vadose_zone='suboxic',
+                                                    point_input_concentration=100.,
+                                                    distance_point_contamination_from_well=25.,
+                                                    depth_point_contamination=21.,
+                                                    discharge_point_contamination=-1000.)
+        well = AW.AnalyticalWell(schematisation)
+        getattr(well, schematisation_type)()
+        return well
+
+    def copy_attributes(obj):
+        # copy of the attributes (arrays, dataframes, values) of the object, except the schematisation
+        return {iName: copy.deepcopy(iValue) for iName, iValue in vars(obj).items() if iName != 'schematisation'}
+
+    def assert_attributes_equal(attributes, obj):
+        assert set(copy_attributes(obj)) == set(attributes)
+        for iName, iValue in attributes.items():
+            if isinstance(iValue, pd.DataFrame):
+                assert_frame_equal(getattr(obj, iName), iValue)
+            else:
+                np.testing.assert_equal(getattr(obj, iName), iValue, err_msg = iName)
+
+    # the point source flowlines are calculated without modifying the well or its schematisation
+    for schematisation_type in ['phreatic', 'semiconfined']:
+        well = phreatic_well(schematisation_type)
+        schematisation = well.schematisation
+        well_attributes = copy_attributes(well)
+        schematisation_attributes = copy_attributes(schematisation)
+        transport = TR.Transport(well, pollutant = TR.Substance(substance_name = 'benzene'))
+        transport.compute_omp_removal()
+        assert (transport.df_flowline.flowline_type == 'point_source').any()
+        assert well.schematisation is schematisation
+        assert_attributes_equal(schematisation_attributes, schematisation)
+        assert_attributes_equal(well_attributes, well)
+
+    well = phreatic_well()
+    df_particle_well = well.df_particle.copy()
+    df_flowline_well = well.df_flowline.copy()
+
+    benzene = TR.Transport(well, pollutant = TR.Substance(substance_name = 'benzene'))
+    benzene.compute_omp_removal()
+    df_particle = benzene.df_particle.copy()
+    # repeated calculation (the point source flowlines are added once)
+    benzene.compute_omp_removal()
+    assert_frame_equal(benzene.df_particle, df_particle)
+
+    organism = TR.Transport(well, pollutant = TR.MicrobialOrganism(organism_name = 'solani'))
+    organism.calc_advective_microbial_removal(well.df_particle, well.df_flowline, mu1 = 0.)
+    assert_frame_equal(well.df_particle, df_particle_well)
+    assert_frame_equal(well.df_flowline, df_flowline_well)
+
+    ampa = TR.Transport(well, pollutant = TR.Substance(substance_name = 'AMPA'))
+    ampa.compute_omp_removal()
+    ampa_new_well = TR.Transport(phreatic_well(), pollutant = TR.Substance(substance_name = 'AMPA'))
+    ampa_new_well.compute_omp_removal()
+    assert_frame_equal(ampa.df_particle, ampa_new_well.df_particle)
+    assert_frame_equal(ampa.df_flowline, ampa_new_well.df_flowline)
+
+
+def test_analytical_cache_snapshot():
+    ''' Repeated well calculations with an equal schematisation (snapshot) are restored from the
+    analytical cache and equal the (uncached) calculation '''
+
+    AW.clear_analytical_cache()
+    parameters = dict(schematisation_type='semiconfined', well_discharge=-5000., recharge_rate=0.0008,
+                      thickness_shallow_aquifer=8., thickness_target_aquifer=30.)
+
+    well = AW.AnalyticalWell(AW.HydroChemicalSchematisation(**parameters))
+    well.semiconfined()
+    # modify the results: the cache holds a copy
+    well.df_particle.loc[:, 'travel_time'] = -1.
+    nr_cached = len(AW._analytical_cache)
+
+    well_cached = AW.AnalyticalWell(AW.HydroChemicalSchematisation(**parameters))
+    assert well_cached.schematisation.snapshot() == well.schematisation.snapshot()
+    well_cached.semiconfined()
+    assert len(AW._analytical_cache) == nr_cached
+
+    well_uncached = AW.AnalyticalWell(AW.HydroChemicalSchematisation(**parameters))
+    well_uncached._calculate_semiconfined()
+    assert_frame_equal(well_cached.df_particle, well_uncached.df_particle)
+    assert_frame_equal(well_cached.df_flowline, well_uncached.df_flowline)
+    assert well_cached.schematisation.spreading_distance == well_uncached.schematisation.spreading_distance
+
+    well_uncached.schematisation.well_discharge = -2500.
+    assert well_uncached.schematisation.snapshot() != well_cached.schematisation.snapshot()
+
+
+def test_analytical_cache_warnings_and_size(monkeypatch):
+    ''' Calculations restored from the analytical cache issue the warnings of the calculation again,
+    the cache holds arrays (no dataframes) and is bounded by its size in bytes '''
+
+    AW.clear_analytical_cache()
+    parameters = dict(schematisation_type='phreatic', well_discharge=-50000., ground_surface=22.0,
+                      thickness_vadose_zone_at_boundary=5.0, thickness_shallow_aquifer=10.0,
+                      thickness_target_aquifer=40.0, hor_permeability_target_aquifer=35.0)
+
+    for iCall in range(2):
+        well = AW.AnalyticalWell(AW.HydroChemicalSchematisation(**parameters))
+        with pytest.warns(UserWarning, match='lower than the bottom of the shallow aquifer'):
+            well.phreatic()
+    assert len(AW._analytical_cache) == 1
+    for values, result, _, _ in AW._analytical_cache.values():
+        for iValue in list(result.values()) + [iValue for iValues in values for iValue in iValues.values()]:
+            assert not isinstance(iValue, pd.DataFrame)
+
+    # Cache size below the size of 2 calculations: only the last calculation is kept
+    monkeypatch.setattr(AW, 'analytical_cache_max_bytes', int(1.5 * AW._analytical_cache_nbytes))
+    for iDischarge in [-1000., -2000., -3000.]:
+        AW.AnalyticalWell(AW.HydroChemicalSchematisation(**{**parameters, 'well_discharge': iDischarge})).phreatic()
+        assert len(AW._analytical_cache) == 1
+        assert AW._analytical_cache_nbytes <= AW.analytical_cache_max_bytes
+    AW.clear_analytical_cache()
+
+
 
 # def test_warning_drawdown_in_target_aquifer():
 #     ''' Tests whether a warning is issued when the head drawdown reaches the target aquifer' '''
@@ -724,3 +1056,39 @@ def test_drawdown_lower_than_target_aquifer():
 #                                       )
 
 #     assert 'The drawdown is lower than the bottom of the shallow aquifer' in str(exc.value)
+
+
+def test_particle_store_segments():
+    ''' Per-flowline operations of the particle store equal the groupby of df_particle,
+    also for records of the flowlines that are not contiguous in df_particle '''
+    from sutra2.Particle_Store import ParticleStore
+
+    schematisation = AW.HydroChemicalSchematisation(schematisation_type='semiconfined',
+                                                well_discharge=-7500., recharge_rate=0.0008,
+                                                thickness_shallow_aquifer=8., thickness_target_aquifer=30.)
+    well = AW.AnalyticalWell(schematisation)
+    well.semiconfined()
+    # shuffle the records (the order of the records per flowline is kept)
+    df_particle = well.df_particle.sample(frac = 1., random_state = 1).sort_values(by = 'zone', kind = 'stable')
+
+    particle_store = ParticleStore.from_df_particle(df_particle)
+    flowline_id = pd.Index(particle_store.flowline_id, name = 'flowline_id')
+    grouped = df_particle.groupby(level = 0, sort = False)
+
+    assert particle_store.nr_particles == len(df_particle)
+    assert_frame_equal(particle_store.to_df_particle(df_order = True), df_particle)
+    assert np.allclose(particle_store.sum('travel_time'), grouped['travel_time'].sum().reindex(flowline_id).values)
+    assert np.array_equal(particle_store.last('zone'), grouped['zone'].last().reindex(flowline_id).values)
+    assert np.array_equal(particle_store.first('xcoord'), grouped['xcoord'].first().reindex(flowline_id).values)
+    diff = particle_store.to_df_order(particle_store.diff('total_travel_time'))
+    assert np.allclose(diff, grouped['total_travel_time'].diff().fillna(0.).values)
+
+    # sum of 2D values (records along the last axis), added in the order of the records
+    values = np.vstack([particle_store.columns['travel_time'], 2. * particle_store.columns['travel_time']])
+    total = particle_store.sum(values = values)
+    assert total.shape == (2, particle_store.nr_flowlines)
+    expected = [sum(particle_store.segment(iFlowline, 'travel_time')) for iFlowline in range(particle_store.nr_flowlines)]
+    assert np.array_equal(total[0], expected)
+    # flowlines without records sum to 0
+    empty_store = ParticleStore(flowline_id = [1, 2, 3], offsets = [0, 2, 2, 3], columns = {'travel_time': [1., np.nan, 4.]})
+    assert np.array_equal(empty_store.sum('travel_time'), [1., 0., 4.])